@@ -17,14 +17,18 @@ from .spec_parser import (
     CircularDependencyError,
     MissingDependencyError,
     parse_tasks,
+    parse_tasks_from_lines,
+    IncrementalSpecParser,
     validate_spec_directory,
     extract_dependencies,
     get_ready_tasks,
     topological_sort,
     load_tasks_from_spec,
+    tasks_result_to_json,
     # New dispatch unit functions
     is_dispatch_unit,
     get_dispatchable_units,
+    TaskIndex,
 )
 
 from .init_orchestration import (
@@ -75,14 +79,18 @@ __all__ = [
     "CircularDependencyError",
     "MissingDependencyError",
     "parse_tasks",
+    "parse_tasks_from_lines",
+    "IncrementalSpecParser",
     "validate_spec_directory",
     "extract_dependencies",
     "get_ready_tasks",
     "topological_sort",
     "load_tasks_from_spec",
+    "tasks_result_to_json",
     # spec_parser - dispatch unit functions
     "is_dispatch_unit",
     "get_dispatchable_units",
+    "TaskIndex",
     # init_orchestration
     "TaskEntry",
     "AgentState",
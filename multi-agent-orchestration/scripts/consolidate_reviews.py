@@ -338,8 +338,8 @@ def consolidate_single_task(
     return report
 
 
-def main():
-    """Command line entry point"""
+def _build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -366,7 +366,39 @@ def main():
         help="Output result as JSON"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _result_payload(result: ConsolidationResult) -> Dict[str, Any]:
+    """Build the --json output for a result"""
+    output = {
+        "success": result.success,
+        "message": result.message,
+        "reports_created": result.reports_created,
+        "task_ids": result.task_ids,
+        "errors": result.errors
+    }
+    return output
+
+
+def run(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Consolidate reviews from command line style arguments and return the --json payload.
+
+    In-process entry point used by orchestration_loop instead of a subprocess.
+    """
+    args = _build_parser().parse_args(argv)
+    result = consolidate_reviews(
+        args.state_file,
+        task_ids=args.task_ids,
+        auto_complete=not args.no_complete
+    )
+    return _result_payload(result)
+
+
+def main():
+    """Command line entry point"""
+    args = _build_parser().parse_args()
     
     result = consolidate_reviews(
         args.state_file,
@@ -375,14 +407,7 @@ def main():
     )
     
     if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "reports_created": result.reports_created,
-            "task_ids": result.task_ids,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(_result_payload(result), indent=2))
     else:
         if result.success:
             print(f"✅ {result.message}")
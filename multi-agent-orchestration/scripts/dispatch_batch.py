@@ -1491,8 +1491,8 @@ def dispatch_batch(
     )
 
 
-def main():
-    """Command line entry point"""
+def _build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -1518,7 +1518,43 @@ def main():
         help="Output result as JSON"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _result_payload(result: DispatchResult) -> Dict[str, Any]:
+    """Build the --json output for a result"""
+    output = {
+        "success": result.success,
+        "message": result.message,
+        "tasks_dispatched": result.tasks_dispatched,
+        "errors": result.errors
+    }
+    if result.execution_report:
+        output["execution_report"] = {
+            "tasks_completed": result.execution_report.tasks_completed,
+            "tasks_failed": result.execution_report.tasks_failed,
+        }
+    return output
+
+
+def run(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Dispatch ready tasks from command line style arguments and return the --json payload.
+
+    In-process entry point used by orchestration_loop instead of a subprocess.
+    """
+    args = _build_parser().parse_args(argv)
+    result = dispatch_batch(
+        args.state_file,
+        workdir=args.workdir,
+        dry_run=args.dry_run
+    )
+    return _result_payload(result)
+
+
+def main():
+    """Command line entry point"""
+    args = _build_parser().parse_args()
     
     result = dispatch_batch(
         args.state_file,
@@ -1527,18 +1563,7 @@ def main():
     )
     
     if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "tasks_dispatched": result.tasks_dispatched,
-            "errors": result.errors
-        }
-        if result.execution_report:
-            output["execution_report"] = {
-                "tasks_completed": result.execution_report.tasks_completed,
-                "tasks_failed": result.execution_report.tasks_failed,
-            }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(_result_payload(result), indent=2))
     else:
         if result.success:
             print(f"✅ {result.message}")
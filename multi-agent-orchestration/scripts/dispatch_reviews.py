@@ -739,8 +739,8 @@ def dispatch_reviews(
     )
 
 
-def main():
-    """Command line entry point"""
+def _build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -771,7 +771,44 @@ def main():
         help="Batch mode: single agent reviews all tasks (reduces API calls)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _result_payload(result: ReviewDispatchResult) -> Dict[str, Any]:
+    """Build the --json output for a result"""
+    output = {
+        "success": result.success,
+        "message": result.message,
+        "reviews_dispatched": result.reviews_dispatched,
+        "errors": result.errors
+    }
+    if result.review_report:
+        output["review_report"] = {
+            "reviews_completed": result.review_report.reviews_completed,
+            "reviews_failed": result.review_report.reviews_failed,
+        }
+    return output
+
+
+def run(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Dispatch reviews from command line style arguments and return the --json payload.
+
+    In-process entry point used by orchestration_loop instead of a subprocess.
+    """
+    args = _build_parser().parse_args(argv)
+    result = dispatch_reviews(
+        args.state_file,
+        workdir=args.workdir,
+        dry_run=args.dry_run,
+        batch=args.batch
+    )
+    return _result_payload(result)
+
+
+def main():
+    """Command line entry point"""
+    args = _build_parser().parse_args()
     
     result = dispatch_reviews(
         args.state_file,
@@ -781,18 +818,7 @@ def main():
     )
     
     if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "reviews_dispatched": result.reviews_dispatched,
-            "errors": result.errors
-        }
-        if result.review_report:
-            output["review_report"] = {
-                "reviews_completed": result.review_report.reviews_completed,
-                "reviews_failed": result.review_report.reviews_failed,
-            }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(_result_payload(result), indent=2))
     else:
         if result.success:
             print(f"✅ {result.message}")
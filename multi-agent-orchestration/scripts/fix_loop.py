@@ -29,6 +29,10 @@ from spec_parser import expand_dependencies, Task
 # Constants
 MAX_FIX_ATTEMPTS = 3
 ESCALATION_THRESHOLD = 2  # Escalate after 2 completed fix attempts
+# Initial review + one review per fix attempt, plus one spare after human resume
+REVIEW_HISTORY_MAXLEN = MAX_FIX_ATTEMPTS + 2
+# Statuses that block_dependent_tasks must not overwrite
+_TERMINAL_STATUSES = frozenset(("completed", "blocked"))
 
 
 class FixLoopAction(Enum):
@@ -60,6 +64,25 @@ class FixRequest:
     use_escalation_agent: bool = False
 
 
+def _append_review_history(task: Dict[str, Any], entry: Dict[str, Any]) -> None:
+    """
+    Append a review to the task's review history, keeping it bounded.
+    
+    The history stays a plain list (it is saved as-is to AGENT_STATE.json);
+    only the newest REVIEW_HISTORY_MAXLEN entries are kept.
+    
+    Args:
+        task: Task dictionary
+        entry: Review history entry
+    """
+    history = task.get("review_history")
+    if not isinstance(history, list):
+        history = list(history or [])
+        task["review_history"] = history
+    history.append(entry)
+    del history[:-REVIEW_HISTORY_MAXLEN]
+
+
 def should_enter_fix_loop(severity: str) -> bool:
     """
     Determine if review severity requires fix loop.
@@ -163,13 +186,16 @@ def block_dependent_tasks(state: Dict[str, Any], task_id: str, reason: str) -> N
         reason: Reason for blocking
     """
     dependent_ids = get_all_dependent_task_ids(state, task_id)
+    dependent_list = list(dependent_ids)
     
-    for t in state.get("tasks", []):
-        if t.get("task_id") in dependent_ids:
-            if t.get("status") not in ["completed", "blocked"]:
-                t["status"] = "blocked"
-                t["blocked_reason"] = reason
-                t["blocked_by"] = task_id
+    # Index tasks by id once, then update each dependent by direct lookup
+    index = {t.get("task_id"): t for t in state.get("tasks", [])}
+    for tid in dependent_list:
+        t = index.get(tid)
+        if t and t.get("status") not in _TERMINAL_STATUSES:
+            t["status"] = "blocked"
+            t["blocked_reason"] = reason
+            t["blocked_by"] = task_id
     
     # Add to blocked_items
     if "blocked_items" not in state:
@@ -178,7 +204,7 @@ def block_dependent_tasks(state: Dict[str, Any], task_id: str, reason: str) -> N
     state["blocked_items"].append({
         "task_id": task_id,
         "blocking_reason": reason,
-        "dependent_tasks": list(dependent_ids),
+        "dependent_tasks": dependent_list,
         "created_at": datetime.now(timezone.utc).isoformat()
     })
 
@@ -225,10 +251,7 @@ def enter_fix_loop(state: Dict[str, Any], task_id: str, review_findings: List[Di
     completed_attempts = task.get("fix_attempts", 0)
     
     # Add to review history (structured format for prompt injection)
-    if "review_history" not in task:
-        task["review_history"] = []
-    
-    task["review_history"].append({
+    _append_review_history(task, {
         "attempt": completed_attempts,  # 0 for initial, 1/2/3 for fix attempts
         "severity": overall_severity,
         "findings": review_findings,  # List of {severity, summary, details}
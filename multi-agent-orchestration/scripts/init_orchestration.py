@@ -15,10 +15,10 @@ import json
 import os
 import re
 import sys
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Sequence, Callable
 
 # Add script directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
@@ -33,15 +33,78 @@ from spec_parser import (
     load_tasks_from_spec,
 )
 
+# Shared empty value for TaskEntry sequence fields (serialized as [])
+_EMPTY = ()
+
+# Optional fast JSON encoder; falls back to stdlib json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Optional Aho-Corasick matcher for criticality keywords; falls back to regex
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 
 # Legacy agent mapping removed - Codex assigns owner_agent via Step 1b of SKILL.md
 
 # Legacy keywords for criticality detection (Requirement 11.6)
 SECURITY_KEYWORDS = ["security", "auth", "password", "token", "encrypt", "credential", "secret"]
 COMPLEX_KEYWORDS = ["refactor", "migration", "integration", "architecture"]
+# One-pass keyword scan; the lookahead also reports overlapping matches so a
+# complex keyword can never hide an adjacent security keyword
+_CRITICALITY_RE = re.compile(
+    "(?=(" + "|".join(map(re.escape, SECURITY_KEYWORDS + COMPLEX_KEYWORDS)) + "))"
+)
+_SECURITY_SET = frozenset(SECURITY_KEYWORDS)
+
+
+def _build_keyword_automaton() -> Optional[Any]:
+    """Build an Aho-Corasick automaton over all criticality keywords, if available"""
+    if ahocorasick is None:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in SECURITY_KEYWORDS + COMPLEX_KEYWORDS:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_KEYWORD_AUTOMATON = _build_keyword_automaton()
+
+# __slots__-backed dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Subtask statuses that put the parent in_progress (Req 1.4)
+_IN_PROGRESS_SET = frozenset(("in_progress", "pending_review", "under_review", "final_review"))
+
+# Parent aggregation packs subtask statuses into integer codes so the parent
+# status is simply the highest code seen (Req 1.3, 1.4, 1.5). Unlisted
+# statuses (e.g. not_started) count as _NOT_STARTED_CODE.
+_COMPLETED_CODE, _NOT_STARTED_CODE, _IN_PROGRESS_CODE, _FIX_REQUIRED_CODE, _BLOCKED_CODE = range(5)
+_STATUS_CODE = {
+    "completed": _COMPLETED_CODE,
+    **{status: _IN_PROGRESS_CODE for status in _IN_PROGRESS_SET},
+    "fix_required": _FIX_REQUIRED_CODE,
+    "blocked": _BLOCKED_CODE,
+}
+_CODE_STATUS = ("completed", "not_started", "in_progress", "fix_required", "blocked")
+
+# design.md extraction patterns (Requirement 11.8); bytes so they run over an mmap
+# Overview and mermaid alternatives share one pattern so a single finditer
+# pass finds both; the bodies are captured inside lookaheads so a mermaid
+# block nested in the Overview section is still reached by the scan.
+_DESIGN_RE = re.compile(
+    rb'## Overview\s*\n(?=(?P<overview>.*?)(?:\n##|\Z))'
+    rb'|```mermaid\s*\n(?=(?P<mermaid>.*?)```)',
+    re.DOTALL,
+)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class TaskEntry:
     """
     Task entry for AGENT_STATE.json
@@ -60,11 +123,11 @@ class TaskEntry:
     owner_agent: Optional[str] = None
     criticality: Optional[str] = None
     # Parent-subtask relationship fields (Req 1.3, 1.4, 1.5)
-    subtasks: List[str] = field(default_factory=list)
+    subtasks: Sequence[str] = ()
     parent_id: Optional[str] = None
     # File manifest fields (Req 2.1, 2.2)
-    writes: List[str] = field(default_factory=list)
-    reads: List[str] = field(default_factory=list)
+    writes: Sequence[str] = ()
+    reads: Sequence[str] = ()
     # Fix loop fields (Req 3.10)
     fix_attempts: int = 0
     max_fix_attempts: int = 3
@@ -72,18 +135,19 @@ class TaskEntry:
     escalated_at: Optional[str] = None
     original_agent: Optional[str] = None
     last_review_severity: Optional[str] = None
-    review_history: List[Dict[str, Any]] = field(default_factory=list)
+    review_history: Sequence[Dict[str, Any]] = ()
     blocked_reason: Optional[str] = None
     blocked_by: Optional[str] = None
     # Task details for prompt building
-    details: List[str] = field(default_factory=list)
+    details: Sequence[str] = ()
     
     def to_dict(self) -> Dict[str, Any]:
-        data = asdict(self)
+        # Shallow field read; asdict() would deep-copy every list/dict value
+        data = {name: getattr(self, name) for name in self.__dataclass_fields__}
         return {key: value for key, value in data.items() if value is not None}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class AgentState:
     """Full AGENT_STATE.json structure"""
     spec_path: str
@@ -97,10 +161,10 @@ class AgentState:
     window_mapping: Dict[str, str] = field(default_factory=dict)
     
     def to_dict(self) -> Dict[str, Any]:
-        return asdict(self)
+        return {name: getattr(self, name) for name in self.__dataclass_fields__}
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class InitResult:
     """Result of initialization"""
     success: bool
@@ -111,6 +175,34 @@ class InitResult:
     errors: List[str] = field(default_factory=list)
 
 
+def dumps_indented(obj: Any) -> bytes:
+    """Serialize obj to 2-space indented UTF-8 JSON bytes (orjson if available)"""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_file(path: Path, render: Callable[[], bytes]) -> None:
+    """Serialize via render() and write the bytes to path atomically (temp file + os.replace)"""
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    try:
+        payload = render()
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            view = memoryview(payload)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def determine_criticality(task: Task) -> str:
     """
     Determine task criticality based on description and details.
@@ -124,17 +216,19 @@ def determine_criticality(task: Task) -> str:
     """
     text = (task.description + " " + " ".join(task.details)).lower()
     
-    # Check for security-sensitive keywords
-    for keyword in SECURITY_KEYWORDS:
-        if keyword in text:
-            return "security-sensitive"
+    if _KEYWORD_AUTOMATON is not None:
+        keywords = (keyword for _, keyword in _KEYWORD_AUTOMATON.iter(text))
+    else:
+        keywords = (match.group(1) for match in _CRITICALITY_RE.finditer(text))
     
-    # Check for complex keywords
-    for keyword in COMPLEX_KEYWORDS:
-        if keyword in text:
-            return "complex"
+    # Security keywords win over complex keywords wherever they appear
+    criticality = "standard"
+    for keyword in keywords:
+        if keyword in _SECURITY_SET:
+            return "security-sensitive"
+        criticality = "complex"
     
-    return "standard"
+    return criticality
 
 
 def assign_owner_agent(task: Task) -> str:
@@ -142,7 +236,11 @@ def assign_owner_agent(task: Task) -> str:
     return "codex"
 
 
-def convert_task_to_entry(task: Task, include_decisions: bool = False) -> TaskEntry:
+def convert_task_to_entry(
+    task: Task,
+    include_decisions: bool = False,
+    created_at: Optional[str] = None
+) -> TaskEntry:
     """
     Convert parsed Task to TaskEntry for AGENT_STATE.json.
     
@@ -150,7 +248,12 @@ def convert_task_to_entry(task: Task, include_decisions: bool = False) -> TaskEn
     - subtasks, parent_id for parent status aggregation (Req 1.3, 1.4, 1.5)
     - writes, reads for file conflict detection (Req 2.1, 2.2)
     - fix loop fields for retry mechanism (Req 3.10)
+    
+    created_at lets callers converting many tasks share one timestamp;
+    defaults to the current UTC time.
     """
+    if created_at is None:
+        created_at = datetime.now(timezone.utc).isoformat()
     owner_agent = assign_owner_agent(task) if include_decisions else None
     criticality = determine_criticality(task) if include_decisions else None
 
@@ -161,15 +264,15 @@ def convert_task_to_entry(task: Task, include_decisions: bool = False) -> TaskEn
         status=task.status.value,
         dependencies=task.dependencies,
         is_optional=task.is_optional,
-        created_at=datetime.now(timezone.utc).isoformat(),
+        created_at=created_at,
         owner_agent=owner_agent,
         criticality=criticality,
         # Parent-subtask relationship fields (Req 1.3, 1.4, 1.5)
-        subtasks=task.subtasks,
+        subtasks=task.subtasks or _EMPTY,
         parent_id=task.parent_id,
         # File manifest fields (Req 2.1, 2.2)
-        writes=task.writes,
-        reads=task.reads,
+        writes=task.writes or _EMPTY,
+        reads=task.reads or _EMPTY,
         # Fix loop fields (Req 3.10)
         fix_attempts=task.fix_attempts,
         max_fix_attempts=task.max_fix_attempts,
@@ -177,14 +280,64 @@ def convert_task_to_entry(task: Task, include_decisions: bool = False) -> TaskEn
         escalated_at=task.escalated_at,
         original_agent=task.original_agent,
         last_review_severity=task.last_review_severity,
-        review_history=task.review_history,
+        review_history=task.review_history or _EMPTY,
         blocked_reason=task.blocked_reason,
         blocked_by=task.blocked_by,
         # Task details for prompt building
-        details=task.details,
+        details=task.details or _EMPTY,
     )
 
 
+def _task_to_dict_codex(task: Task, created_at: str) -> Dict[str, Any]:
+    """
+    Build the AGENT_STATE task dict for codex mode directly from a Task.
+    
+    Equivalent to convert_task_to_entry(task, created_at=created_at).to_dict()
+    without the intermediate TaskEntry object. Keys follow TaskEntry field
+    order and None values are dropped the same way.
+    """
+    data = {
+        "task_id": task.task_id,
+        "description": task.description,
+        "type": task.task_type.value,
+        "status": task.status.value,
+        "dependencies": task.dependencies,
+        "is_optional": task.is_optional,
+        "created_at": created_at,
+        # Parent-subtask relationship fields (Req 1.3, 1.4, 1.5)
+        "subtasks": task.subtasks or _EMPTY,
+        "parent_id": task.parent_id,
+        # File manifest fields (Req 2.1, 2.2)
+        "writes": task.writes or _EMPTY,
+        "reads": task.reads or _EMPTY,
+        # Fix loop fields (Req 3.10)
+        "fix_attempts": task.fix_attempts,
+        "max_fix_attempts": task.max_fix_attempts,
+        "escalated": task.escalated,
+        "escalated_at": task.escalated_at,
+        "original_agent": task.original_agent,
+        "last_review_severity": task.last_review_severity,
+        "review_history": task.review_history or _EMPTY,
+        "blocked_reason": task.blocked_reason,
+        "blocked_by": task.blocked_by,
+        # Task details for prompt building
+        "details": task.details or _EMPTY,
+    }
+    return {key: value for key, value in data.items() if value is not None}
+
+
+def _task_to_dict_legacy(task: Task, created_at: str) -> Dict[str, Any]:
+    """Legacy mode conversion with script-driven owner_agent/criticality"""
+    return convert_task_to_entry(task, include_decisions=True, created_at=created_at).to_dict()
+
+
+# Task -> AGENT_STATE task dict conversion per initialization mode
+_CONVERTERS = {
+    "codex": _task_to_dict_codex,
+    "legacy": _task_to_dict_legacy,
+}
+
+
 def update_parent_statuses(state: Dict[str, Any]) -> None:
     """
     Update parent task statuses based on subtask completion.
@@ -204,42 +357,43 @@ def update_parent_statuses(state: Dict[str, Any]) -> None:
     Args:
         state: The AGENT_STATE dictionary containing tasks
     """
+    tasks = state.get("tasks", [])
+    status_code = _STATUS_CODE.get
+    
     # Build task map for quick lookup
-    task_map = {t["task_id"]: t for t in state.get("tasks", [])}
+    task_map = {t["task_id"]: t for t in tasks}
     
     # Process tasks in reverse order to handle nested hierarchies
     # (children before parents)
-    for task in reversed(state.get("tasks", [])):
-        subtask_ids = task.get("subtasks", [])
+    for task in reversed(tasks):
+        subtask_ids = task.get("subtasks")
         if not subtask_ids:
             continue  # Leaf task, skip
         
-        # Get subtask statuses
-        subtask_statuses = []
+        # Highest subtask status code wins; blocked can stop the scan early
+        code = -1
         for sid in subtask_ids:
-            if sid in task_map:
-                subtask_statuses.append(task_map[sid].get("status", "not_started"))
+            try:
+                subtask = task_map[sid]
+            except KeyError:
+                continue
+            sub_code = status_code(subtask.get("status", "not_started"), _NOT_STARTED_CODE)
+            if sub_code > code:
+                code = sub_code
+                if code == _BLOCKED_CODE:
+                    break
         
-        if not subtask_statuses:
+        if code < 0:
             continue  # No valid subtasks found
         
-        # Determine parent status from subtask statuses (Req 1.3, 1.4, 1.5)
-        if all(s == "completed" for s in subtask_statuses):
-            # All subtasks completed → parent completed (Req 1.3)
-            task["status"] = "completed"
-        elif any(s == "blocked" for s in subtask_statuses):
-            # Any subtask blocked → parent blocked (Req 1.5)
-            task["status"] = "blocked"
-        elif any(s == "fix_required" for s in subtask_statuses):
-            # Any subtask fix_required → parent fix_required
-            task["status"] = "fix_required"
-        elif any(s in ["in_progress", "pending_review", "under_review", "final_review"] 
-                 for s in subtask_statuses):
-            # Any subtask in progress → parent in_progress (Req 1.4)
-            task["status"] = "in_progress"
-        else:
-            # Otherwise → parent not_started
-            task["status"] = "not_started"
+        task["status"] = _CODE_STATUS[code]
+
+
+def _decode_section(section: Optional[bytes]) -> str:
+    """Decode a matched design.md section, normalizing CRLF line endings"""
+    if section is None:
+        return ""
+    return section.decode('utf-8').replace('\r\n', '\n')
 
 
 def extract_mental_model_from_design(design_path: str) -> Dict[str, str]:
@@ -248,9 +402,22 @@ def extract_mental_model_from_design(design_path: str) -> Dict[str, str]:
     
     Requirement 11.8: Initialize PROJECT_PULSE.md with Mental Model from design.md
     """
+    import mmap
+    
+    # Scan the file through mmap and decode only the matched sections
     try:
-        with open(design_path, 'r', encoding='utf-8') as f:
-            content = f.read()
+        with open(design_path, 'rb') as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                overview = mermaid = None
+                for match in _DESIGN_RE.finditer(content):
+                    if overview is None:
+                        overview = match.group("overview")
+                    if mermaid is None:
+                        mermaid = match.group("mermaid")
+                    if overview is not None and mermaid is not None:
+                        break
+                overview_text = _decode_section(overview)
+                diagram_text = _decode_section(mermaid)
     except Exception:
         return {
             "description": "Multi-agent orchestration system",
@@ -259,19 +426,14 @@ def extract_mental_model_from_design(design_path: str) -> Dict[str, str]:
     
     # Extract overview section for description
     description = ""
-    overview_match = re.search(r'## Overview\s*\n(.*?)(?=\n##|\Z)', content, re.DOTALL)
-    if overview_match:
-        overview_text = overview_match.group(1).strip()
+    if overview_text:
         # Get first paragraph
-        paragraphs = overview_text.split('\n\n')
+        paragraphs = overview_text.strip().split('\n\n')
         if paragraphs:
             description = paragraphs[0].strip()
     
     # Extract first mermaid diagram
-    diagram = ""
-    mermaid_match = re.search(r'```mermaid\s*\n(.*?)```', content, re.DOTALL)
-    if mermaid_match:
-        diagram = mermaid_match.group(1).strip()
+    diagram = diagram_text.strip()
     
     return {
         "description": description or "Multi-agent orchestration system",
@@ -293,22 +455,25 @@ def generate_pulse_document(
     total_tasks = len(tasks)
     not_started = sum(1 for t in tasks if t.get("status") == "not_started")
     
-    pulse_content = f"""# PROJECT_PULSE.md
+    parts: List[str] = []
+    append = parts.append
+    
+    append(f"""# PROJECT_PULSE.md
 
 ## 🟢 Mental Model
 
 {mental_model['description']}
 
-"""
+""")
     
     if mental_model['diagram']:
-        pulse_content += f"""```mermaid
+        append(f"""```mermaid
 {mental_model['diagram']}
 ```
 
-"""
+""")
     
-    pulse_content += f"""## 🟡 Narrative Delta
+    append(f"""## 🟡 Narrative Delta
 
 **Orchestration initialized from spec:** `{spec_path}`
 
@@ -331,9 +496,9 @@ def generate_pulse_document(
 - [Spec] {spec_path}/requirements.md -> Requirements
 - [Spec] {spec_path}/design.md -> Design
 - [Spec] {spec_path}/tasks.md -> Tasks
-"""
+""")
     
-    return pulse_content
+    return "".join(parts)
 
 
 def generate_pulse_template(spec_path: str) -> str:
@@ -412,11 +577,11 @@ def initialize_orchestration(
         )
     
     # Convert tasks to entries (Requirement 11.4, 11.5, 11.6)
-    include_decisions = mode == "legacy"
-    task_entries = [
-        convert_task_to_entry(t, include_decisions=include_decisions)
-        for t in tasks_result.tasks
-    ]
+    convert = _CONVERTERS.get(mode, _task_to_dict_codex)
+    # One interned timestamp shared by every entry (init is a single logical moment)
+    now_iso = sys.intern(datetime.now(timezone.utc).isoformat())
+    # Serialize once; the same list backs both JSON files and the PULSE
+    task_dicts = [convert(t, now_iso) for t in tasks_result.tasks]
     
     # Determine session name
     if not session_name:
@@ -427,7 +592,7 @@ def initialize_orchestration(
     agent_state = AgentState(
         spec_path=os.path.abspath(spec_path),
         session_name=session_name,
-        tasks=[t.to_dict() for t in task_entries],
+        tasks=task_dicts,
     )
     
     # Determine output directory
@@ -438,30 +603,11 @@ def initialize_orchestration(
     
     out_path.mkdir(parents=True, exist_ok=True)
     
-    # Write TASKS_PARSED.json for Codex consumption
     tasks_file = out_path / "TASKS_PARSED.json"
-    try:
-        with open(tasks_file, 'w', encoding='utf-8') as f:
-            json.dump(
-                {
-                    "spec_path": os.path.abspath(spec_path),
-                    "tasks": [t.to_dict() for t in task_entries],
-                },
-                f,
-                indent=2
-            )
-    except Exception as e:
-        errors.append(f"Failed to write TASKS_PARSED.json: {e}")
-    
-    # Write AGENT_STATE.json
     state_file = out_path / "AGENT_STATE.json"
-    try:
-        with open(state_file, 'w', encoding='utf-8') as f:
-            json.dump(agent_state.to_dict(), f, indent=2)
-    except Exception as e:
-        errors.append(f"Failed to write AGENT_STATE.json: {e}")
+    pulse_file = out_path / "PROJECT_PULSE.md"
     
-    # Generate and write PROJECT_PULSE.md
+    # Generate PROJECT_PULSE.md content
     if mode == "legacy":
         # Extract mental model from design.md (Requirement 11.8)
         design_path = os.path.join(spec_path, "design.md")
@@ -469,16 +615,34 @@ def initialize_orchestration(
         pulse_content = generate_pulse_document(
             spec_path,
             mental_model,
-            [t.to_dict() for t in task_entries]
+            task_dicts
         )
     else:
         pulse_content = generate_pulse_template(spec_path)
-    pulse_file = out_path / "PROJECT_PULSE.md"
-    try:
-        with open(pulse_file, 'w', encoding='utf-8') as f:
-            f.write(pulse_content)
-    except Exception as e:
-        errors.append(f"Failed to write PROJECT_PULSE.md: {e}")
+    
+    from concurrent.futures import ThreadPoolExecutor
+    
+    # Write the independent files concurrently; each is serialized inside its
+    # write so a serialization error is reported like a failed write:
+    # TASKS_PARSED.json for Codex consumption, AGENT_STATE.json, PROJECT_PULSE.md
+    outputs = [
+        (tasks_file, lambda: dumps_indented({
+            "spec_path": os.path.abspath(spec_path),
+            "tasks": task_dicts,
+        })),
+        (state_file, lambda: dumps_indented(agent_state.to_dict())),
+        (pulse_file, lambda: pulse_content.encode("utf-8")),
+    ]
+    with ThreadPoolExecutor(max_workers=len(outputs)) as executor:
+        futures = [
+            (path, executor.submit(_write_file, path, render))
+            for path, render in outputs
+        ]
+    for path, future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            errors.append(f"Failed to write {path.name}: {e}")
     
     if errors:
         return InitResult(
@@ -499,8 +663,8 @@ def initialize_orchestration(
     )
 
 
-def main():
-    """Command line entry point"""
+def _build_parser():
+    """Build the command line parser"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -530,7 +694,41 @@ def main():
         help="Initialization mode: codex (scaffold) or legacy (script-driven)"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _result_payload(result: InitResult) -> Dict[str, Any]:
+    """Build the --json output for a result"""
+    output = {
+        "success": result.success,
+        "message": result.message,
+        "tasks_file": result.tasks_file,
+        "state_file": result.state_file,
+        "pulse_file": result.pulse_file,
+        "errors": result.errors
+    }
+    return output
+
+
+def run(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Initialize orchestration from command line style arguments and return the --json payload.
+
+    In-process entry point used by orchestration_loop instead of a subprocess.
+    """
+    args = _build_parser().parse_args(argv)
+    result = initialize_orchestration(
+        args.spec_path,
+        session_name=args.session,
+        output_dir=args.output,
+        mode=args.mode
+    )
+    return _result_payload(result)
+
+
+def main():
+    """Command line entry point"""
+    args = _build_parser().parse_args()
     
     result = initialize_orchestration(
         args.spec_path,
@@ -540,15 +738,7 @@ def main():
     )
     
     if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "tasks_file": result.tasks_file,
-            "state_file": result.state_file,
-            "pulse_file": result.pulse_file,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(_result_payload(result), indent=2))
     else:
         if result.success:
             print(f"✅ {result.message}")
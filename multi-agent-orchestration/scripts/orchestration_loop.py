@@ -17,17 +17,31 @@ Optional mode (deterministic) is fixed-sequence:
 from __future__ import annotations
 
 import argparse
+import hashlib
+import importlib
 import json
 import os
+import re
+import signal
 import subprocess
 import sys
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from operator import methodcaller
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Deque, Dict, Iterable, List, Optional, Tuple
 
 from codeagent_wrapper_utils import resolve_codeagent_wrapper
 
+# Optional fast JSON backend for AGENT_STATE.json; falls back to stdlib json
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 ALLOWED_ACTION_TYPES = {
     "assign_dispatch",
@@ -38,6 +52,48 @@ ALLOWED_ACTION_TYPES = {
     "halt",
 }
 
+# Actions that may do more work when repeated back-to-back (dispatch_batch
+# dispatches the next batch); other consecutive duplicates are collapsed.
+NON_IDEMPOTENT_ACTIONS = {"dispatch_batch"}
+
+
+# Deterministic mode stops once this many stagnation points accumulate: +1 per
+# round without fewer incomplete units, +2 per round with no task change at all
+STAGNATION_LIMIT = 5
+
+# Dispatch fields copied from assign_dispatch output onto dispatch units
+_ASSIGN_KEYS = ("type", "owner_agent", "target_window", "criticality", "writes", "reads")
+
+# Tokens that matter when matching braces in streamed output (escapes as pairs).
+# All of them are ASCII, so the raw UTF-8 bytes are scanned without decoding.
+_JSON_SCAN_RE = re.compile(rb'\\.|[{}"]', re.DOTALL)
+
+# Captured subprocess output is capped (first + last half kept) to bound memory
+_CAPTURE_LIMIT = 4 * 1024 * 1024
+_CAPTURE_CHUNK = 64 * 1024
+
+# Status accessor for counting incomplete dispatch units
+_GET_STATUS = methodcaller("get", "status")
+
+# In-process entry points of sibling scripts (name -> run() or None), loaded on first use
+ScriptRunner = Callable[[List[str]], Dict[str, Any]]
+_SCRIPTS_DIR = Path(__file__).resolve().parent
+_SCRIPT_RUNNERS: Dict[str, Optional[ScriptRunner]] = {}
+
+# Only the most recent runner events are shown to the orchestrator
+RECENT_EVENTS_LIMIT = 20
+
+# sync_pulse is skipped when AGENT_STATE.json is unchanged since the last sync
+PULSE_SKIPPED_MESSAGE = "skipped (no state change)"
+
+# Actions that rewrite AGENT_STATE.json; the cached state view is dropped after each
+_STATE_MUTATING_ACTIONS = {
+    "assign_dispatch",
+    "dispatch_batch",
+    "dispatch_reviews",
+    "consolidate_reviews",
+}
+
 
 @dataclass(frozen=True)
 class RunnerPaths:
@@ -51,35 +107,284 @@ def _read_text(path: Path) -> str:
 
 
 def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        return orjson.loads(path.read_bytes())
     return json.loads(_read_text(path))
 
 
 def _write_json(path: Path, payload: Any) -> None:
-    path.write_text(json.dumps(payload, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    """Write JSON atomically (tmp file + os.replace) so a killed run never leaves a torn file."""
+    if orjson is not None:
+        data = orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    else:
+        data = (json.dumps(payload, indent=2, ensure_ascii=False) + "\n").encode("utf-8")
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+# Stateless, so one instance serves every reply
+_JSON_DECODER = json.JSONDecoder()
 
 
 def _json_from_text(text: str) -> Any:
-    decoder = json.JSONDecoder()
-    for i, ch in enumerate(text):
-        if ch != "{":
-            continue
+    decoder = _JSON_DECODER
+    pos = 0
+    while True:
+        i = text.find("{", pos)
+        if i < 0:
+            raise ValueError("No JSON object found in output")
         try:
-            obj, _end = decoder.raw_decode(text[i:])
+            obj, _end = decoder.raw_decode(text, i)
             return obj
         except json.JSONDecodeError:
-            continue
-    raise ValueError("No JSON object found in output")
+            pos = i + 1
+
+
+class _JsonStreamScanner:
+    """
+    Incremental form of _json_from_text over stdout arriving in chunks.
+
+    Only the bytes from the earliest undecided '{' candidate onward are kept,
+    and the brace-matching state (depth, in-string) carries over between
+    chunks, so each byte is scanned once per candidate. A candidate is only
+    decoded once its string-aware closing brace has arrived; a valid JSON
+    object always ends at that brace, so the result matches _json_from_text
+    on the full output. Scanning gives up once a single candidate grows past
+    _CAPTURE_LIMIT, leaving the caller to parse the capped capture instead.
+    """
+
+    def __init__(self) -> None:
+        self._buf = bytearray()
+        self._active = False
+        self._pos = 0
+        self._depth = 0
+        self._in_string = False
+        self.exhausted = False
+
+    def feed(self, chunk: bytes) -> Tuple[bool, Any]:
+        if self.exhausted:
+            return False, None
+        buf = self._buf
+        buf += chunk
+        while True:
+            if not self._active:
+                i = buf.find(b"{", self._pos)
+                if i < 0:
+                    del buf[:]
+                    self._pos = 0
+                    return False, None
+                # Everything before the candidate can never be part of the result
+                del buf[:i]
+                self._active = True
+                self._pos = 0
+                self._depth = 0
+                self._in_string = False
+            end = self._object_end()
+            if end < 0:
+                if len(buf) > _CAPTURE_LIMIT:
+                    self.exhausted = True
+                    del buf[:]
+                return False, None
+            try:
+                obj, _end = _JSON_DECODER.raw_decode(buf[:end].decode("utf-8", errors="replace"))
+                return True, obj
+            except json.JSONDecodeError:
+                # Try the next '{', which may sit inside the rejected candidate
+                self._active = False
+                self._pos = 1
+
+    def _object_end(self) -> int:
+        """Advance over the candidate; return the index past its closing brace, or -1."""
+        buf = self._buf
+        depth = self._depth
+        in_string = self._in_string
+        last_end = self._pos
+        for m in _JSON_SCAN_RE.finditer(buf, self._pos):
+            token = m.group()
+            if in_string:
+                if token == b'"':
+                    in_string = False
+            elif token == b"{":
+                depth += 1
+            elif token == b"}":
+                depth -= 1
+                if depth == 0:
+                    return m.end()
+            elif token == b'"':
+                in_string = True
+            last_end = m.end()
+        if last_end < len(buf) and buf[-1] == 0x5C:
+            # A trailing backslash pairs with the first byte of the next chunk
+            self._pos = len(buf) - 1
+        else:
+            self._pos = len(buf)
+        self._depth = depth
+        self._in_string = in_string
+        return -1
+
+
+def _run_until_json(cmd: List[str], *, input_text: str, cwd: Path) -> Tuple[bool, Any, int, bytes, bytes]:
+    """
+    Run cmd and stop reading as soon as its stdout holds a complete JSON object.
+
+    Returns (found, obj, exit_code, stdout, stderr). When an object is found
+    the process group is terminated instead of waiting for it to exit, and
+    exit_code is whatever the terminated process reports; otherwise the
+    output is returned once it exits. stdout/stderr are capped like _run's.
+    """
+    posix = os.name == "posix"
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(cwd),
+        start_new_session=posix,
+    )
+    def feed_stdin() -> None:
+        try:
+            proc.stdin.write(input_text.encode("utf-8"))
+            proc.stdin.close()
+        except OSError:
+            pass
 
+    def stop() -> None:
+        # The wrapper starts the backend CLI as a child; stop the whole group.
+        try:
+            if posix:
+                os.killpg(proc.pid, signal.SIGTERM)
+            else:
+                proc.terminate()
+            proc.wait(timeout=5)
+        except ProcessLookupError:
+            proc.wait()
+        except subprocess.TimeoutExpired:
+            if posix:
+                os.killpg(proc.pid, signal.SIGKILL)
+            else:
+                proc.kill()
+            proc.wait()
+
+    stdin_thread = threading.Thread(target=feed_stdin, daemon=True)
+    stdin_thread.start()
+    stderr_thread, stderr_sink = _start_bounded_reader(proc.stderr)
 
-def _run(cmd: List[str], *, input_text: Optional[str] = None, cwd: Optional[Path] = None) -> Tuple[int, str, str]:
-    result = subprocess.run(
+    capture = _BoundedCapture()
+    scanner = _JsonStreamScanner()
+    found, obj = False, None
+    try:
+        while True:
+            chunk = proc.stdout.read1(_CAPTURE_CHUNK)
+            if not chunk:
+                break
+            capture.append(chunk)
+            found, obj = scanner.feed(chunk)
+            if found:
+                stop()
+                break
+        proc.wait()
+    except BaseException:
+        stop()
+        raise
+    finally:
+        proc.stdout.close()
+    stdin_thread.join()
+    stderr_thread.join()
+    proc.stderr.close()
+    return found, obj, proc.returncode, capture.getvalue(), stderr_sink[0] if stderr_sink else b""
+
+
+class _BoundedCapture:
+    """
+    Accumulates output keeping at most about limit bytes.
+
+    Keeps the first and the last limit/2 bytes and replaces the dropped middle
+    with a marker, so a wrapper dumping huge logs cannot exhaust memory.
+    """
+
+    def __init__(self, limit: int = _CAPTURE_LIMIT) -> None:
+        self._half = limit // 2
+        self._head = bytearray()
+        self._tail: Deque[bytes] = deque()
+        self._tail_size = 0
+        self._dropped = 0
+
+    def append(self, chunk: bytes) -> None:
+        half = self._half
+        head = self._head
+        if len(head) < half:
+            take = half - len(head)
+            head += chunk[:take]
+            chunk = chunk[take:]
+            if not chunk:
+                return
+        tail = self._tail
+        tail.append(chunk)
+        self._tail_size += len(chunk)
+        while self._tail_size - len(tail[0]) >= half:
+            old = tail.popleft()
+            self._tail_size -= len(old)
+            self._dropped += len(old)
+
+    def getvalue(self) -> bytes:
+        if self._dropped:
+            return bytes(self._head) + b"\n...[%d bytes truncated]...\n" % self._dropped + b"".join(self._tail)
+        return bytes(self._head) + b"".join(self._tail)
+
+
+def _read_bounded(stream: Any, limit: int = _CAPTURE_LIMIT) -> bytes:
+    """Read a pipe to EOF through a _BoundedCapture."""
+    capture = _BoundedCapture(limit)
+    while True:
+        chunk = stream.read1(_CAPTURE_CHUNK)
+        if not chunk:
+            break
+        capture.append(chunk)
+    return capture.getvalue()
+
+
+def _start_bounded_reader(stream: Any) -> Tuple[threading.Thread, List[bytes]]:
+    sink: List[bytes] = []
+    thread = threading.Thread(target=lambda: sink.append(_read_bounded(stream)), daemon=True)
+    thread.start()
+    return thread, sink
+
+
+def _run(cmd: List[str], *, input_text: Optional[str] = None, cwd: Optional[Path] = None) -> Tuple[int, bytes, bytes]:
+    """Run cmd and return raw (size-capped) stdout/stderr bytes; callers decode only what they need."""
+    proc = subprocess.Popen(
         cmd,
-        input=input_text,
-        capture_output=True,
-        text=True,
+        stdin=subprocess.PIPE if input_text is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
         cwd=str(cwd) if cwd else None,
     )
-    return result.returncode, result.stdout or "", result.stderr or ""
+    out_thread, out = _start_bounded_reader(proc.stdout)
+    err_thread, err = _start_bounded_reader(proc.stderr)
+    try:
+        if input_text is not None:
+            try:
+                proc.stdin.write(input_text.encode("utf-8"))
+                proc.stdin.close()
+            except BrokenPipeError:
+                pass
+        code = proc.wait()
+    except BaseException:
+        proc.kill()
+        proc.wait()
+        raise
+    out_thread.join()
+    err_thread.join()
+    return code, out[0] if out else b"", err[0] if err else b""
+
+
+def _decode(data: bytes) -> str:
+    return data.decode("utf-8", errors="replace")
+
+
+def _failure_detail(stdout: bytes, stderr: bytes) -> str:
+    return _decode(stderr).strip() or _decode(stdout).strip()
 
 
 def _infer_paths(state_file: Path, tasks_file: Optional[Path], pulse_file: Optional[Path]) -> RunnerPaths:
@@ -107,11 +412,83 @@ def _is_dispatch_unit(task: Dict[str, Any]) -> bool:
     return not task.get("parent_id") and not task.get("subtasks")
 
 
-def _dispatch_unit_completion(state: Dict[str, Any]) -> Tuple[int, int]:
-    tasks = state.get("tasks", [])
-    units = [t for t in tasks if _is_dispatch_unit(t)]
-    incomplete = [t for t in units if t.get("status") != "completed"]
-    return len(incomplete), len(units)
+@dataclass
+class _StateView:
+    """AGENT_STATE.json plus the dispatch-unit aggregates the loop checks."""
+
+    state: Dict[str, Any]
+    dispatch_units: List[Dict[str, Any]]
+    incomplete_count: int
+    missing_owners: List[str]
+
+
+def _state_view(state: Dict[str, Any]) -> _StateView:
+    # Comprehensions and map() keep the per-task work in C-level loops; this
+    # runs on every state load and task lists can hold thousands of entries.
+    units = [
+        t for t in state.get("tasks", [])
+        if isinstance(t, dict) and (t.get("subtasks") or not t.get("parent_id"))
+    ]
+    incomplete = len(units) - list(map(_GET_STATUS, units)).count("completed")
+    missing = [
+        str(t["task_id"]) for t in units
+        if not t.get("owner_agent") and not t.get("is_optional", False) and t.get("task_id")
+    ]
+    return _StateView(state=state, dispatch_units=units, incomplete_count=incomplete, missing_owners=missing)
+
+
+def _state_fingerprint(state: Dict[str, Any]) -> bytes:
+    """Short digest of every task's (task_id, status, owner_agent)."""
+    rows = [
+        (t.get("task_id"), t.get("status"), t.get("owner_agent"))
+        for t in state.get("tasks", [])
+        if isinstance(t, dict)
+    ]
+    data = orjson.dumps(rows) if orjson is not None else json.dumps(rows).encode("utf-8")
+    return hashlib.blake2b(data, digest_size=16).digest()
+
+
+def _load_state_view(path: Path) -> _StateView:
+    return _state_view(_read_json(path))
+
+
+class _StateCache:
+    """
+    Holds the last loaded _StateView of AGENT_STATE.json.
+
+    The runner calls invalidate() after anything that may rewrite the file,
+    so repeated checks within an iteration reuse one parse.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._view: Optional[_StateView] = None
+
+    def get(self) -> _StateView:
+        if self._view is None:
+            self._view = _load_state_view(self.path)
+        return self._view
+
+    def set(self, view: _StateView) -> None:
+        self._view = view
+
+    def invalidate(self) -> None:
+        self._view = None
+
+
+def _state_stamp(path: Path) -> Tuple[int, int, int]:
+    """
+    Identify the current AGENT_STATE.json contents without reading them.
+
+    Every writer replaces the file via os.replace, so the inode changes on
+    each save; mtime and size cover coarse-timestamp filesystems.
+    """
+    st = path.stat()
+    return st.st_ino, st.st_mtime_ns, st.st_size
+
+
+def _dispatch_unit_completion(view: _StateView) -> Tuple[int, int]:
+    return view.incomplete_count, len(view.dispatch_units)
 
 
 def _pending_decisions(state: Dict[str, Any]) -> List[Dict[str, Any]]:
@@ -119,29 +496,17 @@ def _pending_decisions(state: Dict[str, Any]) -> List[Dict[str, Any]]:
     return decisions if isinstance(decisions, list) else []
 
 
-def _missing_owner_agents(state: Dict[str, Any]) -> List[str]:
-    missing: List[str] = []
-    for task in state.get("tasks", []):
-        if not isinstance(task, dict):
-            continue
-        if not _is_dispatch_unit(task):
-            continue
-        if task.get("is_optional", False):
-            continue
-        if not task.get("owner_agent"):
-            tid = task.get("task_id")
-            if tid:
-                missing.append(str(tid))
-    return missing
+def _missing_owner_agents(view: _StateView) -> List[str]:
+    return view.missing_owners
 
 
-def _build_orchestrator_prompt(
-    paths: RunnerPaths,
-    *,
-    recent_events: List[Dict[str, Any]],
-    max_actions: int,
-) -> str:
-    events_text = json.dumps(recent_events[-20:], indent=2, ensure_ascii=False) if recent_events else "[]"
+def _precompute_prompt_template(paths: RunnerPaths, max_actions: int) -> Tuple[str, str]:
+    """
+    Render the fixed parts of the orchestrator prompt once per run.
+
+    Returns (prefix, suffix); only the recent-events JSON between them changes
+    per iteration, so every prompt shares a byte-identical prefix.
+    """
     lines = [
         "You are the orchestration controller for a multi-agent workflow.",
         "This is a single-iteration tick. Your output MUST be JSON only.",
@@ -156,7 +521,10 @@ def _build_orchestrator_prompt(
     lines += [
         "",
         "Recent runner events (may be empty):",
-        events_text,
+    ]
+    prefix = "\n".join(lines) + "\n"
+
+    lines = [
         "",
         "You must decide which actions the runner should execute NEXT.",
         "",
@@ -188,39 +556,53 @@ def _build_orchestrator_prompt(
         '  "notes": "short reason"',
         "}",
     ]
-    return "\n".join(lines) + "\n"
+    suffix = "\n" + "\n".join(lines) + "\n"
+    return prefix, suffix
+
+
+def _build_orchestrator_prompt(template: Tuple[str, str], *, recent_events: Iterable[Dict[str, Any]]) -> str:
+    prefix, suffix = template
+    events = list(recent_events)
+    events_text = json.dumps(events, indent=2, ensure_ascii=False) if events else "[]"
+    return prefix + events_text + suffix
 
 
-def _exit_code_from_state(state: Dict[str, Any]) -> int:
-    if _pending_decisions(state):
+def _exit_code_from_state(view: _StateView) -> int:
+    if _pending_decisions(view.state):
         return 2
-    incomplete, total = _dispatch_unit_completion(state)
+    incomplete, total = _dispatch_unit_completion(view)
     if total == 0 or incomplete == 0:
         return 0
     return 1
 
 
+def _resolve_wrapper_bin() -> str:
+    try:
+        return resolve_codeagent_wrapper()
+    except FileNotFoundError as e:
+        raise RuntimeError(str(e)) from e
+
+
 def _call_orchestrator(
     *,
+    wrapper_bin: str,
     backend: str,
-    paths: RunnerPaths,
-    recent_events: List[Dict[str, Any]],
-    max_actions: int,
+    prompt_template: Tuple[str, str],
+    recent_events: Iterable[Dict[str, Any]],
     cwd: Path,
 ) -> Dict[str, Any]:
-    prompt = _build_orchestrator_prompt(paths, recent_events=recent_events, max_actions=max_actions)
-    try:
-        wrapper_bin = resolve_codeagent_wrapper()
-    except FileNotFoundError as e:
-        raise RuntimeError(str(e)) from e
-    code, stdout, stderr = _run(
+    prompt = _build_orchestrator_prompt(prompt_template, recent_events=recent_events)
+    # Backends often keep running (session teardown) after printing the
+    # decision; take it as soon as the JSON object is complete.
+    found, decision, code, stdout, stderr = _run_until_json(
         [wrapper_bin, "--backend", backend, "-"],
         input_text=prompt,
         cwd=cwd,
     )
-    if code != 0:
-        raise RuntimeError(f"orchestrator failed (exit {code}): {stderr.strip() or stdout.strip()}")
-    decision = _json_from_text(stdout)
+    if not found:
+        if code != 0:
+            raise RuntimeError(f"orchestrator failed (exit {code}): {_failure_detail(stdout, stderr)}")
+        decision = _json_from_text(_decode(stdout))
     if not isinstance(decision, dict):
         raise ValueError("orchestrator output is not a JSON object")
     return decision
@@ -270,14 +652,16 @@ def _build_assignment_prompt(paths: RunnerPaths) -> str:
 
 def _ensure_assignments(
     *,
+    wrapper_bin: str,
     assign_backend: str,
     paths: RunnerPaths,
     workdir: Path,
+    state_cache: _StateCache,
 ) -> None:
-    state = _read_json(paths.state_file)
-    if _pending_decisions(state):
+    view = state_cache.get()
+    if _pending_decisions(view.state):
         return
-    missing = _missing_owner_agents(state)
+    missing = _missing_owner_agents(view)
     if not missing:
         return
 
@@ -285,27 +669,25 @@ def _ensure_assignments(
         raise FileNotFoundError("TASKS_PARSED.json is required for assign_dispatch (pass --tasks or init via --spec)")
 
     prompt = _build_assignment_prompt(paths)
-    try:
-        wrapper_bin = resolve_codeagent_wrapper()
-    except FileNotFoundError as e:
-        raise RuntimeError(str(e)) from e
     code, stdout, stderr = _run(
         [wrapper_bin, "--backend", assign_backend, "-"],
         input_text=prompt,
         cwd=workdir,
     )
     if code != 0:
-        raise RuntimeError(f"assign_dispatch failed (exit {code}): {stderr.strip() or stdout.strip()}")
-    assignments = _json_from_text(stdout)
+        raise RuntimeError(f"assign_dispatch failed (exit {code}): {_failure_detail(stdout, stderr)}")
+    assignments = _json_from_text(_decode(stdout))
     if not isinstance(assignments, dict):
         raise ValueError("assign_dispatch output is not a JSON object")
-    _apply_assignments(paths.state_file, assignments)
+    state_cache.set(_apply_assignments(paths.state_file, assignments))
 
 
-def _apply_assignments(state_path: Path, assignments: Dict[str, Any]) -> Dict[str, Any]:
-    state = _read_json(state_path)
+def _apply_assignments(state_path: Path, assignments: Dict[str, Any]) -> _StateView:
+    view = _load_state_view(state_path)
+    state = view.state
     tasks = state.get("tasks", [])
     task_map = {t.get("task_id"): t for t in tasks if t.get("task_id")}
+    assigned = set()
 
     for entry in assignments.get("dispatch_units", []) or []:
         task_id = entry.get("task_id")
@@ -314,9 +696,9 @@ def _apply_assignments(state_path: Path, assignments: Dict[str, Any]) -> Dict[st
         task = task_map[task_id]
         if not _is_dispatch_unit(task):
             continue
-        for key in ["type", "owner_agent", "target_window", "criticality", "writes", "reads"]:
-            if key in entry and entry[key] is not None:
-                task[key] = entry[key]
+        task.update({key: entry[key] for key in _ASSIGN_KEYS if entry.get(key) is not None})
+        if task.get("owner_agent"):
+            assigned.add(str(task_id))
 
     window_mapping = state.get("window_mapping") or {}
     incoming_mapping = assignments.get("window_mapping") or {}
@@ -324,15 +706,79 @@ def _apply_assignments(state_path: Path, assignments: Dict[str, Any]) -> Dict[st
         window_mapping.update({str(k): str(v) for k, v in incoming_mapping.items()})
     state["window_mapping"] = window_mapping
     _write_json(state_path, state)
-    return state
+    if assigned:
+        view.missing_owners = [tid for tid in view.missing_owners if tid not in assigned]
+    return view
+
+
+def _script_runner(script: Path, cwd: Path) -> Optional[ScriptRunner]:
+    """
+    Return the in-process run() entry point of a sibling script, if usable.
+
+    The scripts launch codeagent-wrapper from their own working directory, so
+    in-process calls are only used when the runner already sits in cwd;
+    otherwise (or for scripts without run()) callers spawn a subprocess.
+    """
+    if script.parent.resolve() != _SCRIPTS_DIR or Path.cwd().resolve() != cwd.resolve():
+        return None
+    name = script.stem
+    if name not in _SCRIPT_RUNNERS:
+        try:
+            module = importlib.import_module(name)
+        except ImportError:
+            module = None
+        _SCRIPT_RUNNERS[name] = getattr(module, "run", None)
+    return _SCRIPT_RUNNERS[name]
+
+
+def _run_in_process(script: Path, runner: ScriptRunner, args: List[str]) -> Dict[str, Any]:
+    try:
+        payload = runner(args + ["--json"])
+    except SystemExit as e:
+        raise RuntimeError(f"{script.name} failed (exit {e.code})") from e
+    except Exception as e:
+        raise RuntimeError(f"{script.name} failed: {e}") from e
+    if not isinstance(payload, dict):
+        raise ValueError(f"{script.name} did not return a JSON object")
+    return payload
 
 
 def _run_python_script(script: Path, args: List[str], *, cwd: Path) -> Dict[str, Any]:
+    runner = _script_runner(script, cwd)
+    if runner is not None:
+        return _run_in_process(script, runner, args)
     cmd = [sys.executable, str(script)] + args + ["--json"]
     code, stdout, stderr = _run(cmd, cwd=cwd)
+    return _script_payload(script, code, stdout, stderr)
+
+
+def _run_parallel(calls: List[Tuple[Path, List[str]]], *, cwd: Path) -> List[Dict[str, Any]]:
+    """Run several scripts at once (like _run_python_script); payloads keep call order."""
+    runners = [_script_runner(script, cwd) for script, _args in calls]
+    if all(runner is not None for runner in runners):
+        with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+            futures = [
+                executor.submit(_run_in_process, script, runner, args)
+                for (script, args), runner in zip(calls, runners)
+            ]
+            return [future.result() for future in futures]
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        futures = [
+            executor.submit(_run, [sys.executable, str(script)] + args + ["--json"], cwd=cwd)
+            for script, args in calls
+        ]
+        results = [future.result() for future in futures]
+    return [
+        _script_payload(script, code, stdout, stderr)
+        for (script, _args), (code, stdout, stderr) in zip(calls, results)
+    ]
+
+
+def _script_payload(script: Path, code: int, stdout: bytes, stderr: bytes) -> Dict[str, Any]:
     if code != 0:
-        raise RuntimeError(f"{script.name} failed (exit {code}): {stderr.strip() or stdout.strip()}")
-    payload = json.loads(stdout)
+        raise RuntimeError(f"{script.name} failed (exit {code}): {_failure_detail(stdout, stderr)}")
+    payload = orjson.loads(stdout) if orjson is not None else json.loads(stdout)
     if not isinstance(payload, dict):
         raise ValueError(f"{script.name} did not return a JSON object")
     return payload
@@ -354,11 +800,69 @@ def _validate_decision(decision: Dict[str, Any]) -> Tuple[str, List[Dict[str, An
         t = str(a.get("type", "")).strip()
         if t not in ALLOWED_ACTION_TYPES:
             raise ValueError(f"unsupported action type: {t}")
+        if normalized and normalized[-1]["type"] == t and t not in NON_IDEMPOTENT_ACTIONS:
+            # A repeat of the previous action has nothing new to act on
+            continue
         normalized.append({"type": t})
     notes = str(decision.get("notes", "")).strip()
     return d, normalized, notes
 
 
+def _execute_action(
+    action_type: str,
+    *,
+    wrapper_bin: str,
+    assign_backend: str,
+    paths: RunnerPaths,
+    workdir: Path,
+    scripts_dir: Path,
+) -> Tuple[Dict[str, Any], str]:
+    """Run one non-halt action; returns (event fields, display message)."""
+    if action_type == "assign_dispatch":
+        prompt = _build_assignment_prompt(paths)
+        code, stdout, stderr = _run(
+            [wrapper_bin, "--backend", assign_backend, "-"],
+            input_text=prompt,
+            cwd=workdir,
+        )
+        if code != 0:
+            raise RuntimeError(f"assign_dispatch failed (exit {code}): {_failure_detail(stdout, stderr)}")
+        assignments = _json_from_text(_decode(stdout))
+        if not isinstance(assignments, dict):
+            raise ValueError("assign_dispatch output is not a JSON object")
+        _apply_assignments(paths.state_file, assignments)
+        return {"success": True}, "ok"
+
+    if action_type == "dispatch_batch":
+        payload = _run_python_script(
+            scripts_dir / "dispatch_batch.py",
+            [str(paths.state_file), "--workdir", str(workdir)],
+            cwd=workdir,
+        )
+    elif action_type == "dispatch_reviews":
+        payload = _run_python_script(
+            scripts_dir / "dispatch_reviews.py",
+            [str(paths.state_file), "--workdir", str(workdir), "--batch"],
+            cwd=workdir,
+        )
+    elif action_type == "consolidate_reviews":
+        payload = _run_python_script(
+            scripts_dir / "consolidate_reviews.py",
+            [str(paths.state_file)],
+            cwd=workdir,
+        )
+    elif action_type == "sync_pulse":
+        payload = _run_python_script(
+            scripts_dir / "sync_pulse.py",
+            [str(paths.state_file), str(paths.pulse_file)],
+            cwd=workdir,
+        )
+    else:
+        raise ValueError(f"unsupported action type: {action_type}")
+    message = payload.get("message")
+    return {"success": bool(payload.get("success")), "message": message}, f"{message}"
+
+
 def run_loop_llm(
     *,
     backend: str,
@@ -370,7 +874,7 @@ def run_loop_llm(
     max_actions: int,
 ) -> int:
     scripts_dir = Path(__file__).parent
-    recent_events: List[Dict[str, Any]] = []
+    recent_events: Deque[Dict[str, Any]] = deque(maxlen=RECENT_EVENTS_LIMIT)
 
     print(f"[loop] state_file={paths.state_file}")
     print(f"[loop] pulse_file={paths.pulse_file}")
@@ -378,34 +882,72 @@ def run_loop_llm(
         print(f"[loop] tasks_file={paths.tasks_file}")
     print(f"[loop] workdir={workdir}")
 
+    wrapper_bin = _resolve_wrapper_bin()
+    prompt_template = _precompute_prompt_template(paths, max_actions)
+    state_cache = _StateCache(paths.state_file)
+    pulse_synced_stamp: Optional[Tuple[int, int, int]] = None
+
+    def run_action(action: Dict[str, Any]) -> Tuple[Dict[str, Any], str]:
+        nonlocal pulse_synced_stamp
+        if action["type"] == "sync_pulse":
+            stamp = _state_stamp(paths.state_file)
+            if stamp == pulse_synced_stamp:
+                return {"success": True, "message": PULSE_SKIPPED_MESSAGE}, PULSE_SKIPPED_MESSAGE
+            event, display = _execute_action(
+                "sync_pulse",
+                wrapper_bin=wrapper_bin,
+                assign_backend=assign_backend,
+                paths=paths,
+                workdir=workdir,
+                scripts_dir=scripts_dir,
+            )
+            if event["success"]:
+                pulse_synced_stamp = stamp
+            return event, display
+        try:
+            return _execute_action(
+                action["type"],
+                wrapper_bin=wrapper_bin,
+                assign_backend=assign_backend,
+                paths=paths,
+                workdir=workdir,
+                scripts_dir=scripts_dir,
+            )
+        finally:
+            if action["type"] in _STATE_MUTATING_ACTIONS:
+                state_cache.invalidate()
+
     for iteration in range(1, max_iterations + 1):
-        state = _read_json(paths.state_file)
-        if _pending_decisions(state):
-            _print_pending_decisions(state)
+        view = state_cache.get()
+        if _pending_decisions(view.state):
+            _print_pending_decisions(view.state)
             return 2
 
         decision = _call_orchestrator(
+            wrapper_bin=wrapper_bin,
             backend=backend,
-            paths=paths,
+            prompt_template=prompt_template,
             recent_events=recent_events,
-            max_actions=max_actions,
             cwd=workdir,
         )
+        # The orchestrator agent runs with the state files in reach; reload
+        # rather than trust a view taken before it ran.
+        state_cache.invalidate()
 
         d, actions, notes = _validate_decision(decision)
         recent_events.append({"iteration": iteration, "orchestrator": {"decision": d, "actions": actions, "notes": notes}})
 
         if d == "COMPLETE":
-            state = _read_json(paths.state_file)
-            incomplete, total = _dispatch_unit_completion(state)
-            exit_code = _exit_code_from_state(state)
+            view = state_cache.get()
+            incomplete, total = _dispatch_unit_completion(view)
+            exit_code = _exit_code_from_state(view)
             if exit_code == 0:
                 print(f"[loop] COMPLETE: {notes}")
             else:
                 print(f"[loop] HALT: {notes}")
             print(f"[loop] dispatch_units incomplete={incomplete}/{total}")
             if exit_code == 2:
-                _print_pending_decisions(state)
+                _print_pending_decisions(view.state)
             return exit_code
 
         action_list = ", ".join(a["type"] for a in actions) if actions else "(none)"
@@ -417,82 +959,25 @@ def run_loop_llm(
             t = action["type"]
             if t == "halt":
                 recent_events.append({"iteration": iteration, "action": t, "success": True})
-                state = _read_json(paths.state_file)
-                exit_code = _exit_code_from_state(state)
+                view = state_cache.get()
+                exit_code = _exit_code_from_state(view)
                 if exit_code == 0:
                     print("[loop] COMPLETE")
                 else:
                     print("[loop] HALT")
                 if exit_code == 2:
-                    _print_pending_decisions(state)
+                    _print_pending_decisions(view.state)
                 return exit_code
 
-            if t == "assign_dispatch":
-                prompt = _build_assignment_prompt(paths)
-                try:
-                    wrapper_bin = resolve_codeagent_wrapper()
-                except FileNotFoundError as e:
-                    raise RuntimeError(str(e)) from e
-                code, stdout, stderr = _run(
-                    [wrapper_bin, "--backend", assign_backend, "-"],
-                    input_text=prompt,
-                    cwd=workdir,
-                )
-                if code != 0:
-                    raise RuntimeError(f"assign_dispatch failed (exit {code}): {stderr.strip() or stdout.strip()}")
-                assignments = _json_from_text(stdout)
-                if not isinstance(assignments, dict):
-                    raise ValueError("assign_dispatch output is not a JSON object")
-                _apply_assignments(paths.state_file, assignments)
-                recent_events.append({"iteration": iteration, "action": t, "success": True})
-                print("[loop] assign_dispatch: ok")
-                continue
-
-            if t == "dispatch_batch":
-                payload = _run_python_script(
-                    scripts_dir / "dispatch_batch.py",
-                    [str(paths.state_file), "--workdir", str(workdir)],
-                    cwd=workdir,
-                )
-                recent_events.append({"iteration": iteration, "action": t, "success": bool(payload.get("success")), "message": payload.get("message")})
-                print(f"[loop] dispatch_batch: {payload.get('message')}")
-                continue
-
-            if t == "dispatch_reviews":
-                payload = _run_python_script(
-                    scripts_dir / "dispatch_reviews.py",
-                    [str(paths.state_file), "--workdir", str(workdir), "--batch"],
-                    cwd=workdir,
-                )
-                recent_events.append({"iteration": iteration, "action": t, "success": bool(payload.get("success")), "message": payload.get("message")})
-                print(f"[loop] dispatch_reviews: {payload.get('message')}")
-                continue
-
-            if t == "consolidate_reviews":
-                payload = _run_python_script(
-                    scripts_dir / "consolidate_reviews.py",
-                    [str(paths.state_file)],
-                    cwd=workdir,
-                )
-                recent_events.append({"iteration": iteration, "action": t, "success": bool(payload.get("success")), "message": payload.get("message")})
-                print(f"[loop] consolidate_reviews: {payload.get('message')}")
-                continue
-
-            if t == "sync_pulse":
-                payload = _run_python_script(
-                    scripts_dir / "sync_pulse.py",
-                    [str(paths.state_file), str(paths.pulse_file)],
-                    cwd=workdir,
-                )
-                recent_events.append({"iteration": iteration, "action": t, "success": bool(payload.get("success")), "message": payload.get("message")})
-                print(f"[loop] sync_pulse: {payload.get('message')}")
-                continue
+            event, display = run_action(action)
+            recent_events.append({"iteration": iteration, "action": t, **event})
+            print(f"[loop] {t}: {display}")
 
-        state = _read_json(paths.state_file)
-        if _pending_decisions(state):
-            _print_pending_decisions(state)
+        view = state_cache.get()
+        if _pending_decisions(view.state):
+            _print_pending_decisions(view.state)
             return 2
-        incomplete, total = _dispatch_unit_completion(state)
+        incomplete, total = _dispatch_unit_completion(view)
         recent_events.append({"iteration": iteration, "dispatch_units": {"incomplete": incomplete, "total": total}})
         print(f"[loop] dispatch_units incomplete={incomplete}/{total}")
         if total == 0 or incomplete == 0:
@@ -533,21 +1018,39 @@ def run_loop_deterministic(
         print(f"[loop] tasks_file={paths.tasks_file}")
     print(f"[loop] workdir={workdir}")
 
-    _ensure_assignments(assign_backend=assign_backend, paths=paths, workdir=workdir)
+    wrapper_bin = _resolve_wrapper_bin()
+    state_cache = _StateCache(paths.state_file)
+    _ensure_assignments(wrapper_bin=wrapper_bin, assign_backend=assign_backend, paths=paths, workdir=workdir, state_cache=state_cache)
+
+    sync_pulse_call = (scripts_dir / "sync_pulse.py", [str(paths.state_file), str(paths.pulse_file)])
+
+    pulse_synced_stamp: Optional[Tuple[int, int, int]] = None
+
+    def sync_pulse() -> None:
+        nonlocal pulse_synced_stamp
+        stamp = _state_stamp(paths.state_file)
+        if stamp == pulse_synced_stamp:
+            print(f"[loop] sync_pulse: {PULSE_SKIPPED_MESSAGE}")
+            return
+        payload = _run_python_script(sync_pulse_call[0], sync_pulse_call[1], cwd=workdir)
+        if payload.get("success"):
+            pulse_synced_stamp = stamp
+        print(f"[loop] sync_pulse: {payload.get('message')}")
 
     last_incomplete: Optional[int] = None
+    last_fingerprint: Optional[bytes] = None
     stagnant_rounds = 0
 
     for iteration in range(1, max_iterations + 1):
-        state = _read_json(paths.state_file)
-        if _pending_decisions(state):
-            _print_pending_decisions(state)
+        view = state_cache.get()
+        if _pending_decisions(view.state):
+            _print_pending_decisions(view.state)
             return 2
 
-        missing = _missing_owner_agents(state)
+        missing = _missing_owner_agents(view)
         if missing:
             print(f"[loop] missing owner_agent for dispatch units: {', '.join(missing[:10])}")
-            _ensure_assignments(assign_backend=assign_backend, paths=paths, workdir=workdir)
+            _ensure_assignments(wrapper_bin=wrapper_bin, assign_backend=assign_backend, paths=paths, workdir=workdir, state_cache=state_cache)
 
         payload = _run_python_script(
             scripts_dir / "dispatch_batch.py",
@@ -557,7 +1060,7 @@ def run_loop_deterministic(
         if not payload.get("success"):
             msg = str(payload.get("message") or "")
             if "Missing required dispatch fields" in msg:
-                _ensure_assignments(assign_backend=assign_backend, paths=paths, workdir=workdir)
+                _ensure_assignments(wrapper_bin=wrapper_bin, assign_backend=assign_backend, paths=paths, workdir=workdir, state_cache=state_cache)
                 payload = _run_python_script(
                     scripts_dir / "dispatch_batch.py",
                     [str(paths.state_file), "--workdir", str(workdir)],
@@ -568,12 +1071,23 @@ def run_loop_deterministic(
         else:
             print(f"[loop] dispatch_batch: {payload.get('message')}")
 
-        payload = _run_python_script(
-            scripts_dir / "dispatch_reviews.py",
-            [str(paths.state_file), "--workdir", str(workdir), "--batch"],
-            cwd=workdir,
-        )
-        print(f"[loop] dispatch_reviews: {payload.get('message')}")
+        # sync_pulse only reads AGENT_STATE.json (which dispatch_reviews replaces
+        # atomically), so it runs alongside dispatch_reviews and reflects the
+        # state dispatch_batch left behind. consolidate_reviews feeds the next
+        # dispatch_batch and stays serial; the pulse catches up next iteration
+        # or with a final sync before returning.
+        reviews_call = (scripts_dir / "dispatch_reviews.py", [str(paths.state_file), "--workdir", str(workdir), "--batch"])
+        stamp = _state_stamp(paths.state_file)
+        if stamp == pulse_synced_stamp:
+            review_payload = _run_python_script(reviews_call[0], reviews_call[1], cwd=workdir)
+            print(f"[loop] dispatch_reviews: {review_payload.get('message')}")
+            print(f"[loop] sync_pulse: {PULSE_SKIPPED_MESSAGE}")
+        else:
+            review_payload, pulse_payload = _run_parallel([reviews_call, sync_pulse_call], cwd=workdir)
+            if pulse_payload.get("success"):
+                pulse_synced_stamp = stamp
+            print(f"[loop] dispatch_reviews: {review_payload.get('message')}")
+            print(f"[loop] sync_pulse: {pulse_payload.get('message')}")
 
         payload = _run_python_script(
             scripts_dir / "consolidate_reviews.py",
@@ -582,37 +1096,43 @@ def run_loop_deterministic(
         )
         print(f"[loop] consolidate_reviews: {payload.get('message')}")
 
-        payload = _run_python_script(
-            scripts_dir / "sync_pulse.py",
-            [str(paths.state_file), str(paths.pulse_file)],
-            cwd=workdir,
-        )
-        print(f"[loop] sync_pulse: {payload.get('message')}")
-
-        state = _read_json(paths.state_file)
-        if _pending_decisions(state):
-            _print_pending_decisions(state)
+        # dispatch_batch, dispatch_reviews and consolidate_reviews all rewrite
+        # AGENT_STATE.json; sync_pulse does not.
+        state_cache.invalidate()
+        view = state_cache.get()
+        if _pending_decisions(view.state):
+            sync_pulse()
+            _print_pending_decisions(view.state)
             return 2
 
-        incomplete, total = _dispatch_unit_completion(state)
+        incomplete, total = _dispatch_unit_completion(view)
         print(f"[loop] iteration={iteration} dispatch_units incomplete={incomplete}/{total}")
         if total == 0 or incomplete == 0:
+            sync_pulse()
             print("[loop] COMPLETE")
             return 0
 
-        if last_incomplete is not None and incomplete >= last_incomplete:
+        # A round that changed no task status/owner at all counts double:
+        # the next rounds would rerun the same scripts on the same state.
+        fingerprint = _state_fingerprint(view.state)
+        if fingerprint == last_fingerprint:
+            stagnant_rounds += 2
+        elif last_incomplete is not None and incomplete >= last_incomplete:
             stagnant_rounds += 1
         else:
             stagnant_rounds = 0
         last_incomplete = incomplete
+        last_fingerprint = fingerprint
 
-        if stagnant_rounds >= 5:
-            print("[loop] no progress for 5 rounds; stopping")
+        if stagnant_rounds >= STAGNATION_LIMIT:
+            sync_pulse()
+            print("[loop] no progress in recent rounds; stopping")
             return 1
 
         if sleep_seconds > 0:
             time.sleep(sleep_seconds)
 
+    sync_pulse()
     print("[loop] reached max iterations")
     return 1
 
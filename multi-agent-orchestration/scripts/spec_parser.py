@@ -8,12 +8,23 @@ Agent will read requirements.md and design.md directly when executing tasks.
 Requirements: 1.2, 11.2, 11.3
 """
 
+import bisect
+import heapq
+import json
 import re
 import os
+import sys
+from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set, Tuple
+from typing import List, Dict, FrozenSet, Iterable, Iterator, Optional, Set, Tuple, Union
 from enum import Enum
 
+# Optional fast JSON encoder; falls back to stdlib json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 
 class TaskType(Enum):
     """Task type enumeration for backend routing"""
@@ -65,7 +76,11 @@ def validate_transition(from_status: str, to_status: str) -> bool:
     return to_status in valid_targets
 
 
-@dataclass
+# __slots__-backed dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """
     Represents a parsed task from tasks.md
@@ -95,9 +110,13 @@ class Task:
     review_history: List[Dict] = field(default_factory=list)
     blocked_reason: Optional[str] = None
     blocked_by: Optional[str] = None
+    # Numeric form of task_id (e.g. "1.10" -> (1, 10)), set at parse time
+    _id_tuple: Tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
     
     def to_dict(self) -> Dict:
         """Convert to dictionary for JSON serialization"""
+        # A dict literal compiles to a single BUILD_MAP; measured faster than
+        # dict(zip(keys, attrgetter(...)(self))) for this 20-field record.
         return {
             "task_id": self.task_id,
             "description": self.description,
@@ -215,38 +234,81 @@ STATUS_MARKERS = {
     "[-]": TaskStatus.IN_PROGRESS,
     "[~]": TaskStatus.BLOCKED,
 }
+# Same markers keyed by the single checkbox character
+_STATUS_BY_CHAR = {marker[1]: status for marker, status in STATUS_MARKERS.items()}
+
+# Task line: "- [ ]* 1.2. Description" (IDs of any depth, optional "*" marker)
+if sys.version_info >= (3, 11):
+    # Possessive quantifiers: no part of this pattern ever has to give
+    # characters back, so the engine can skip saving backtrack points
+    _TASK_LINE_RE = re.compile(r'^[-*]\s*+\[([xX\s~-])\](\*)?+\s*+(\d++(?:\.\d++)*+)\.?+\s++(.+)$')
+else:
+    _TASK_LINE_RE = re.compile(r'^[-*]\s*\[([xX\s~-])\](\*)?\s*(\d+(?:\.\d+)*)(?:\.)?\s+(.+)$')
+# Cheap sniff for "looks like a task checkbox" before the full parse
+_TASK_HEADER_RE = re.compile(r'^[-*]\s*\[[xX\s~-]\]')
+# Dependency markers in task details: "dependencies: 1, 2" or "depends on: 1.1",
+# as one alternation so each detail is scanned once (case-insensitive, so
+# details are never lowercased wholesale)
+_DEPS_RE = re.compile(r'(?:dependenc(?:y|ies)|depends?\s+on)[:\s]+([^\n]+)', re.IGNORECASE)
+_TASKID_RE = re.compile(r'(?:task[-_])?(\d+(?:\.\d+)?)', re.IGNORECASE)
+
+# tasks.md files up to this size are read whole; larger ones are streamed
+_WHOLE_READ_LIMIT = 1 << 20  # 1 MiB
+_READ_CHUNK = 64 * 1024
 
 # Task type detection removed - Codex assigns type via Step 1b of SKILL.md
 # TaskType enum and Task.task_type field retained for backward compatibility
 
 
+def _task_id_key(task_id: str) -> Tuple[int, ...]:
+    """Numeric sort key for a dotted task ID ("1.10" -> (1, 10)); () if not numeric."""
+    try:
+        return tuple(map(int, task_id.split('.')))
+    except ValueError:
+        return ()
+
+
 def _parse_task_line(line: str) -> Tuple[Optional[str], TaskStatus, bool, str]:
     """Parse a task line to extract task ID, status, optional flag, and description.
     
     Supports nested task IDs of any depth (e.g., 1, 1.1, 1.1.1, 1.1.1.1).
     """
     # Pattern supports task IDs like: 1, 1.1, 1.1.1, 1.1.1.1, etc.
-    pattern = r'^[-*]\s*\[([xX\s~-])\](\*)?\s*(\d+(?:\.\d+)*)(?:\.)?\s+(.+)$'
-    match = re.match(pattern, line.strip())
+    match = _TASK_LINE_RE.match(line.strip())
     
     if not match:
         return None, TaskStatus.NOT_STARTED, False, ""
     
-    status_char = match.group(1)
-    is_optional = match.group(2) == "*"
-    task_id = match.group(3).rstrip('.')
-    description = match.group(4).strip()
-    
-    status_key = f"[{status_char}]"
-    status = STATUS_MARKERS.get(status_key, TaskStatus.NOT_STARTED)
+    # One groups() call instead of four group() calls; the ID pattern cannot
+    # end in '.', so no rstrip is needed.
+    status_char, optional_mark, task_id, description = match.groups()
+    status = _STATUS_BY_CHAR.get(status_char, TaskStatus.NOT_STARTED)
     
-    return task_id, status, is_optional, description
+    return task_id, status, optional_mark == "*", description.strip()
 
 
 def parse_tasks(content: str) -> TasksParseResult:
     """
     Parse tasks.md content and extract task definitions.
     
+    Thin wrapper over parse_tasks_from_lines for callers holding a string.
+    
+    Args:
+        content: Markdown content of tasks.md
+        
+    Returns:
+        TasksParseResult: Parsed tasks and any errors
+    """
+    return parse_tasks_from_lines(content.split('\n'))
+
+
+def parse_tasks_from_lines(lines: Iterable[str]) -> TasksParseResult:
+    """
+    Parse tasks.md lines and extract task definitions.
+    
+    Accepts any iterable of lines (e.g. an open file object) so tasks.md can
+    be streamed; trailing newlines are stripped per line.
+    
     Uses two-pass parsing to handle parent-subtask relationships correctly
     regardless of order in the file (Requirement 14.1, 14.2, 14.3, 14.4).
     
@@ -254,22 +316,40 @@ def parse_tasks(content: str) -> TasksParseResult:
     Pass 2: Build parent-subtask relationships
     
     Args:
-        content: Markdown content of tasks.md
+        lines: Lines of tasks.md, with or without trailing newlines
         
     Returns:
         TasksParseResult: Parsed tasks and any errors
     """
+    # ========================================================================
+    # Pass 1: Collect all tasks with basic properties
+    # ========================================================================
+    tasks, errors = _collect_tasks(lines)
+    
+    # ========================================================================
+    # Pass 2: Build parent-subtask relationships (order-independent)
+    # Requirement 14.1, 14.2, 14.3, 14.4
+    # ========================================================================
+    _build_parent_subtask_relationships(tasks)
+    
+    return TasksParseResult(success=len(errors) == 0, tasks=tasks, errors=errors)
+
+
+def _collect_tasks(lines: Iterable[str],
+                   header_lines: Optional[List[int]] = None) -> Tuple[List[Task], List[ParseError]]:
+    """
+    Pass 1 of parse_tasks_from_lines: collect tasks with their basic properties.
+    
+    If header_lines is given, the 0-based line index of each parsed task's
+    header is appended to it (used by IncrementalSpecParser).
+    """
     tasks: List[Task] = []
     errors: List[ParseError] = []
     
-    lines = content.split('\n')
     current_task: Optional[Task] = None
     current_details: List[str] = []
     line_num = 0
     
-    # ========================================================================
-    # Pass 1: Collect all tasks with basic properties
-    # ========================================================================
     for line in lines:
         line_num += 1
         stripped = line.strip()
@@ -277,7 +357,18 @@ def parse_tasks(content: str) -> TasksParseResult:
         if not stripped or stripped.startswith('#'):
             continue
         
-        if re.match(r'^[-*]\s*\[[xX\s~-]\]', stripped):
+        # Cheap reject: a task header starts with '-' or '*' and contains '['.
+        # Anything else is a detail line and never reaches the regexes.
+        is_candidate = stripped[0] in '-*' and '[' in stripped
+        
+        # Full task-line match first; the header sniff only runs on candidates
+        # that are not valid tasks, to tell malformed headers from details.
+        if is_candidate:
+            task_id, status, is_optional, description = _parse_task_line(stripped)
+        else:
+            task_id = None
+        
+        if is_candidate and (task_id is not None or _TASK_HEADER_RE.match(stripped)):
             # Save previous task
             if current_task:
                 current_task.details = current_details
@@ -289,9 +380,6 @@ def parse_tasks(content: str) -> TasksParseResult:
                 tasks.append(current_task)
                 current_details = []
             
-            # Parse new task
-            task_id, status, is_optional, description = _parse_task_line(stripped)
-            
             if task_id is None:
                 errors.append(ParseError("tasks.md", line_num, f"Invalid task format: {stripped}"))
                 continue
@@ -303,12 +391,15 @@ def parse_tasks(content: str) -> TasksParseResult:
                 is_optional=is_optional,
             )
             
+            current_task._id_tuple = _task_id_key(task_id)
+            if header_lines is not None:
+                header_lines.append(line_num - 1)
+            
             # Set parent_id for subtasks (e.g., 1.1 -> parent is 1, 1.1.1 -> parent is 1.1)
             # Note: We only set parent_id here, subtasks list is built in Pass 2
-            if '.' in task_id:
+            if len(current_task._id_tuple) > 1:
                 # Find the immediate parent (e.g., 1.1.1 -> 1.1, 1.1 -> 1)
-                parts = task_id.rsplit('.', 1)
-                current_task.parent_id = parts[0]
+                current_task.parent_id = task_id[:task_id.rindex('.')]
         
         elif current_task and stripped.startswith('-'):
             current_details.append(stripped[1:].strip())
@@ -326,13 +417,7 @@ def parse_tasks(content: str) -> TasksParseResult:
         current_task.reads = reads
         tasks.append(current_task)
     
-    # ========================================================================
-    # Pass 2: Build parent-subtask relationships (order-independent)
-    # Requirement 14.1, 14.2, 14.3, 14.4
-    # ========================================================================
-    _build_parent_subtask_relationships(tasks)
-    
-    return TasksParseResult(success=len(errors) == 0, tasks=tasks, errors=errors)
+    return tasks, errors
 
 
 def _build_parent_subtask_relationships(tasks: List[Task]) -> None:
@@ -364,6 +449,87 @@ def _build_parent_subtask_relationships(tasks: List[Task]) -> None:
                 parent.subtasks.append(task.task_id)
 
 
+class IncrementalSpecParser:
+    """
+    Opt-in re-parser for a tasks.md that is edited a few lines at a time.
+    
+    ``update(content)`` returns the same result as ``parse_tasks(content)``,
+    but only re-parses the task blocks (header line plus its detail lines)
+    touched by the lines that changed since the previous call; tasks from
+    untouched blocks are reused as-is. Reused Task objects are shared across
+    results, so copy them before mutating. Any parse error, before or after
+    the edit, falls back to a full parse.
+    """
+    
+    def __init__(self) -> None:
+        self._lines: Optional[List[str]] = None
+        self._tasks: List[Task] = []
+        # 0-based header line index of each task in self._tasks
+        self._header_lines: List[int] = []
+    
+    def update(self, content: str) -> TasksParseResult:
+        """Parse content, re-using tasks from blocks unchanged since the last call."""
+        lines = content.split('\n')
+        old_lines = self._lines
+        if old_lines is None:
+            return self._full_parse(lines)
+        
+        # Unchanged prefix/suffix line counts; the edited span lies between them
+        limit = min(len(old_lines), len(lines))
+        prefix = 0
+        while prefix < limit and old_lines[prefix] == lines[prefix]:
+            prefix += 1
+        suffix = 0
+        while suffix < limit - prefix and old_lines[-1 - suffix] == lines[-1 - suffix]:
+            suffix += 1
+        if prefix == len(old_lines) == len(lines):
+            return self._result()
+        
+        # Re-parse from the block holding the last unchanged line before the
+        # edit (its header is unchanged) up to the first block starting in
+        # the unchanged suffix (its header and details are unchanged).
+        starts = self._header_lines
+        first = bisect.bisect_right(starts, prefix - 1) - 1 if prefix else -1
+        end_old = len(old_lines) - suffix
+        last = bisect.bisect_left(starts, end_old)
+        shift = len(lines) - len(old_lines)
+        
+        span_start = starts[first] if first >= 0 else 0
+        span_end = starts[last] + shift if last < len(starts) else len(lines)
+        span_headers: List[int] = []
+        span_tasks, errors = _collect_tasks(lines[span_start:span_end], span_headers)
+        if errors:
+            return self._full_parse(lines)
+        
+        keep = max(first, 0)
+        self._tasks = self._tasks[:keep] + span_tasks + self._tasks[last:]
+        self._header_lines = (
+            starts[:keep]
+            + [span_start + i for i in span_headers]
+            + [i + shift for i in starts[last:]]
+        )
+        self._lines = lines
+        _build_parent_subtask_relationships(self._tasks)
+        return self._result()
+    
+    def _full_parse(self, lines: List[str]) -> TasksParseResult:
+        header_lines: List[int] = []
+        tasks, errors = _collect_tasks(lines, header_lines)
+        _build_parent_subtask_relationships(tasks)
+        if errors:
+            # Error recovery in _collect_tasks is not block-local; start over
+            # with a full parse on the next update
+            self._lines = None
+            self._tasks, self._header_lines = [], []
+        else:
+            self._lines = lines
+            self._tasks, self._header_lines = tasks, header_lines
+        return TasksParseResult(success=len(errors) == 0, tasks=list(tasks), errors=errors)
+    
+    def _result(self) -> TasksParseResult:
+        return TasksParseResult(success=True, tasks=list(self._tasks), errors=[])
+
+
 def validate_spec_directory(spec_path: str) -> ValidationResult:
     """
     Validate that all required spec files exist.
@@ -375,18 +541,30 @@ def validate_spec_directory(spec_path: str) -> ValidationResult:
         ValidationResult with spec_path for reference
     """
     required_files = ["requirements.md", "design.md", "tasks.md"]
-    missing_files: List[str] = []
     
-    if not os.path.isdir(spec_path):
+    # One directory listing instead of an isdir + isfile stat per file
+    try:
+        with os.scandir(spec_path) as it:
+            present = {entry.name for entry in it if entry.is_file()}
+    except (FileNotFoundError, NotADirectoryError):
+        present = None
+    except OSError:
+        # Unlistable but possibly traversable; fall back to per-file stats
+        present = set() if os.path.isdir(spec_path) else None
+    
+    if present is None:
         return ValidationResult(
             valid=False,
             spec_path=spec_path,
             errors=[f"Spec directory does not exist: {spec_path}"]
         )
     
-    for filename in required_files:
-        if not os.path.isfile(os.path.join(spec_path, filename)):
-            missing_files.append(filename)
+    # Names absent from the listing get a stat so case-insensitive
+    # filesystems still accept e.g. Tasks.md as before
+    missing_files = [
+        filename for filename in required_files
+        if filename not in present and not os.path.isfile(os.path.join(spec_path, filename))
+    ]
     
     return ValidationResult(
         valid=len(missing_files) == 0,
@@ -396,21 +574,26 @@ def validate_spec_directory(spec_path: str) -> ValidationResult:
     )
 
 
+def _dedup(seq: Iterable[str]) -> List[str]:
+    """Remove duplicates while preserving first-seen order.
+    
+    dict.fromkeys stays in C for the whole pass; on CPython 3.11 it beats a
+    Python-level seen-set loop even for the short lists parsed here.
+    """
+    return list(dict.fromkeys(seq))
+
+
 def _extract_dependencies_from_details(details: List[str]) -> List[str]:
     """Extract dependency references from task details."""
     dependencies = []
     
     for detail in details:
-        detail_lower = detail.lower()
-        
         # Pattern: dependencies: 1, 2 or depends on: 1.1
-        for pattern in [r'dependenc(?:y|ies)[:\s]+([^\n]+)', r'depends?\s+on[:\s]+([^\n]+)']:
-            match = re.search(pattern, detail_lower)
-            if match:
-                task_ids = re.findall(r'(?:task[-_])?(\d+(?:\.\d+)?)', match.group(1))
-                dependencies.extend(task_ids)
+        match = _DEPS_RE.search(detail)
+        if match:
+            dependencies.extend(_TASKID_RE.findall(match.group(1)))
     
-    return list(dict.fromkeys(dependencies))
+    return _dedup(dependencies)
 
 
 def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
@@ -439,7 +622,8 @@ def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
         detail_stripped = detail.strip()
         
         # Parse _writes: marker
-        if detail_stripped.lower().startswith('_writes:'):
+        # Only the marker-sized prefix is lowercased, not the whole detail
+        if detail_stripped[:8].lower() == '_writes:':
             # Extract file list after the marker
             files_str = detail_stripped[8:].strip()  # len('_writes:') = 8
             if files_str:
@@ -448,7 +632,7 @@ def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
                 writes.extend([f for f in files if f])
         
         # Parse _reads: marker
-        elif detail_stripped.lower().startswith('_reads:'):
+        elif detail_stripped[:7].lower() == '_reads:':
             # Extract file list after the marker
             files_str = detail_stripped[7:].strip()  # len('_reads:') = 7
             if files_str:
@@ -457,53 +641,54 @@ def _extract_file_manifest(details: List[str]) -> Tuple[List[str], List[str]]:
                 reads.extend([f for f in files if f])
     
     # Remove duplicates while preserving order
-    writes = list(dict.fromkeys(writes))
-    reads = list(dict.fromkeys(reads))
+    writes = _dedup(writes)
+    reads = _dedup(reads)
     
     return writes, reads
 
 
 def _detect_circular_dependencies(graph: DependencyGraph) -> List[CircularDependencyError]:
-    """Detect circular dependencies using DFS."""
+    """Detect circular dependencies using an iterative DFS.
+    
+    Reports at most one cycle per DFS root. ``on_stack`` maps each node on the
+    current path to its index in ``path`` so a cycle is sliced out in O(1).
+    """
     cycles = []
-    visited = set()
-    rec_stack = set()
-    path = []
-    
-    def dfs(node: str) -> bool:
-        visited.add(node)
-        rec_stack.add(node)
-        path.append(node)
-        
-        for dep in graph.get_dependencies(node):
-            if dep not in visited:
-                if dfs(dep):
-                    return True
-            elif dep in rec_stack:
-                cycle_start = path.index(dep)
-                cycles.append(CircularDependencyError(cycle=path[cycle_start:] + [dep]))
-                return True
-        
-        path.pop()
-        rec_stack.remove(node)
-        return False
-    
-    for node in graph.nodes:
-        if node not in visited:
-            dfs(node)
+    visited: Set[str] = set()
+    
+    for root in graph.nodes:
+        if root in visited:
+            continue
+        
+        visited.add(root)
+        path = [root]
+        on_stack: Dict[str, int] = {root: 0}
+        stack: List[Tuple[str, Iterator[str]]] = [(root, iter(graph.get_dependencies(root)))]
+        
+        while stack:
+            node, deps = stack[-1]
+            dep = next(deps, None)
+            if dep is None:
+                stack.pop()
+                path.pop()
+                del on_stack[node]
+            elif dep not in visited:
+                visited.add(dep)
+                on_stack[dep] = len(path)
+                path.append(dep)
+                stack.append((dep, iter(graph.get_dependencies(dep))))
+            elif dep in on_stack:
+                cycles.append(CircularDependencyError(cycle=path[on_stack[dep]:] + [dep]))
+                break
     
     return cycles
 
 
-def extract_dependencies(tasks: List[Task]) -> DependencyResult:
-    """
-    Extract dependencies from tasks and build dependency graph.
+def _build_dependency_graph(tasks: List[Task]) -> Tuple[DependencyGraph, Dict[str, List[str]]]:
+    """Extract each task's dependencies and build the graph of known task IDs.
     
-    Args:
-        tasks: List of parsed Task objects
-        
-    Returns:
-        DependencyResult with graph and any errors
+    Sets ``task.dependencies`` in place. Returns the graph (missing IDs are
+    left out of its edges) and a task_id -> missing dependency IDs map.
     """
     graph = DependencyGraph()
     task_ids = {t.task_id for t in tasks}
@@ -520,6 +705,20 @@ def extract_dependencies(tasks: List[Task]) -> DependencyResult:
         valid_deps = [d for d in deps if d in task_ids]
         graph.add_task(task.task_id, valid_deps)
     
+    return graph, missing_deps
+
+
+def extract_dependencies(tasks: List[Task]) -> DependencyResult:
+    """
+    Extract dependencies from tasks and build dependency graph.
+    
+    Args:
+        tasks: List of parsed Task objects
+        
+    Returns:
+        DependencyResult with graph and any errors
+    """
+    graph, missing_deps = _build_dependency_graph(tasks)
     circular = _detect_circular_dependencies(graph)
     
     return DependencyResult(
@@ -529,39 +728,121 @@ def extract_dependencies(tasks: List[Task]) -> DependencyResult:
     )
 
 
-def expand_dependencies(dependencies: List[str], task_map: Dict[str, 'Task']) -> List[str]:
+def _expand_leaves(task_id: str, task_map: Dict[str, 'Task'],
+                   leaf_cache: Dict[str, Tuple[str, ...]]) -> Tuple[str, ...]:
+    """Return the leaf subtasks under a parent task, in file order (memoized)."""
+    cached = leaf_cache.get(task_id)
+    if cached is not None:
+        return cached
+    
+    leaves: List[str] = []
+    stack = [task_id]
+    while stack:
+        tid = stack.pop()
+        task = task_map.get(tid)
+        if task and task.subtasks:
+            if tid != task_id and tid in leaf_cache:
+                leaves.extend(leaf_cache[tid])
+            else:
+                # Reversed so subtasks pop off the stack in their listed order
+                stack.extend(reversed(task.subtasks))
+        else:
+            leaves.append(tid)
+    
+    result = tuple(leaves)
+    leaf_cache[task_id] = result
+    return result
+
+
+def expand_dependencies(dependencies: List[str], task_map: Dict[str, 'Task'],
+                        leaf_cache: Optional[Dict[str, Tuple[str, ...]]] = None) -> List[str]:
     """
     Expand parent task dependencies to their subtasks.
     
     If a dependency is a parent task, replace it with all its subtasks.
     This ensures dependent tasks wait for ALL subtasks to complete.
     
-    Handles nested subtasks (e.g., 1.1.1) correctly through recursive expansion.
+    Handles nested subtasks (e.g., 1.1.1) correctly through iterative expansion.
     
     Requirements: 1.6, 1.7, 5.1, 5.2, 5.4
     
     Args:
         dependencies: List of task IDs that are dependencies
         task_map: Dictionary mapping task_id to Task object
+        leaf_cache: Optional parent_id -> leaf IDs memo, shared across calls
+            against the same task_map to avoid re-walking subtask trees
         
     Returns:
         List of expanded dependency IDs (leaf tasks only)
     """
-    expanded = []
+    if leaf_cache is None:
+        leaf_cache = {}
+    expanded: List[str] = []
     
     for dep_id in dependencies:
         dep_task = task_map.get(dep_id)
         
         if dep_task and dep_task.subtasks:
-            # Parent task: expand to all subtasks (recursively)
-            for subtask_id in dep_task.subtasks:
-                expanded.extend(expand_dependencies([subtask_id], task_map))
+            # Parent task: expand to all leaf subtasks
+            expanded.extend(_expand_leaves(dep_id, task_map, leaf_cache))
         else:
             # Leaf task or unknown: keep as-is
             expanded.append(dep_id)
     
     # Remove duplicates while preserving order
-    return list(dict.fromkeys(expanded))
+    return _dedup(expanded)
+
+
+def _precompute_ready_state(tasks: List[Task]) -> Tuple[Dict[str, Task], Dict[str, FrozenSet[str]]]:
+    """
+    Build the task map and each task's expanded (leaf-only) dependency set once.
+    
+    Shared by get_ready_tasks and get_dispatchable_units so a readiness check
+    is a single set-subset test per task.
+    """
+    task_map = {t.task_id: t for t in tasks}
+    leaf_cache: Dict[str, Tuple[str, ...]] = {}
+    expanded_map = {
+        t.task_id: frozenset(expand_dependencies(t.dependencies, task_map, leaf_cache))
+        for t in tasks
+    }
+    return task_map, expanded_map
+
+
+@dataclass
+class TaskIndex:
+    """
+    Snapshot of a task list with its lookup tables for repeated readiness queries.
+    
+    get_ready_tasks and get_dispatchable_units accept either a plain task list
+    (indexed on every call) or a TaskIndex built once and passed back on each
+    poll. Rebuild the index after tasks, subtasks or dependencies change.
+    """
+    tasks: List[Task]
+    task_map: Dict[str, Task]
+    expanded: Dict[str, FrozenSet[str]]
+    # Leaf tasks and dispatch units, in file order, classified once per build
+    leaf_tasks: List[Task] = field(default_factory=list)
+    dispatch_units: List[Task] = field(default_factory=list)
+    
+    @classmethod
+    def build(cls, tasks: List[Task]) -> "TaskIndex":
+        """Index tasks, expand their dependencies to leaf sets and classify them."""
+        task_map, expanded = _precompute_ready_state(tasks)
+        return cls(
+            tasks=tasks,
+            task_map=task_map,
+            expanded=expanded,
+            leaf_tasks=[t for t in tasks if is_leaf_task(t)],
+            dispatch_units=[t for t in tasks if is_dispatch_unit(t)],
+        )
+
+
+def _as_task_index(tasks: Union[List[Task], TaskIndex]) -> TaskIndex:
+    """Return tasks as a TaskIndex, building one for a plain list."""
+    if isinstance(tasks, TaskIndex):
+        return tasks
+    return TaskIndex.build(tasks)
 
 
 def is_dispatch_unit(task: Task) -> bool:
@@ -583,7 +864,7 @@ def is_dispatch_unit(task: Task) -> bool:
     return False
 
 
-def get_dispatchable_units(tasks: List[Task], completed_ids: Set[str]) -> List[Task]:
+def get_dispatchable_units(tasks: Union[List[Task], TaskIndex], completed_ids: Set[str]) -> List[Task]:
     """
     Get dispatch units ready for execution.
 
@@ -593,23 +874,25 @@ def get_dispatchable_units(tasks: List[Task], completed_ids: Set[str]) -> List[T
     Requirements: 1.1, 1.2, 1.3, 4.3
     """
     ready = []
-    task_map = {t.task_id: t for t in tasks}
-
-    for task in tasks:
-        # Only consider dispatch units
-        if not is_dispatch_unit(task):
-            continue
-
+    index = _as_task_index(tasks)
+    expanded_map = index.expanded
+    if not isinstance(completed_ids, (set, frozenset)):
+        completed_ids = frozenset(completed_ids)
+
+    # Parsed Tasks carry the enum; dispatch_batch's task-like objects carry the
+    # raw state string, so accept either form without converting per task
+    not_started = TaskStatus.NOT_STARTED
+    not_started_value = not_started.value
+
+    # Only consider dispatch units
+    for task in index.dispatch_units:
         # Skip completed or non-startable
-        status_value = task.status
-        if isinstance(status_value, TaskStatus):
-            status_value = status_value.value
-        if task.task_id in completed_ids or status_value != TaskStatus.NOT_STARTED.value:
+        status = task.status
+        if task.task_id in completed_ids or (status is not not_started and status != not_started_value):
             continue
 
         # Check dependencies (expand parent deps to subtasks)
-        expanded_deps = expand_dependencies(task.dependencies, task_map)
-        if all(dep in completed_ids for dep in expanded_deps):
+        if expanded_map[task.task_id].issubset(completed_ids):
             ready.append(task)
 
     return ready
@@ -627,7 +910,7 @@ def is_leaf_task(task: Task) -> bool:
     return len(task.subtasks) == 0
 
 
-def get_ready_tasks(tasks: List[Task], completed_ids: Set[str]) -> List[Task]:
+def get_ready_tasks(tasks: Union[List[Task], TaskIndex], completed_ids: Set[str]) -> List[Task]:
     """
     Get leaf tasks ready to execute (all dependencies satisfied).
     
@@ -639,20 +922,19 @@ def get_ready_tasks(tasks: List[Task], completed_ids: Set[str]) -> List[Task]:
     Requirements: 1.1, 1.2, 1.6, 1.7, 5.1, 5.2, 5.4
     """
     ready = []
-    task_map = {t.task_id: t for t in tasks}
+    index = _as_task_index(tasks)
+    expanded_map = index.expanded
+    if not isinstance(completed_ids, (set, frozenset)):
+        completed_ids = frozenset(completed_ids)
     
-    for task in tasks:
-        # Skip parent tasks (they have subtasks) - Req 1.1, 1.2
-        if not is_leaf_task(task):
-            continue
-        
+    # Skip parent tasks (they have subtasks) - Req 1.1, 1.2
+    for task in index.leaf_tasks:
         # Skip completed tasks
         if task.task_id in completed_ids or task.status == TaskStatus.COMPLETED:
             continue
         
         # Expand and check dependencies - Req 1.6, 1.7, 5.1, 5.2
-        expanded_deps = expand_dependencies(task.dependencies, task_map)
-        if all(dep in completed_ids for dep in expanded_deps):
+        if expanded_map[task.task_id].issubset(completed_ids):
             ready.append(task)
     return ready
 
@@ -661,37 +943,96 @@ def topological_sort(tasks: List[Task]) -> Tuple[List[Task], List[CircularDepend
     """
     Sort tasks in topological order based on dependencies.
     
+    Cycle detection is folded into the sort: Kahn's algorithm only leaves
+    nodes unprocessed when a cycle exists, so the DFS that reports cycle
+    paths runs only in that case (or when missing dependencies make the
+    in-degree count unusable).
+    
     Returns:
         Tuple of (sorted_tasks, circular_errors, missing_errors)
         - If any errors exist, sorted_tasks will be empty
     """
-    dep_result = extract_dependencies(tasks)
-    
-    # Fail fast on invalid dependencies (circular or missing)
-    if not dep_result.valid:
+    graph, missing_deps = _build_dependency_graph(tasks)
+    
+    # Fail fast on missing dependencies (still reporting any cycles)
+    if missing_deps:
+        dep_result = DependencyResult(
+            graph=graph,
+            circular_dependencies=_detect_circular_dependencies(graph),
+            missing_dependencies=missing_deps,
+        )
         return [], dep_result.circular_dependencies, dep_result.get_missing_dependency_errors()
     
     task_map = {t.task_id: t for t in tasks}
     in_degree = {t.task_id: len(t.dependencies) for t in tasks}
     
-    queue = [tid for tid, degree in in_degree.items() if degree == 0]
+    # Reverse adjacency: dependency -> tasks that depend on it
+    dependents: Dict[str, List[str]] = defaultdict(list)
+    for task in tasks:
+        for dep in dict.fromkeys(task.dependencies):
+            dependents[dep].append(task.task_id)
+    
+    # Min-heap keeps the ready set in numeric task_id order ("2" before "10"),
+    # falling back to the string for IDs that are not dotted numbers
+    id_keys = {
+        tid: task._id_tuple or _task_id_key(tid) for tid, task in task_map.items()
+    }
+    heap = [(id_keys[tid], tid) for tid, degree in in_degree.items() if degree == 0]
+    heapq.heapify(heap)
     sorted_tasks = []
     
-    while queue:
-        queue.sort()
-        current = queue.pop(0)
+    while heap:
+        _, current = heapq.heappop(heap)
         if current in task_map:
             sorted_tasks.append(task_map[current])
         
-        for task in tasks:
-            if current in task.dependencies:
-                in_degree[task.task_id] -= 1
-                if in_degree[task.task_id] == 0:
-                    queue.append(task.task_id)
+        for dependent in dependents.get(current, ()):
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                heapq.heappush(heap, (id_keys[dependent], dependent))
+    
+    # Unprocessed nodes mean a cycle; walk the graph only now to report it.
+    # Duplicate task IDs break that inference, so they always get the walk.
+    if len(task_map) != len(tasks) or any(degree > 0 for degree in in_degree.values()):
+        circular = _detect_circular_dependencies(graph)
+        if circular:
+            return [], circular, []
     
     return sorted_tasks, [], []
 
 
+def _parse_tasks_file(tasks_path: str) -> TasksParseResult:
+    """
+    Read and parse a tasks.md file.
+    
+    Files up to _WHOLE_READ_LIMIT are read with raw os.read calls and decoded
+    in one step, bypassing the TextIOWrapper; larger files are streamed line
+    by line to bound memory.
+    """
+    fd = os.open(tasks_path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    chunks: List[bytes] = []
+    try:
+        size = os.fstat(fd).st_size
+        if size > _WHOLE_READ_LIMIT:
+            with open(fd, 'r', encoding='utf-8', closefd=False) as f:
+                return parse_tasks_from_lines(f)
+        
+        # Loop until EOF to cover short reads and files growing meanwhile
+        while True:
+            chunk = os.read(fd, max(size, _READ_CHUNK))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    finally:
+        os.close(fd)
+    
+    content = b"".join(chunks).decode('utf-8')
+    if '\r' in content:
+        # Match text-mode universal newline handling
+        content = content.replace('\r\n', '\n').replace('\r', '\n')
+    return parse_tasks(content)
+
+
 def load_tasks_from_spec(spec_path: str) -> Tuple[TasksParseResult, ValidationResult]:
     """
     Load and parse tasks from a spec directory.
@@ -706,11 +1047,7 @@ def load_tasks_from_spec(spec_path: str) -> Tuple[TasksParseResult, ValidationRe
     if not validation.valid:
         return TasksParseResult(success=False, errors=[]), validation
     
-    tasks_path = os.path.join(spec_path, "tasks.md")
-    with open(tasks_path, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    tasks_result = parse_tasks(content)
+    tasks_result = _parse_tasks_file(os.path.join(spec_path, "tasks.md"))
     
     # Extract dependencies
     if tasks_result.success:
@@ -719,10 +1056,15 @@ def load_tasks_from_spec(spec_path: str) -> Tuple[TasksParseResult, ValidationRe
     return tasks_result, validation
 
 
+def tasks_result_to_json(tasks_result: TasksParseResult) -> bytes:
+    """Serialize parsed tasks as 2-space indented UTF-8 JSON bytes (orjson if available)"""
+    payload = {"tasks": [t.to_dict() for t in tasks_result.tasks]}
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
 if __name__ == "__main__":
-    import sys
-    import json
-    
     if len(sys.argv) < 2:
         print("Usage: spec_parser.py <spec_directory>")
         print("       spec_parser.py <tasks.md>")
@@ -742,12 +1084,11 @@ if __name__ == "__main__":
         print(f"   Reference docs: requirements.md, design.md")
         
         if "--json" in sys.argv:
-            print(json.dumps({"tasks": [t.to_dict() for t in tasks_result.tasks]}, indent=2))
+            sys.stdout.flush()
+            sys.stdout.buffer.write(tasks_result_to_json(tasks_result) + b"\n")
     
     elif path.endswith("tasks.md"):
-        with open(path, 'r', encoding='utf-8') as f:
-            content = f.read()
-        result = parse_tasks(content)
+        result = _parse_tasks_file(path)
         extract_dependencies(result.tasks)
         
         print(f"Parsed {len(result.tasks)} tasks:")
@@ -11,6 +11,8 @@ Synchronizes AGENT_STATE.json to PROJECT_PULSE.md:
 Requirements: 6.1, 6.3, 6.4, 6.6
 """
 
+import functools
+import heapq
 import json
 import os
 import re
@@ -18,13 +20,25 @@ import sys
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Dict, Any, Optional, Set, Tuple
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set, Tuple
+
+if TYPE_CHECKING:
+    import argparse
+
+# Optional fast JSON codec; falls back to stdlib json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add script directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+# __slots__-backed dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class SyncResult:
     """Result of sync operation"""
     success: bool
@@ -33,14 +47,14 @@ class SyncResult:
     errors: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class MentalModel:
     """Mental Model section data"""
     description: str
     mermaid_diagram: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class RisksAndDebt:
     """Risks & Debt section data"""
     cognitive_warnings: List[str] = field(default_factory=list)
@@ -48,15 +62,47 @@ class RisksAndDebt:
     pending_decisions: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class SemanticAnchor:
-    """Semantic anchor entry"""
+    """Semantic anchor entry (immutable, so cached parses can share instances)"""
     module: str
     path: str
     symbol: str
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
+class TaskStatusIndex:
+    """
+    Tasks from agent state bucketed by status in a single pass.
+    
+    Built once per sync and shared by the section builders so the task list
+    is not rescanned per status.
+    """
+    total: int = 0
+    completed: List[Dict[str, Any]] = field(default_factory=list)
+    in_progress: List[Dict[str, Any]] = field(default_factory=list)
+    blocked: List[Dict[str, Any]] = field(default_factory=list)
+    pending_review: List[Dict[str, Any]] = field(default_factory=list)
+    
+    @classmethod
+    def build(cls, agent_state: Dict[str, Any]) -> "TaskStatusIndex":
+        """Bucket agent_state["tasks"] by status, preserving task order."""
+        tasks = agent_state.get("tasks", [])
+        index = cls(total=len(tasks))
+        buckets = {
+            "completed": index.completed,
+            "in_progress": index.in_progress,
+            "blocked": index.blocked,
+            "pending_review": index.pending_review,
+        }
+        for task in tasks:
+            bucket = buckets.get(task.get("status"))
+            if bucket is not None:
+                bucket.append(task)
+        return index
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class PulseDocument:
     """Complete PULSE document structure"""
     mental_model: MentalModel
@@ -72,8 +118,57 @@ SECTION_PATTERNS = {
     'risks_and_debt': r'^##\s*🔴?\s*Risks\s*[&＆]\s*Debt',
     'semantic_anchors': r'^##\s*🔗?\s*Semantic\s*Anchors',
 }
-
-
+# All four headers as one multiline alternation (group name = section name).
+# Whitespace is [^\S\n] so a match never spans lines, like a per-line match.
+_SECTION_HEADER_RE = re.compile(
+    r'^##[^\S\n]*(?:'
+    r'(?P<mental_model>🟢?[^\S\n]*Mental[^\S\n]*Model)'
+    r'|(?P<narrative_delta>🟡?[^\S\n]*Narrative[^\S\n]*Delta)'
+    r'|(?P<risks_and_debt>🔴?[^\S\n]*Risks[^\S\n]*[&＆][^\S\n]*Debt)'
+    r'|(?P<semantic_anchors>🔗?[^\S\n]*Semantic[^\S\n]*Anchors))',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+# Per-section content patterns
+_MERMAID_RE = re.compile(r'```mermaid\s*(.*?)```', re.DOTALL)
+# An H2 line including its trailing newline
+_H2_LINE_RE = re.compile(r'^##[^\n]*\n?', re.MULTILINE)
+# Risks & Debt lines: a '###'/'**' subsection header (text after the marker)
+# or a '-'/'*' bullet (item text, stripped); [^\S\n] keeps matches on one line
+_RISKS_LINE_RE = re.compile(
+    r'^[^\S\n]*(?:(?:###|\*\*)([^\n]*)|[-*][^\S\n]+(\S(?:[^\n]*\S)?))',
+    re.MULTILINE,
+)
+# First "[module] `path` -> `symbol`" on a '-'/'*' bullet line; every class
+# excludes newlines so a match stays within one line
+_ANCHOR_LINE_RE = re.compile(
+    r'^[^\S\n]*[-*][^\n]*?'
+    r'\[([^\]\n]+)\][^\S\n]*`?([^`\s]+)`?[^\S\n]*->[^\S\n]*`?([^`\s]+)`?',
+    re.MULTILINE,
+)
+
+
+# Minimum os.read size when reading input files
+_READ_CHUNK = 64 * 1024
+
+# Small FIFO caches for repeated syncs of the same inputs (watch/loop usage).
+# Keys are the input text/bytes themselves, so a hit is an exact match.
+_CACHE_SIZE = 16
+# PULSE content -> parsed document; cached documents are treated as read-only
+_PARSE_CACHE: Dict[str, Optional["PulseDocument"]] = {}
+# (PULSE content, raw state bytes, update_mental_model) -> (updated content,
+# time after which a pending decision escalates and the output goes stale)
+_SYNC_CACHE: Dict[Tuple[str, bytes, bool], Tuple[str, Optional[datetime]]] = {}
+
+
+def _cache_put(cache: Dict[Any, Any], key: Any, value: Any) -> None:
+    """Insert into a FIFO cache, evicting the oldest entry past _CACHE_SIZE"""
+    if len(cache) >= _CACHE_SIZE:
+        cache.pop(next(iter(cache)))
+    cache[key] = value
+
+
+@functools.lru_cache(maxsize=512)
 def parse_datetime(dt_str: str) -> Optional[datetime]:
     """Parse ISO datetime string to datetime object"""
     if not dt_str:
@@ -90,56 +185,66 @@ def parse_datetime(dt_str: str) -> Optional[datetime]:
         return None
 
 
-def is_older_than_24h(dt_str: str) -> bool:
-    """Check if datetime string is older than 24 hours"""
+def _next_escalation(agent_state: Dict[str, Any], now: datetime) -> Optional[datetime]:
+    """Earliest moment at or after now that a pending decision passes the 24h mark"""
+    soonest = None
+    for decision in agent_state.get("pending_decisions", []):
+        dt = parse_datetime(decision.get("created_at", ""))
+        if not dt:
+            continue
+        if dt.tzinfo is None:
+            dt = dt.replace(tzinfo=timezone.utc)
+        deadline = dt + timedelta(hours=24)
+        if deadline >= now and (soonest is None or deadline < soonest):
+            soonest = deadline
+    return soonest
+
+
+def _is_before(dt_str: str, cutoff: datetime) -> bool:
+    """Check if datetime string is strictly earlier than cutoff (naive = UTC)"""
     dt = parse_datetime(dt_str)
     if not dt:
         return False
     
-    now = datetime.now(timezone.utc)
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     
-    return (now - dt) > timedelta(hours=24)
+    return dt < cutoff
+
+
+def is_older_than_24h(dt_str: str, now: Optional[datetime] = None) -> bool:
+    """Check if datetime string is older than 24 hours"""
+    if now is None:
+        now = datetime.now(timezone.utc)
+    return _is_before(dt_str, now - timedelta(hours=24))
 
 
 def _find_sections(content: str) -> Dict[str, str]:
     """Find positions and content of each section in the document"""
-    lines = content.split('\n')
-    sections = {}
-    current_section = None
-    current_lines = []
-    
-    for line in lines:
-        found_section = None
-        for section_name, pattern in SECTION_PATTERNS.items():
-            if re.match(pattern, line, re.IGNORECASE):
-                found_section = section_name
-                break
-        
-        if found_section:
-            if current_section:
-                sections[current_section] = '\n'.join(current_lines)
-            current_section = found_section
-            current_lines = [line]
-        elif current_section:
-            current_lines.append(line)
+    sections: Dict[str, str] = {}
+    matches = list(_SECTION_HEADER_RE.finditer(content))
     
-    if current_section:
-        sections[current_section] = '\n'.join(current_lines)
+    for i, match in enumerate(matches):
+        # A section runs up to (not including) the newline before the next header
+        end = matches[i + 1].start() - 1 if i + 1 < len(matches) else len(content)
+        sections[match.lastgroup] = content[match.start():end]
     
     return sections
 
 
 def _parse_mental_model(content: str) -> MentalModel:
     """Parse Mental Model section"""
-    # Extract Mermaid diagram
-    mermaid_match = re.search(r'```mermaid\s*(.*?)```', content, re.DOTALL)
-    mermaid_diagram = mermaid_match.group(1).strip() if mermaid_match else ''
-    
-    # Extract description (text before mermaid, excluding header)
-    lines_before = content.split('```mermaid')[0] if '```mermaid' in content else content
-    description_lines = []
+    # Locate the first fence once; the diagram regex is anchored there
+    # (leftmost match) and the description is the text before it
+    fence = content.find('```mermaid')
+    if fence < 0:
+        mermaid_diagram = ''
+        lines_before = content
+    else:
+        mermaid_match = _MERMAID_RE.match(content, fence)
+        mermaid_diagram = mermaid_match.group(1).strip() if mermaid_match else ''
+        lines_before = content[:fence]
+    description_lines: List[str] = []
     for line in lines_before.split('\n'):
         line = line.strip()
         if line and not line.startswith('#') and not line.startswith('<!--'):
@@ -152,151 +257,128 @@ def _parse_mental_model(content: str) -> MentalModel:
 
 def _parse_narrative_delta(content: str) -> str:
     """Parse Narrative Delta section"""
-    lines = []
-    for line in content.split('\n'):
-        if not re.match(r'^##', line):
-            lines.append(line)
-    return '\n'.join(lines).strip()
+    # Dropping each H2 line with its newline leaves the same text as
+    # filtering split lines, up to trailing whitespace removed by strip()
+    return _H2_LINE_RE.sub('', content).strip()
 
 
 def _parse_risks_and_debt(content: str) -> RisksAndDebt:
     """Parse Risks & Debt section"""
-    cognitive_warnings = []
-    technical_debt = []
-    pending_decisions = []
-    
-    current_subsection = None
+    items: Dict[str, List[str]] = {
+        'cognitive': [],
+        'debt': [],
+        'pending': [],
+    }
     
-    for line in content.split('\n'):
-        line_stripped = line.strip()
-        line_lower = line_stripped.lower()
-        
-        if line_stripped.startswith('###') or line_stripped.startswith('**'):
-            if 'cognitive' in line_lower:
-                current_subsection = 'cognitive'
-                continue
-            elif 'technical debt' in line_lower:
-                current_subsection = 'debt'
-                continue
-            elif 'pending' in line_lower:
-                current_subsection = 'pending'
-                continue
-        
-        list_match = re.match(r'^[-*]\s+(.+)', line_stripped)
-        if list_match and current_subsection:
-            item = list_match.group(1).strip()
-            if item.lower() == 'none':
-                continue
-            if current_subsection == 'cognitive':
-                cognitive_warnings.append(item)
-            elif current_subsection == 'debt':
-                technical_debt.append(item)
-            elif current_subsection == 'pending':
-                pending_decisions.append(item)
+    current_items = None
+    
+    # One scan over the section yields only subsection headers and bullets
+    for header, item in _RISKS_LINE_RE.findall(content):
+        if not item:
+            header_lower = header.lower()
+            if 'cognitive' in header_lower:
+                current_items = items['cognitive']
+            elif 'technical debt' in header_lower:
+                current_items = items['debt']
+            elif 'pending' in header_lower:
+                current_items = items['pending']
+        elif current_items is not None and item.lower() != 'none':
+            current_items.append(item)
     
     return RisksAndDebt(
-        cognitive_warnings=cognitive_warnings,
-        technical_debt=technical_debt,
-        pending_decisions=pending_decisions
+        cognitive_warnings=items['cognitive'],
+        technical_debt=items['debt'],
+        pending_decisions=items['pending']
     )
 
 
 def _parse_semantic_anchors(content: str) -> List[SemanticAnchor]:
     """Parse Semantic Anchors section"""
-    anchors = []
-    anchor_pattern = r'\[([^\]]+)\]\s*`?([^`\s]+)`?\s*->\s*`?([^`\s]+)`?'
-    
-    for line in content.split('\n'):
-        if line.strip().startswith('-') or line.strip().startswith('*'):
-            match = re.search(anchor_pattern, line)
-            if match:
-                anchors.append(SemanticAnchor(
-                    module=match.group(1).strip(),
-                    path=match.group(2).strip(),
-                    symbol=match.group(3).strip()
-                ))
-    
-    return anchors
+    return [
+        SemanticAnchor(
+            module=module.strip(),
+            path=path,
+            symbol=symbol
+        )
+        for module, path, symbol in _ANCHOR_LINE_RE.findall(content)
+    ]
 
 
 def parse_pulse(content: str) -> Optional[PulseDocument]:
-    """Parse PULSE document from markdown content"""
+    """
+    Parse PULSE document from markdown content.
+    
+    Results are memoized per content string; callers must not mutate the
+    returned document (the build_* functions copy what they extend).
+    """
+    if content in _PARSE_CACHE:
+        return _PARSE_CACHE[content]
+    
     sections = _find_sections(content)
     
+    document = None
     required = ['mental_model', 'narrative_delta', 'risks_and_debt', 'semantic_anchors']
-    for section in required:
-        if section not in sections:
-            return None
+    if all(section in sections for section in required):
+        document = PulseDocument(
+            mental_model=_parse_mental_model(sections['mental_model']),
+            narrative_delta=_parse_narrative_delta(sections['narrative_delta']),
+            risks_and_debt=_parse_risks_and_debt(sections['risks_and_debt']),
+            semantic_anchors=_parse_semantic_anchors(sections['semantic_anchors'])
+        )
     
-    return PulseDocument(
-        mental_model=_parse_mental_model(sections['mental_model']),
-        narrative_delta=_parse_narrative_delta(sections['narrative_delta']),
-        risks_and_debt=_parse_risks_and_debt(sections['risks_and_debt']),
-        semantic_anchors=_parse_semantic_anchors(sections['semantic_anchors'])
-    )
+    _cache_put(_PARSE_CACHE, content, document)
+    return document
+
+
+def _bullet_block(items: List[str]) -> str:
+    """Render items as a markdown bullet list, or '- None' when empty"""
+    if not items:
+        return '- None'
+    return '- ' + '\n- '.join(items)
 
 
 def generate_pulse(document: PulseDocument) -> str:
     """Generate PULSE document markdown from structured data"""
-    lines = ['# PROJECT_PULSE', '']
+    mental_model = document.mental_model
+    risks = document.risks_and_debt
     
     # Mental Model
-    lines.append('## 🟢 Mental Model')
-    lines.append('')
-    if document.mental_model.description:
-        lines.append(document.mental_model.description)
-        lines.append('')
-    if document.mental_model.mermaid_diagram:
-        lines.append('```mermaid')
-        lines.append(document.mental_model.mermaid_diagram)
-        lines.append('```')
-        lines.append('')
+    mental_block = '## 🟢 Mental Model\n'
+    if mental_model.description:
+        mental_block += f'\n{mental_model.description}\n'
+    if mental_model.mermaid_diagram:
+        mental_block += f'\n```mermaid\n{mental_model.mermaid_diagram}\n```\n'
     
     # Narrative Delta
-    lines.append('## 🟡 Narrative Delta')
-    lines.append('')
+    narrative_block = '## 🟡 Narrative Delta\n\n'
     if document.narrative_delta:
-        lines.append(document.narrative_delta)
-    lines.append('')
+        narrative_block += f'{document.narrative_delta}\n'
     
     # Risks & Debt
-    lines.append('## 🔴 Risks & Debt')
-    lines.append('')
-    
-    lines.append('### Cognitive Load Warnings')
-    if document.risks_and_debt.cognitive_warnings:
-        for warning in document.risks_and_debt.cognitive_warnings:
-            lines.append(f'- {warning}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Technical Debt')
-    if document.risks_and_debt.technical_debt:
-        for debt in document.risks_and_debt.technical_debt:
-            lines.append(f'- {debt}')
-    else:
-        lines.append('- None')
-    lines.append('')
-    
-    lines.append('### Pending Decisions')
-    if document.risks_and_debt.pending_decisions:
-        for decision in document.risks_and_debt.pending_decisions:
-            lines.append(f'- {decision}')
-    else:
-        lines.append('- None')
-    lines.append('')
+    risks_block = (
+        '## 🔴 Risks & Debt\n\n'
+        f'### Cognitive Load Warnings\n{_bullet_block(risks.cognitive_warnings)}\n\n'
+        f'### Technical Debt\n{_bullet_block(risks.technical_debt)}\n\n'
+        f'### Pending Decisions\n{_bullet_block(risks.pending_decisions)}\n'
+    )
     
     # Semantic Anchors
-    lines.append('## 🔗 Semantic Anchors')
-    lines.append('')
     if document.semantic_anchors:
-        for anchor in document.semantic_anchors:
-            lines.append(f'- [{anchor.module}] `{anchor.path}` -> `{anchor.symbol}`')
+        anchor_lines = '\n'.join([
+            f'- [{anchor.module}] `{anchor.path}` -> `{anchor.symbol}`'
+            for anchor in document.semantic_anchors
+        ])
     else:
-        lines.append('- None')
+        anchor_lines = '- None'
+    anchors_block = f'## 🔗 Semantic Anchors\n\n{anchor_lines}'
     
-    return '\n'.join(lines)
+    return '\n'.join([
+        '# PROJECT_PULSE\n',
+        mental_block,
+        narrative_block,
+        risks_block,
+        anchors_block,
+    ])
 
 
 
@@ -340,39 +422,59 @@ def format_deferred_fix(fix: Dict[str, Any]) -> str:
     return f"[{task_id}] {description} (severity: {severity})"
 
 
-def get_completed_tasks(agent_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_completed_tasks(
+    agent_state: Dict[str, Any],
+    task_index: Optional[TaskStatusIndex] = None
+) -> List[Dict[str, Any]]:
     """Get list of completed tasks from agent state"""
+    if task_index is not None:
+        return task_index.completed
     tasks = agent_state.get("tasks", [])
     return [t for t in tasks if t.get("status") == "completed"]
 
 
-def get_in_progress_tasks(agent_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_in_progress_tasks(
+    agent_state: Dict[str, Any],
+    task_index: Optional[TaskStatusIndex] = None
+) -> List[Dict[str, Any]]:
     """Get list of in-progress tasks from agent state"""
+    if task_index is not None:
+        return task_index.in_progress
     tasks = agent_state.get("tasks", [])
     return [t for t in tasks if t.get("status") == "in_progress"]
 
 
-def get_blocked_tasks(agent_state: Dict[str, Any]) -> List[Dict[str, Any]]:
+def get_blocked_tasks(
+    agent_state: Dict[str, Any],
+    task_index: Optional[TaskStatusIndex] = None
+) -> List[Dict[str, Any]]:
     """Get list of blocked tasks from agent state"""
+    if task_index is not None:
+        return task_index.blocked
     tasks = agent_state.get("tasks", [])
     return [t for t in tasks if t.get("status") == "blocked"]
 
 
-def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str) -> str:
+def build_narrative_delta(
+    agent_state: Dict[str, Any],
+    existing_narrative: str,
+    task_index: Optional[TaskStatusIndex] = None
+) -> str:
     """
     Build updated Narrative Delta section.
     
     Requirement 6.1: Update Narrative Delta with recent completions
     """
-    lines = []
+    lines: List[str] = []
     
     # Get task statistics
-    tasks = agent_state.get("tasks", [])
-    total = len(tasks)
-    completed = len([t for t in tasks if t.get("status") == "completed"])
-    in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
-    blocked = len([t for t in tasks if t.get("status") == "blocked"])
-    pending_review = len([t for t in tasks if t.get("status") == "pending_review"])
+    if task_index is None:
+        task_index = TaskStatusIndex.build(agent_state)
+    total = task_index.total
+    completed = len(task_index.completed)
+    in_progress = len(task_index.in_progress)
+    blocked = len(task_index.blocked)
+    pending_review = len(task_index.pending_review)
     
     # Add spec path info
     spec_path = agent_state.get("spec_path", "unknown")
@@ -389,15 +491,15 @@ def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str)
     lines.append("")
     
     # Add recent completions
-    completed_tasks = get_completed_tasks(agent_state)
+    completed_tasks = get_completed_tasks(agent_state, task_index)
     if completed_tasks:
         lines.append("**Recent Completions:**")
         # Sort by completed_at if available, take last 5
-        sorted_tasks = sorted(
+        sorted_tasks = heapq.nlargest(
+            5,
             completed_tasks,
-            key=lambda t: t.get("completed_at", ""),
-            reverse=True
-        )[:5]
+            key=lambda t: t.get("completed_at", "")
+        )
         for task in sorted_tasks:
             task_id = task.get("task_id", "unknown")
             desc = task.get("description", "")[:50]
@@ -405,7 +507,7 @@ def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str)
         lines.append("")
     
     # Add in-progress tasks
-    in_progress_tasks = get_in_progress_tasks(agent_state)
+    in_progress_tasks = get_in_progress_tasks(agent_state, task_index)
     if in_progress_tasks:
         lines.append("**Currently In Progress:**")
         for task in in_progress_tasks[:5]:
@@ -420,7 +522,9 @@ def build_narrative_delta(agent_state: Dict[str, Any], existing_narrative: str)
 
 def build_risks_and_debt(
     agent_state: Dict[str, Any],
-    existing_risks: RisksAndDebt
+    existing_risks: RisksAndDebt,
+    task_index: Optional[TaskStatusIndex] = None,
+    now: Optional[datetime] = None
 ) -> RisksAndDebt:
     """
     Build updated Risks & Debt section.
@@ -431,7 +535,10 @@ def build_risks_and_debt(
     """
     cognitive_warnings = list(existing_risks.cognitive_warnings)
     technical_debt = list(existing_risks.technical_debt)
-    pending_decisions = []
+    pending_decisions: List[str] = []
+    # Membership sets mirror the ordered lists so dedup checks stay O(1)
+    warnings_seen = set(cognitive_warnings)
+    debt_seen = set(technical_debt)
     
     # Add blocked items as cognitive warnings
     blocked_items = agent_state.get("blocked_items", [])
@@ -439,31 +546,38 @@ def build_risks_and_debt(
     
     for item in blocked_items:
         formatted = format_blocked_item(item)
-        if formatted not in cognitive_warnings:
-            cognitive_warnings.append(f"🚫 BLOCKED: {formatted}")
+        if formatted not in warnings_seen:
+            warning = f"🚫 BLOCKED: {formatted}"
+            warnings_seen.add(warning)
+            cognitive_warnings.append(warning)
     
     # Also check tasks with blocked status that might not have blocked_items entry
-    blocked_tasks = get_blocked_tasks(agent_state)
+    blocked_tasks = get_blocked_tasks(agent_state, task_index)
     for task in blocked_tasks:
         task_id = task.get("task_id")
         if task_id and task_id not in blocked_task_ids:
             desc = task.get("description", "")[:50]
             warning = f"🚫 BLOCKED: [{task_id}] {desc}"
-            if warning not in cognitive_warnings:
+            if warning not in warnings_seen:
+                warnings_seen.add(warning)
                 cognitive_warnings.append(warning)
     
     # Add deferred fixes as technical debt
     deferred_fixes = agent_state.get("deferred_fixes", [])
     for fix in deferred_fixes:
         formatted = format_deferred_fix(fix)
-        if formatted not in technical_debt:
+        if formatted not in debt_seen:
+            debt_seen.add(formatted)
             technical_debt.append(formatted)
     
     # Add pending decisions with escalation for 24h+ items
     pending = agent_state.get("pending_decisions", [])
+    if now is None:
+        now = datetime.now(timezone.utc)
+    cutoff = now - timedelta(hours=24)
     for decision in pending:
         created_at = decision.get("created_at", "")
-        escalated = is_older_than_24h(created_at)
+        escalated = _is_before(created_at, cutoff)
         formatted = format_pending_decision(decision, escalated=escalated)
         pending_decisions.append(formatted)
     
@@ -476,7 +590,8 @@ def build_risks_and_debt(
 
 def build_semantic_anchors(
     agent_state: Dict[str, Any],
-    existing_anchors: List[SemanticAnchor]
+    existing_anchors: List[SemanticAnchor],
+    task_index: Optional[TaskStatusIndex] = None
 ) -> List[SemanticAnchor]:
     """
     Build updated Semantic Anchors section.
@@ -487,30 +602,49 @@ def build_semantic_anchors(
     existing_paths = {a.path for a in anchors}
     
     # Add anchors for files changed in completed tasks
-    completed_tasks = get_completed_tasks(agent_state)
+    completed_tasks = get_completed_tasks(agent_state, task_index)
     for task in completed_tasks:
-        files_changed = task.get("files_changed", [])
+        files_changed = task.get("files_changed")
+        if not files_changed:
+            continue
         task_id = task.get("task_id", "unknown")
         
         for file_path in files_changed:
-            if file_path not in existing_paths:
-                # Determine module from path
-                parts = file_path.split('/')
-                module = parts[0] if len(parts) > 1 else "Root"
-                
-                anchors.append(SemanticAnchor(
-                    module=module,
-                    path=file_path,
-                    symbol=task_id
-                ))
-                existing_paths.add(file_path)
+            if file_path in existing_paths:
+                continue
+            existing_paths.add(file_path)
+            
+            # Determine module from path (first component, or Root for bare names)
+            head, sep, _ = file_path.partition('/')
+            module = head if sep else "Root"
+            
+            anchors.append(SemanticAnchor(
+                module=module,
+                path=file_path,
+                symbol=task_id
+            ))
     
     return anchors
 
 
+# (status, node marker, max nodes) for the Mental Model flowchart, in draw order
+_MERMAID_STATUS_NODES = (
+    ("completed", "✅", 3),
+    ("in_progress", "🔄", 3),
+    ("blocked", "🚫", 2),
+)
+
+
+def _mermaid_safe_id(task_id: str) -> str:
+    """Turn a task ID into a mermaid node ID"""
+    # Chained replace beats str.translate for IDs this short
+    return task_id.replace("-", "_").replace(".", "_").replace("/", "_").replace(" ", "_")
+
+
 def build_mental_model(
     agent_state: Dict[str, Any],
-    existing_model: MentalModel
+    existing_model: MentalModel,
+    task_index: Optional[TaskStatusIndex] = None
 ) -> MentalModel:
     """
     Build updated Mental Model section from agent state.
@@ -527,16 +661,14 @@ def build_mental_model(
     tasks = agent_state.get("tasks", [])
     
     # Build description from state
-    total_tasks = len(tasks)
-    completed = len([t for t in tasks if t.get("status") == "completed"])
-    in_progress = len([t for t in tasks if t.get("status") == "in_progress"])
+    if task_index is None:
+        task_index = TaskStatusIndex.build(agent_state)
+    total_tasks = task_index.total
+    completed = len(task_index.completed)
     
     # Get unique agents involved
-    agents = set()
-    for task in tasks:
-        owner = task.get("owner_agent", "")
-        if owner:
-            agents.add(owner)
+    owners = {task.get("owner_agent") for task in tasks}
+    agents = {owner for owner in owners if owner}
     
     agents_str = ", ".join(sorted(agents)) if agents else "none assigned"
     
@@ -553,8 +685,8 @@ def build_mental_model(
     # Add orchestrator node
     mermaid_lines.append("    Orchestrator[Codex Orchestrator]")
     
-    # Group tasks by status
-    task_groups = {
+    # Group the first tasks by status for the diagram
+    diagram_groups = {
         "completed": [],
         "in_progress": [],
         "pending_review": [],
@@ -565,26 +697,14 @@ def build_mental_model(
     for task in tasks[:10]:  # Limit to 10 tasks for readability
         status = task.get("status", "not_started")
         task_id = task.get("task_id", "unknown")
-        if status in task_groups:
-            task_groups[status].append(task_id)
+        if status in diagram_groups:
+            diagram_groups[status].append(task_id)
     
     # Add task nodes by status
-    if task_groups["completed"]:
-        for tid in task_groups["completed"][:3]:
-            safe_id = tid.replace("-", "_").replace(".", "_")
-            mermaid_lines.append(f"    {safe_id}[{tid} ✅]")
-            mermaid_lines.append(f"    Orchestrator --> {safe_id}")
-    
-    if task_groups["in_progress"]:
-        for tid in task_groups["in_progress"][:3]:
-            safe_id = tid.replace("-", "_").replace(".", "_")
-            mermaid_lines.append(f"    {safe_id}[{tid} 🔄]")
-            mermaid_lines.append(f"    Orchestrator --> {safe_id}")
-    
-    if task_groups["blocked"]:
-        for tid in task_groups["blocked"][:2]:
-            safe_id = tid.replace("-", "_").replace(".", "_")
-            mermaid_lines.append(f"    {safe_id}[{tid} 🚫]")
+    for status, marker, limit in _MERMAID_STATUS_NODES:
+        for tid in diagram_groups[status][:limit]:
+            safe_id = _mermaid_safe_id(tid)
+            mermaid_lines.append(f"    {safe_id}[{tid} {marker}]")
             mermaid_lines.append(f"    Orchestrator --> {safe_id}")
     
     mermaid_diagram = "\n".join(mermaid_lines)
@@ -598,7 +718,8 @@ def build_mental_model(
 def sync_pulse_from_state(
     pulse_content: str,
     agent_state: Dict[str, Any],
-    update_mental_model: bool = False
+    update_mental_model: bool = False,
+    now: Optional[datetime] = None
 ) -> Tuple[str, bool]:
     """
     Synchronize PULSE document from agent state.
@@ -607,6 +728,7 @@ def sync_pulse_from_state(
         pulse_content: Current PULSE document content
         agent_state: AGENT_STATE.json data
         update_mental_model: Whether to update mental model section
+        now: Reference time for 24h escalation (default: current UTC time)
     
     Returns:
         Tuple of (updated_content, was_updated)
@@ -618,20 +740,23 @@ def sync_pulse_from_state(
     if not document:
         return pulse_content, False
     
+    # Tally tasks by status once for all section builders
+    task_index = TaskStatusIndex.build(agent_state)
+    
     # Update Mental Model if requested (Requirement 6.1)
     if update_mental_model:
-        new_mental_model = build_mental_model(agent_state, document.mental_model)
+        new_mental_model = build_mental_model(agent_state, document.mental_model, task_index)
     else:
         new_mental_model = document.mental_model
     
     # Update Narrative Delta (Requirement 6.1)
-    new_narrative = build_narrative_delta(agent_state, document.narrative_delta)
+    new_narrative = build_narrative_delta(agent_state, document.narrative_delta, task_index)
     
     # Update Risks & Debt (Requirements 6.1, 6.6)
-    new_risks = build_risks_and_debt(agent_state, document.risks_and_debt)
+    new_risks = build_risks_and_debt(agent_state, document.risks_and_debt, task_index, now)
     
     # Update Semantic Anchors
-    new_anchors = build_semantic_anchors(agent_state, document.semantic_anchors)
+    new_anchors = build_semantic_anchors(agent_state, document.semantic_anchors, task_index)
     
     # Create updated document
     updated_document = PulseDocument(
@@ -648,6 +773,55 @@ def sync_pulse_from_state(
 
 
 
+def _read_file_bytes(path: str) -> bytes:
+    """Read a whole file with raw os.read calls, bypassing buffered file objects"""
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    chunks: List[bytes] = []
+    try:
+        size = os.fstat(fd).st_size
+        # Loop until EOF to cover short reads and files growing meanwhile
+        while True:
+            chunk = os.read(fd, max(size, _READ_CHUNK))
+            if not chunk:
+                break
+            chunks.append(chunk)
+    except OSError as e:
+        if e.filename is None:
+            # os.read errors carry no path; attach it like open() would
+            raise type(e)(e.errno, e.strerror, path) from None
+        raise
+    finally:
+        os.close(fd)
+    return b"".join(chunks)
+
+
+def _loads_state(data: bytes) -> Any:
+    """Decode AGENT_STATE.json bytes (orjson if available)"""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # Defer to stdlib json for inputs orjson rejects (NaN, big ints)
+            # and for its error messages
+            pass
+    return json.loads(data)
+
+
+def _write_text_atomic(path: str, content: str) -> None:
+    """Write text to path atomically (temp file + os.replace)"""
+    tmp_path = path + ".tmp"
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
 def sync_pulse_files(
     state_file_path: str,
     pulse_file_path: str,
@@ -670,10 +844,10 @@ def sync_pulse_files(
     """
     errors = []
     
-    # Read AGENT_STATE.json
+    # Read AGENT_STATE.json (raw bytes are kept as the sync cache key)
     try:
-        with open(state_file_path, 'r', encoding='utf-8') as f:
-            agent_state = json.load(f)
+        state_bytes = _read_file_bytes(state_file_path)
+        agent_state = _loads_state(state_bytes)
     except FileNotFoundError:
         return SyncResult(
             success=False,
@@ -695,8 +869,10 @@ def sync_pulse_files(
     
     # Read PROJECT_PULSE.md
     try:
-        with open(pulse_file_path, 'r', encoding='utf-8') as f:
-            pulse_content = f.read()
+        pulse_content = _read_file_bytes(pulse_file_path).decode('utf-8')
+        if '\r' in pulse_content:
+            # Match text-mode universal newline handling
+            pulse_content = pulse_content.replace('\r\n', '\n').replace('\r', '\n')
     except FileNotFoundError:
         return SyncResult(
             success=False,
@@ -710,10 +886,21 @@ def sync_pulse_files(
             errors=[str(e)]
         )
     
-    # Sync
-    updated_content, was_updated = sync_pulse_from_state(
-        pulse_content, agent_state, update_mental_model=update_mental_model
-    )
+    # Sync, reusing the previous output for identical inputs until a pending
+    # decision is due to escalate. One clock read serves the cache check, the
+    # expiry and the escalation decisions so they always agree.
+    now = datetime.now(timezone.utc)
+    cache_key = (pulse_content, state_bytes, update_mental_model)
+    cached = _SYNC_CACHE.get(cache_key)
+    if cached is not None and (cached[1] is None or now <= cached[1]):
+        updated_content, was_updated = cached[0], True
+    else:
+        expires_at = _next_escalation(agent_state, now)
+        updated_content, was_updated = sync_pulse_from_state(
+            pulse_content, agent_state, update_mental_model=update_mental_model, now=now
+        )
+        if was_updated:
+            _cache_put(_SYNC_CACHE, cache_key, (updated_content, expires_at))
     
     if not was_updated:
         return SyncResult(
@@ -722,11 +909,20 @@ def sync_pulse_files(
             errors=["Could not parse PULSE document structure"]
         )
     
-    # Write output
+    # Write output, skipping the write (and mtime bump) when syncing in place
+    # produced byte-identical content
     output_file = output_path or pulse_file_path
+    if updated_content == pulse_content and (
+        output_path is None or os.path.abspath(output_path) == os.path.abspath(pulse_file_path)
+    ):
+        return SyncResult(
+            success=True,
+            message=f"PULSE document already up to date: {output_file}",
+            pulse_updated=False
+        )
+    
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(updated_content)
+        _write_text_atomic(output_file, updated_content)
     except Exception as e:
         return SyncResult(
             success=False,
@@ -784,8 +980,9 @@ def sync_pulse(
     )
 
 
-def main():
-    """Command line entry point"""
+@functools.lru_cache(maxsize=None)
+def _build_parser() -> "argparse.ArgumentParser":
+    """Build the command line parser (once; run() reuses it for every in-process sync)"""
     import argparse
     
     parser = argparse.ArgumentParser(
@@ -814,7 +1011,46 @@ def main():
         help="Output result as JSON"
     )
     
-    args = parser.parse_args()
+    return parser
+
+
+def _result_payload(result: SyncResult) -> Dict[str, Any]:
+    """Build the --json output for a result"""
+    output = {
+        "success": result.success,
+        "message": result.message,
+        "pulse_updated": result.pulse_updated,
+        "errors": result.errors
+    }
+    return output
+
+
+def _payload_to_json(payload: Dict[str, Any]) -> bytes:
+    """Serialize a --json payload as 2-space indented UTF-8 JSON bytes (orjson if available)"""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_INDENT_2)
+    return json.dumps(payload, indent=2).encode("utf-8")
+
+
+def run(argv: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Sync the PULSE document from command line style arguments and return the --json payload.
+
+    In-process entry point used by orchestration_loop instead of a subprocess.
+    """
+    args = _build_parser().parse_args(argv)
+    result = sync_pulse_files(
+        args.state_file,
+        args.pulse_file,
+        args.output,
+        update_mental_model=args.update_mental_model
+    )
+    return _result_payload(result)
+
+
+def main() -> None:
+    """Command line entry point"""
+    args = _build_parser().parse_args()
     
     result = sync_pulse_files(
         args.state_file,
@@ -824,13 +1060,7 @@ def main():
     )
     
     if args.json:
-        output = {
-            "success": result.success,
-            "message": result.message,
-            "pulse_updated": result.pulse_updated,
-            "errors": result.errors
-        }
-        print(json.dumps(output, indent=2))
+        sys.stdout.buffer.write(_payload_to_json(_result_payload(result)) + b"\n")
     else:
         if result.success:
             print(f"✅ {result.message}")
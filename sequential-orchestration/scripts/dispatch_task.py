@@ -8,17 +8,23 @@ Synchronously waits for completion and returns result.
 
 from __future__ import annotations
 
+import functools
 import json
+import locale
 import os
 import re
 import shutil
 import subprocess
 import sys
+import tempfile
+import threading
+from concurrent.futures import Future
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from types import MappingProxyType
+from typing import Any, Dict, List, Optional, Set, Tuple
 
-from codeagent_utils import resolve_codeagent_wrapper, tmux_enabled, looks_like_tmux_error
+from codeagent_utils import current_dir, resolve_codeagent_wrapper, tmux_enabled, looks_like_tmux_error
 
 
 # Skill protocol for agent self-judgment
@@ -49,15 +55,47 @@ If writing production code -> TDD is RIGID. No exceptions.
 """.strip()
 
 
-# Agent backend mapping
-AGENT_TO_BACKEND = {
+_IS_WINDOWS = sys.platform.startswith("win")
+
+# shutil.which("tmux") results keyed by PATH, so each dispatch skips the PATH walk
+_TMUX_LOOKUPS: Dict[str, Optional[str]] = {}
+
+
+def _tmux_available() -> bool:
+    path_env = os.environ.get("PATH", "")
+    if path_env not in _TMUX_LOOKUPS:
+        _TMUX_LOOKUPS[path_env] = shutil.which("tmux")
+    return _TMUX_LOOKUPS[path_env] is not None
+
+
+# Set once a tmux-backed dispatch fails with a tmux error, so later dispatches
+# in this process go straight to the no-tmux command instead of failing first
+_TMUX_FAILED = False
+
+
+def _mark_tmux_failed() -> None:
+    global _TMUX_FAILED
+    _TMUX_FAILED = True
+
+
+# Agent backend mapping (read-only view; lookups go through the bound get of
+# the underlying dict, which is cheaper than MappingProxyType.get)
+_AGENT_TO_BACKEND = {
     "codex": "codex",
     "gemini": "gemini",
     "codex-review": "codex",
 }
+AGENT_TO_BACKEND = MappingProxyType(_AGENT_TO_BACKEND)
+_backend_for = _AGENT_TO_BACKEND.get
 
 
 def _safe_relpath(path: str, base_dir: Optional[str]) -> str:
+    # Relative inputs resolve against cwd, so it is part of the cache key
+    return _safe_relpath_cached(path, base_dir, current_dir())
+
+
+@functools.lru_cache(maxsize=1024)
+def _safe_relpath_cached(path: str, base_dir: Optional[str], cwd: str) -> str:
     p = Path(path).resolve()
     if base_dir:
         b = Path(base_dir).resolve()
@@ -68,17 +106,40 @@ def _safe_relpath(path: str, base_dir: Optional[str]) -> str:
     return p.as_posix()
 
 
+# Stateless, so one instance serves every reply
+_JSON_DECODER = json.JSONDecoder()
+
+
 def _json_from_text(text: str) -> Any:
-    decoder = json.JSONDecoder()
-    for i, ch in enumerate(text or ""):
-        if ch != "{":
-            continue
+    text = text or ""
+    decoder = _JSON_DECODER
+    pos = 0
+    while True:
+        i = text.find("{", pos)
+        if i < 0:
+            raise ValueError("No JSON object found in output")
         try:
-            obj, _end = decoder.raw_decode(text[i:])
+            obj, _end = decoder.raw_decode(text, i)
             return obj
         except json.JSONDecodeError:
-            continue
-    raise ValueError("No JSON object found in output")
+            pos = i + 1
+
+
+def _wrapper_env(overrides: Optional[Dict[str, str]] = None) -> Optional[Dict[str, str]]:
+    """
+    Environment for a codeagent-wrapper subprocess.
+
+    Returns None (inherit os.environ as-is, no copy) unless variables must be
+    set: the given overrides, plus CODEAGENT_NO_TMUX=1 on Windows when unset.
+    """
+    env_overrides = dict(overrides or {})
+    if _IS_WINDOWS and "CODEAGENT_NO_TMUX" not in os.environ:
+        env_overrides.setdefault("CODEAGENT_NO_TMUX", "1")
+    if not env_overrides:
+        return None
+    env = os.environ.copy()
+    env.update(env_overrides)
+    return env
 
 
 def _resolve_timeout_seconds(default_seconds: int) -> int:
@@ -94,6 +155,33 @@ def _resolve_timeout_seconds(default_seconds: int) -> int:
         return default_seconds
 
 
+# Static tail of the bulk assignment prompt
+_ASSIGNMENT_PROMPT_RULES = """
+## Rules
+- Analyze each task's description and details to determine:
+  - **type**: Infer from task semantics:
+    - code -> Backend logic, API, database, scripts, algorithms
+    - ui -> Frontend, React/Vue components, CSS, pages, forms, styling
+    - review -> Code review, audit, property testing
+  - **owner_agent**: Based on type:
+    - codex -> code tasks
+    - gemini -> ui tasks
+    - codex-review -> review tasks
+
+## Output
+
+Respond with JSON only:
+```json
+{
+  "assignments": [
+    {"task_id": "1", "type": "code", "owner_agent": "codex"},
+    {"task_id": "2", "type": "ui", "owner_agent": "gemini"}
+  ]
+}
+```
+"""
+
+
 def build_bulk_assignment_prompt(tasks_md_path: str, dispatch_unit_ids: List[str]) -> str:
     """
     Build prompt for sub-agent to assign dispatch units.
@@ -110,38 +198,34 @@ def build_bulk_assignment_prompt(tasks_md_path: str, dispatch_unit_ids: List[str
     """
     units_list = "\n".join(f"- {tid}" for tid in dispatch_unit_ids)
 
-    return f"""You are assigning dispatch units for sequential orchestration.
+    return (
+        "You are assigning dispatch units for sequential orchestration.\n"
+        "\n"
+        "## Input\n"
+        "\n"
+        f"Read the tasks file: @{tasks_md_path}\n"
+        "\n"
+        "Dispatch units to assign:\n"
+        f"{units_list}\n"
+        f"{_ASSIGNMENT_PROMPT_RULES}"
+    )
 
-## Input
 
-Read the tasks file: @{tasks_md_path}
+# Fallback assignment, shared by every unit that gets it. Consumers only read
+# assignments (and state round-trips through JSON), so treat it as read-only;
+# a MappingProxyType would not survive json.dumps of the state.
+_DEFAULT_ASSIGNMENT: Dict[str, str] = {"type": "code", "owner_agent": "codex"}
 
-Dispatch units to assign:
-{units_list}
 
-## Rules
-- Analyze each task's description and details to determine:
-  - **type**: Infer from task semantics:
-    - code -> Backend logic, API, database, scripts, algorithms
-    - ui -> Frontend, React/Vue components, CSS, pages, forms, styling
-    - review -> Code review, audit, property testing
-  - **owner_agent**: Based on type:
-    - codex -> code tasks
-    - gemini -> ui tasks
-    - codex-review -> review tasks
+def _intern(value: Any) -> Any:
+    # type/owner_agent come from a small vocabulary and are repeated per unit;
+    # interning shares one object and keeps AGENT_TO_BACKEND lookups on the
+    # identity fast path
+    return sys.intern(value) if type(value) is str else value
 
-## Output
 
-Respond with JSON only:
-```json
-{{
-  "assignments": [
-    {{"task_id": "1", "type": "code", "owner_agent": "codex"}},
-    {{"task_id": "2", "type": "ui", "owner_agent": "gemini"}}
-  ]
-}}
-```
-"""
+def _apply_default_assignment(existing: Dict[str, Dict[str, str]], task_ids: List[str]) -> None:
+    existing.update(dict.fromkeys(task_ids, _DEFAULT_ASSIGNMENT))
 
 
 def ensure_assignments(
@@ -151,7 +235,7 @@ def ensure_assignments(
     assign_backend: str = "codex",
     assign_opencode_agent: str = "gawain",
     workdir: Optional[str] = None,
-) -> Dict[str, Dict[str, str]]:
+) -> Tuple[Dict[str, Dict[str, str]], Set[str]]:
     """
     Ensure all dispatch units have assignments. Calls LLM once for bulk assignment.
     
@@ -163,7 +247,8 @@ def ensure_assignments(
         workdir: Working directory
         
     Returns:
-        Dict mapping task_id -> {type, owner_agent}
+        (assignments, newly_assigned): the dict mapping task_id ->
+        {type, owner_agent}, and the set of task ids assigned by this call
     """
     # Check if assignments already exist in state
     existing = state.get("assignments", {})
@@ -171,24 +256,23 @@ def ensure_assignments(
         existing = {}
     missing = [tid for tid in dispatch_unit_ids if tid not in existing]
     if not missing:
-        return existing
+        return existing, set()
+    newly_assigned = set(missing)
     
     try:
         wrapper_bin = resolve_codeagent_wrapper()
     except FileNotFoundError:
         # Fallback: assign all as code/codex
-        for tid in missing:
-            existing[tid] = {"type": "code", "owner_agent": "codex"}
-        return existing
+        _apply_default_assignment(existing, missing)
+        return existing, newly_assigned
     
-    cwd = workdir or os.getcwd()
+    cwd = workdir or current_dir()
     tasks_ref = _safe_relpath(tasks_md_path, cwd)
     prompt = build_bulk_assignment_prompt(tasks_ref, missing)
-    env = os.environ.copy()
-    if sys.platform.startswith("win") and "CODEAGENT_NO_TMUX" not in env:
-        env["CODEAGENT_NO_TMUX"] = "1"
+    overrides = {}
     if assign_backend == "opencode":
-        env["CODEAGENT_OPENCODE_AGENT"] = assign_opencode_agent
+        overrides["CODEAGENT_OPENCODE_AGENT"] = assign_opencode_agent
+    env = _wrapper_env(overrides)
     
     try:
         result = subprocess.run(
@@ -201,14 +285,12 @@ def ensure_assignments(
             timeout=180,
         )
     except Exception:
-        for tid in missing:
-            existing[tid] = {"type": "code", "owner_agent": "codex"}
-        return existing
+        _apply_default_assignment(existing, missing)
+        return existing, newly_assigned
     
     if result.returncode != 0:
-        for tid in missing:
-            existing[tid] = {"type": "code", "owner_agent": "codex"}
-        return existing
+        _apply_default_assignment(existing, missing)
+        return existing, newly_assigned
     
     # Parse JSON from output
     try:
@@ -218,20 +300,57 @@ def ensure_assignments(
             if not task_id:
                 continue
             existing[task_id] = {
-                "type": entry.get("type", "code"),
-                "owner_agent": entry.get("owner_agent", "codex"),
+                "type": _intern(entry.get("type", "code")),
+                "owner_agent": _intern(entry.get("owner_agent", "codex")),
             }
     except Exception:
-        for tid in missing:
-            existing[tid] = {"type": "code", "owner_agent": "codex"}
-        return existing
+        _apply_default_assignment(existing, missing)
+        return existing, newly_assigned
     
-    # Fallback for any missing dispatch units
+    # Fallback for any units the LLM skipped
     for tid in missing:
-        if tid not in existing:
-            existing[tid] = {"type": "code", "owner_agent": "codex"}
+        existing.setdefault(tid, _DEFAULT_ASSIGNMENT)
     
-    return existing
+    return existing, newly_assigned
+
+
+def ensure_assignments_async(
+    tasks_md_path: str,
+    dispatch_unit_ids: List[str],
+    state: Dict[str, Any],
+    assign_backend: str = "codex",
+    assign_opencode_agent: str = "gawain",
+    workdir: Optional[str] = None,
+) -> "Future[Tuple[Dict[str, Dict[str, str]], Set[str]]]":
+    """
+    Run ensure_assignments on a background thread.
+
+    Lets the caller prepare the next dispatch while the assignment LLM call is
+    in flight. The caller must not touch state["assignments"] until the future
+    resolves. The thread is a daemon, so a caller that exits without waiting
+    for the result is not held up by the call.
+    """
+    future: "Future[Tuple[Dict[str, Dict[str, str]], Set[str]]]" = Future()
+
+    def run() -> None:
+        if not future.set_running_or_notify_cancel():
+            return
+        try:
+            future.set_result(
+                ensure_assignments(
+                    tasks_md_path,
+                    dispatch_unit_ids,
+                    state,
+                    assign_backend=assign_backend,
+                    assign_opencode_agent=assign_opencode_agent,
+                    workdir=workdir,
+                )
+            )
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, name="assign", daemon=True).start()
+    return future
 
 
 def get_backend_for_agent(owner_agent: str, default: str = "opencode") -> str:
@@ -245,7 +364,7 @@ def get_backend_for_agent(owner_agent: str, default: str = "opencode") -> str:
     Returns:
         Backend name
     """
-    return AGENT_TO_BACKEND.get(owner_agent, default)
+    return _backend_for(owner_agent, default)
 
 
 @dataclass
@@ -258,6 +377,46 @@ class DispatchResult:
     output: str = ""
 
 
+# Fixed prompt blocks around the per-task pieces of build_task_prompt
+_TASK_PROMPT_HEADER = (
+    "# Sequential Dispatch Unit\n"
+    "\n"
+    "You are executing ONE dispatch unit from a spec.\n"
+    "\n"
+    "## Your Task\n"
+    "\n"
+)
+
+_TASK_PROMPT_SIGNALS = "\n".join([
+    "3. Run quality checks (typecheck, lint, test)",
+    "4. Fix any issues",
+    "5. Commit if your workflow requires it",
+    "",
+    "## Completion Signal",
+    "",
+    "When you have **successfully completed** this task, include this exact string in your response:",
+    "",
+    "```",
+    "<promise>TASK_DONE</promise>",
+    "```",
+    "",
+    "If you **cannot proceed** (missing dependency, unclear requirement, blocked), include:",
+    "",
+    "```",
+    "<promise>HALT</promise>",
+    "```",
+    "",
+    "## Critical Rules",
+    "",
+])
+_TASK_PROMPT_RULES = "\n".join([
+    "- Do NOT start other tasks",
+    "- Do NOT commit broken code",
+    "",
+    "If you write production code, use test-driven-development (RED->GREEN->REFACTOR) and run tests.",
+])
+
+
 def build_task_prompt(
     task_id: str,
     description: str,
@@ -282,91 +441,128 @@ def build_task_prompt(
     Returns:
         Formatted prompt string
     """
-    lines = [
-        "# Sequential Dispatch Unit",
-        "",
-        "You are executing ONE dispatch unit from a spec.",
-        "",
-        "## Your Task",
-        "",
-        f"**Task ID:** {task_id}",
-        f"**Description:** {description}",
-        "",
+    parts = [
+        f"{_TASK_PROMPT_HEADER}"
+        f"**Task ID:** {task_id}\n"
+        f"**Description:** {description}\n"
     ]
     
     # Show subtasks if this is a parent task
     if subtasks:
-        lines.extend([
-            "**Subtasks to Complete:**",
-            "",
-        ])
-        for sub_id, sub_desc in subtasks:
-            lines.append(f"- {sub_id}: {sub_desc}")
+        parts.append("**Subtasks to Complete:**\n")
+        parts.extend(f"- {sub_id}: {sub_desc}" for sub_id, sub_desc in subtasks)
     
     if details:
-        lines.append("**Details:**")
-        for detail in details:
-            lines.append(f"- {detail}")
-        lines.append("")
+        parts.append("**Details:**")
+        parts.extend(f"- {detail}" for detail in details)
+        parts.append("")
     
-    lines.extend([
-        "## Inputs",
-        "",
-        f"- @{spec_path}/requirements.md",
-        f"- @{spec_path}/design.md",
-        f"- @{spec_path}/tasks.md",
-        f"- @{state_file}",
-        f"- @{progress_file}",
-        "",
-        "## Instructions",
-        "",
-        "1. Read the inputs to understand context",
-    ])
+    parts.append(
+        "## Inputs\n"
+        "\n"
+        f"- @{spec_path}/requirements.md\n"
+        f"- @{spec_path}/design.md\n"
+        f"- @{spec_path}/tasks.md\n"
+        f"- @{state_file}\n"
+        f"- @{progress_file}\n"
+        "\n"
+        "## Instructions\n"
+        "\n"
+        "1. Read the inputs to understand context"
+    )
     
     if subtasks:
-        lines.append("2. Implement **ALL subtasks** listed above (do not skip)")
+        parts.append("2. Implement **ALL subtasks** listed above (do not skip)")
     else:
-        lines.append("2. Implement this **single task** completely")
+        parts.append("2. Implement this **single task** completely")
     
-    lines.extend([
-        "3. Run quality checks (typecheck, lint, test)",
-        "4. Fix any issues",
-        "5. Commit if your workflow requires it",
-        "",
-        "## Completion Signal",
-        "",
-        "When you have **successfully completed** this task, include this exact string in your response:",
-        "",
-        "```",
-        "<promise>TASK_DONE</promise>",
-        "```",
-        "",
-        "If you **cannot proceed** (missing dependency, unclear requirement, blocked), include:",
-        "",
-        "```",
-        "<promise>HALT</promise>",
-        "```",
-        "",
-        "## Critical Rules",
-        "",
-    ])
+    parts.append(_TASK_PROMPT_SIGNALS)
     
     if subtasks:
-        lines.extend([
-            f"- Complete **ALL {len(subtasks)} subtasks** before signaling TASK_DONE",
-            "- Do NOT signal completion until ALL subtasks are done",
-        ])
+        parts.append(
+            f"- Complete **ALL {len(subtasks)} subtasks** before signaling TASK_DONE\n"
+            "- Do NOT signal completion until ALL subtasks are done"
+        )
     else:
-        lines.append("- Work on **this ONE task only**")
+        parts.append("- Work on **this ONE task only**")
     
-    lines.extend([
-        "- Do NOT start other tasks",
-        "- Do NOT commit broken code",
-        "",
-        "If you write production code, use test-driven-development (RED->GREEN->REFACTOR) and run tests.",
-    ])
+    parts.append(_TASK_PROMPT_RULES)
     
-    return "\n".join(lines)
+    return "\n".join(parts)
+
+
+# stderr is only used for diagnostics (tmux detection, failure messages), so
+# just its head and tail are kept in memory; tmux errors show up at the start
+_STDERR_KEEP_BYTES = 64 * 1024
+
+
+def _read_stderr_file(err_file: Any) -> str:
+    size = err_file.seek(0, os.SEEK_END)
+    err_file.seek(0)
+    if size <= 2 * _STDERR_KEEP_BYTES:
+        data = err_file.read()
+    else:
+        head = err_file.read(_STDERR_KEEP_BYTES)
+        err_file.seek(size - _STDERR_KEEP_BYTES)
+        tail = err_file.read()
+        omitted = size - 2 * _STDERR_KEEP_BYTES
+        data = head + f"\n... [{omitted} bytes of stderr omitted] ...\n".encode() + tail
+    text = data.decode(locale.getpreferredencoding(False), errors="replace")
+    # Match text-mode universal newline handling
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _run_wrapper(
+    cmd: List[str],
+    *,
+    input_text: str,
+    cwd: str,
+    env: Optional[Dict[str, str]],
+    timeout: int,
+) -> subprocess.CompletedProcess:
+    """
+    Run codeagent-wrapper like subprocess.run(capture_output=True, text=True).
+
+    stdout (the JSON report) is captured in full; stderr is spooled to a
+    temporary file and only its head and tail are returned, so chatty agent
+    logs do not have to fit in memory.
+    """
+    with tempfile.TemporaryFile() as err_file:
+        result = subprocess.run(
+            cmd,
+            input=input_text,
+            stdout=subprocess.PIPE,
+            stderr=err_file,
+            text=True,
+            cwd=cwd,
+            env=env,
+            timeout=timeout,
+        )
+        result.stderr = _read_stderr_file(err_file)
+    return result
+
+
+_PROMISE_OPEN = "<promise>"
+_PROMISE_SIGNALS = ("TASK_DONE", "COMPLETE", "HALT")
+
+
+def _promise_signals(text: str) -> set:
+    """
+    Return the <promise>SIGNAL</promise> markers present in text.
+
+    One pass over the "<promise>" occurrences (usually zero or one) instead of
+    a full substring scan of the agent message per marker.
+    """
+    found = set()
+    pos = text.find(_PROMISE_OPEN)
+    while pos >= 0:
+        start = pos + len(_PROMISE_OPEN)
+        for signal in _PROMISE_SIGNALS:
+            if text.startswith(signal + "</promise>", start):
+                found.add(signal)
+                break
+        pos = text.find(_PROMISE_OPEN, start)
+    return found
 
 
 def dispatch_task(
@@ -412,7 +608,7 @@ def dispatch_task(
             message=str(e),
         )
     
-    cwd = workdir or os.getcwd()
+    cwd = workdir or current_dir()
     rel_spec = _safe_relpath(spec_path, cwd)
     rel_state = _safe_relpath(state_file, cwd)
     rel_progress = _safe_relpath(progress_file, cwd)
@@ -439,7 +635,7 @@ def dispatch_task(
         "",
     ])
 
-    use_tmux = tmux_enabled() and not sys.platform.startswith("win") and shutil.which("tmux") is not None
+    use_tmux = tmux_enabled() and not _IS_WINDOWS and not _TMUX_FAILED and _tmux_available()
     session_name = (tmux_session or "sequential").strip() if use_tmux else ""
 
     base_cmd = [wrapper_bin, "--parallel", "--full-output"]
@@ -448,9 +644,7 @@ def dispatch_task(
     if session_name:
         cmd = base_cmd + ["--tmux-session", session_name, "--tmux-no-main-window"]
 
-    env = os.environ.copy()
-    if sys.platform.startswith("win") and "CODEAGENT_NO_TMUX" not in env:
-        env["CODEAGENT_NO_TMUX"] = "1"
+    env = _wrapper_env()
 
     effective_timeout = _resolve_timeout_seconds(timeout_seconds)
 
@@ -460,11 +654,9 @@ def dispatch_task(
         print(f"[dispatch] Tmux: session={session_name} window={wrapper_task_id}")
 
     try:
-        result = subprocess.run(
+        result = _run_wrapper(
             cmd,
-            input=heredoc_input,
-            capture_output=True,
-            text=True,
+            input_text=heredoc_input,
             cwd=cwd,
             env=env,
             timeout=effective_timeout,
@@ -472,11 +664,10 @@ def dispatch_task(
         if session_name and result.returncode != 0:
             combined = (result.stderr or "") + "\n" + (result.stdout or "")
             if looks_like_tmux_error(combined):
-                result = subprocess.run(
+                _mark_tmux_failed()
+                result = _run_wrapper(
                     cmd_no_tmux,
-                    input=heredoc_input,
-                    capture_output=True,
-                    text=True,
+                    input_text=heredoc_input,
                     cwd=cwd,
                     env=env,
                     timeout=effective_timeout,
@@ -520,16 +711,24 @@ def dispatch_task(
             output=stdout,
         )
 
-    tr = next((r for r in task_results if isinstance(r, dict) and r.get("task_id") == wrapper_task_id), None)
-    if tr is None:
+    # A single lookup per report, so an early-exit scan beats indexing by id
+    for tr in task_results:
+        if isinstance(tr, dict) and tr.get("task_id") == wrapper_task_id:
+            break
+    else:
         tr = task_results[0] if isinstance(task_results[0], dict) else {}
 
-    message_text = tr.get("message", "") if isinstance(tr, dict) else ""
-    err_text = tr.get("error", "") if isinstance(tr, dict) else ""
-    exit_code = tr.get("exit_code", result.returncode) if isinstance(tr, dict) else result.returncode
+    # tr is always a dict here
+    get = tr.get
+    message_text, err_text, exit_code = get("message", ""), get("error", ""), get("exit_code", result.returncode)
 
-    completed = "<promise>TASK_DONE</promise>" in message_text or "<promise>COMPLETE</promise>" in message_text
-    halted = "<promise>HALT</promise>" in message_text
+    if isinstance(message_text, str):
+        signals = _promise_signals(message_text)
+        completed = "TASK_DONE" in signals or "COMPLETE" in signals
+        halted = "HALT" in signals
+    else:
+        completed = "<promise>TASK_DONE</promise>" in message_text or "<promise>COMPLETE</promise>" in message_text
+        halted = "<promise>HALT</promise>" in message_text
 
     if halted:
         return DispatchResult(
@@ -6,7 +6,7 @@ Main orchestration runner for sequential (serial) task execution.
 Executes tasks one at a time with tmux visibility.
 
 Usage:
-    python sequential_loop.py --spec .kiro/specs/my-feature [--delay 5] [--max-iterations 50]
+    python sequential_loop.py --spec .kiro/specs/my-feature [--delay 5] [--delay-mode throttle] [--max-iterations 50]
 """
 
 from __future__ import annotations
@@ -14,25 +14,44 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import re
 import sys
 import time
+from concurrent.futures import Future
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, TextIO, Tuple
+
+# Optional fast JSON codec; falls back to stdlib json when not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Add script directory to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from spec_parser import parse_tasks_md, get_next_incomplete_task, all_tasks_complete, Task, get_subtask_list
-from dispatch_task import dispatch_task, DispatchResult, ensure_assignments, get_backend_for_agent
+from spec_parser import (
+    DISPATCH_BLOCKED,
+    DISPATCH_DONE,
+    DISPATCH_READY,
+    PreparedTasks,
+    Task,
+    get_next_dispatch_unit_prepared,
+    parse_tasks_md,
+)
+from dispatch_task import dispatch_task, DispatchResult, ensure_assignments, ensure_assignments_async, get_backend_for_agent
+
+
+# Anything outside [A-Za-z0-9_.-] (including non-ASCII) becomes "-"
+_TMUX_SESSION_BAD_CHAR_RE = re.compile(r"[^A-Za-z0-9_.\-]")
 
 
 def _sanitize_tmux_session(name: str) -> str:
     name = (name or "").strip()
     if not name:
         return "sequential"
-    allowed = set("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789-_.")
-    sanitized = "".join(ch if ch in allowed else "-" for ch in name)
+    sanitized = _TMUX_SESSION_BAD_CHAR_RE.sub("-", name)
     sanitized = sanitized.strip("-")
     return sanitized or "sequential"
 
@@ -44,15 +63,73 @@ def load_state(state_file: Path) -> Dict[str, Any]:
     return json.loads(state_file.read_text(encoding="utf-8"))
 
 
-def save_state(state_file: Path, state: Dict[str, Any]) -> None:
-    """Save state to JSON file atomically."""
+def _encode_state(state: Dict[str, Any], pretty: bool) -> bytes:
+    if orjson is not None:
+        option = orjson.OPT_APPEND_NEWLINE | (orjson.OPT_INDENT_2 if pretty else 0)
+        return orjson.dumps(state, option=option)
+    if pretty:
+        text = json.dumps(state, indent=2, ensure_ascii=False)
+    else:
+        text = json.dumps(state, separators=(",", ":"), ensure_ascii=False)
+    return (text + "\n").encode("utf-8")
+
+
+def save_state(state_file: Path, state: Dict[str, Any], pretty: bool = True) -> None:
+    """
+    Save state to JSON file atomically (fsync'd before the rename).
+
+    pretty=False writes compact JSON, for the routine saves between
+    iterations; the final save of a run is indented for human readers.
+    """
+    data = _encode_state(state, pretty)
     tmp_file = state_file.with_suffix(".tmp")
-    tmp_file.write_text(json.dumps(state, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
-    tmp_file.replace(state_file)
+    fd = os.open(tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+        # Without this the rename can reach disk before the data does, and a
+        # crash leaves an empty or truncated state file
+        os.fsync(fd)
+    finally:
+        os.close(fd)
+    os.replace(tmp_file, state_file)
 
 
-def append_progress(progress_file: Path, iteration: int, task: Task, result: DispatchResult) -> None:
-    """Append progress entry to progress file."""
+class _StateWriter:
+    """
+    Coalesces state saves within a loop iteration.
+
+    Mutations only mark the state dirty; flush_if_dirty() writes it once, as
+    compact JSON. The loop flushes before each dispatch (the agent reads the
+    state file) and calls finalize() before every return, which leaves the
+    file indented for whoever inspects it after the run.
+    """
+
+    def __init__(self, state_file: Path, state: Dict[str, Any]) -> None:
+        self.state_file = state_file
+        self.state = state
+        self._dirty = False
+        self._compact_on_disk = False
+
+    def mark_dirty(self) -> None:
+        self._dirty = True
+
+    def flush_if_dirty(self) -> None:
+        if self._dirty:
+            save_state(self.state_file, self.state, pretty=False)
+            self._dirty = False
+            self._compact_on_disk = True
+
+    def finalize(self) -> None:
+        if self._dirty or self._compact_on_disk:
+            save_state(self.state_file, self.state, pretty=True)
+            self._dirty = False
+            self._compact_on_disk = False
+
+
+def append_progress(progress_fh: TextIO, iteration: int, task: Task, result: DispatchResult) -> None:
+    """Append progress entry to the open progress file."""
     timestamp = datetime.now(timezone.utc).isoformat()
     
     status = "Completed" if result.completed else ("Halted" if result.halted else "Failed")
@@ -65,8 +142,9 @@ def append_progress(progress_file: Path, iteration: int, task: Task, result: Dis
 - **Message:** {result.message}
 """
     
-    with open(progress_file, "a", encoding="utf-8") as f:
-        f.write(entry)
+    progress_fh.write(entry)
+    # One write per entry; visible to `tail -f` and the next agent right away
+    progress_fh.flush()
 
 
 def initialize_progress(progress_file: Path, spec_path: str) -> None:
@@ -84,6 +162,31 @@ def initialize_progress(progress_file: Path, spec_path: str) -> None:
     progress_file.write_text(header, encoding="utf-8")
 
 
+# --delay-mode choices:
+#   between  - always sleep the full delay between iterations
+#   throttle - after a completed task, sleep only what is left of the delay
+#              since the iteration started (at most one task per delay);
+#              after a failure, back off for the full delay
+#   off      - never sleep
+DELAY_MODES = ("between", "throttle", "off")
+
+
+def _iteration_delay(delay: float, delay_mode: str, completed: bool, elapsed: float) -> float:
+    if delay <= 0 or delay_mode == "off":
+        return 0.0
+    if delay_mode == "throttle" and completed:
+        return max(0.0, delay - elapsed)
+    return delay
+
+
+def _drop_prefetch(future: Optional[Future[Any]]) -> None:
+    """Abandon an assignment prefetch whose result will not be used."""
+    # Cancels it if not yet started; a running call finishes on its daemon
+    # thread without holding up interpreter exit
+    if future is not None:
+        future.cancel()
+
+
 def run_sequential_loop(
     spec_path: str,
     max_iterations: int = 50,
@@ -93,6 +196,7 @@ def run_sequential_loop(
     assign_backend: Optional[str] = None,
     assign_opencode_agent: str = "gawain",
     tmux_session: Optional[str] = None,
+    delay_mode: str = "throttle",
 ) -> int:
     """
     Run the sequential orchestration loop.
@@ -101,6 +205,7 @@ def run_sequential_loop(
         spec_path: Path to spec directory containing requirements.md, design.md, tasks.md
         max_iterations: Maximum number of iterations
         delay: Seconds to wait between iterations
+        delay_mode: How delay applies (see DELAY_MODES)
         backend: Agent backend to use
         workdir: Working directory for task execution
         
@@ -126,6 +231,7 @@ def run_sequential_loop(
     except Exception as e:
         print(f"[sequential] ERROR: Failed to parse tasks.md: {e}")
         return 1
+    prepared = PreparedTasks.build(tasks)
     
     print()
     print("[sequential] Sequential Orchestration")
@@ -133,27 +239,28 @@ def run_sequential_loop(
     print(f"[sequential] state_file={state_file}")
     print(f"[sequential] progress_file={progress_file}")
     print(f"[sequential] tasks_total={len(tasks)}")
-    print(f"[sequential] max_iterations={max_iterations} delay={delay}s backend={backend}")
+    print(f"[sequential] max_iterations={max_iterations} delay={delay}s delay_mode={delay_mode} backend={backend}")
     print()
     
     # Load or initialize state
     state = load_state(state_file)
+    writer = _StateWriter(state_file, state)
     if not state.get("started_at"):
         state["started_at"] = datetime.now(timezone.utc).isoformat()
-        save_state(state_file, state)
+        writer.mark_dirty()
         initialize_progress(progress_file, str(spec_dir))
     
     raw_completed = state.get("completed", [])
     if not isinstance(raw_completed, list):
         raw_completed = []
-    completed_ids: List[str] = []
-    completed_set = set()
-    for raw_id in raw_completed:
-        tid = str(raw_id)
-        if tid in completed_set:
-            continue
-        completed_set.add(tid)
-        completed_ids.append(tid)
+    # Insertion-ordered set of completed ids; its keys view is what the
+    # scheduler checks, and it is listed only when the state is saved
+    completed: Dict[str, None] = dict.fromkeys(str(raw_id) for raw_id in raw_completed)
+    completed_set = completed.keys()
+    # Non-optional dispatch units still to run; makes the post-task "all
+    # done?" check O(1)
+    remaining_units = {task.task_id for task, _deps in prepared.dispatch_units}
+    remaining_units.difference_update(completed_set)
 
     assignments = state.get("assignments", {})
     if not isinstance(assignments, dict):
@@ -176,127 +283,175 @@ def run_sequential_loop(
     print(f"[sequential] tmux_session={session_name}")
     print()
     
-    # Main loop
-    for iteration in range(1, max_iterations + 1):
-        print()
-        print("===========================================================")
-        print(f"  Iteration {iteration} of {max_iterations}")
-        print("===========================================================")
-        
-        # Check if all done
-        if all_tasks_complete(tasks, completed_ids):
+    # Assignment fetched ahead for the unit expected to run next
+    prefetched_id: Optional[str] = None
+    prefetched: Optional[Future[Tuple[Dict[str, Dict[str, str]], Set[str]]]] = None
+    
+    # Held open for the whole run instead of reopened per iteration
+    with open(progress_file, "a", encoding="utf-8") as progress_fh:
+        # Main loop
+        for iteration in range(1, max_iterations + 1):
+            iteration_start = time.monotonic()
             print()
-            print("[sequential] All tasks completed!")
+            print("===========================================================")
+            print(f"  Iteration {iteration} of {max_iterations}")
+            print("===========================================================")
+        
+            # Find next task (or learn that all are done / blocked)
+            status, next_task = get_next_dispatch_unit_prepared(prepared, completed_set)
+            
+            if status == DISPATCH_DONE:
+                print()
+                print("[sequential] All tasks completed!")
             
-            # Update progress
-            timestamp = datetime.now(timezone.utc).isoformat()
-            with open(progress_file, "a", encoding="utf-8") as f:
-                f.write(f"\n---\n\n**Completed:** {timestamp}\n")
+                # Update progress
+                timestamp = datetime.now(timezone.utc).isoformat()
+                progress_fh.write(f"\n---\n\n**Completed:** {timestamp}\n")
             
-            state["completed_at"] = timestamp
-            save_state(state_file, state)
-            return 0
+                state["completed_at"] = timestamp
+                _drop_prefetch(prefetched)
+                writer.mark_dirty()
+                writer.finalize()
+                return 0
         
-        # Find next task
-        next_task = get_next_incomplete_task(tasks, completed_ids)
+            if status == DISPATCH_BLOCKED:
+                print("[sequential] No executable tasks found. All remaining tasks may be blocked.")
+                _drop_prefetch(prefetched)
+                writer.finalize()
+                return 2
         
-        if not next_task:
-            print("[sequential] No executable tasks found. All remaining tasks may be blocked.")
-            return 2
+            print(f"[sequential] Next task: {next_task.task_id} - {next_task.description}")
         
-        print(f"[sequential] Next task: {next_task.task_id} - {next_task.description}")
+            # Ensure assignment exists for this dispatch unit (Gawain-style)
+            if prefetched is not None and prefetched_id == next_task.task_id:
+                if next_task.task_id not in assignments:
+                    # Fetched while the previous unit was being dispatched
+                    prefetched_assignments, newly_assigned = prefetched.result()
+                    for tid in newly_assigned:
+                        assignments.setdefault(tid, prefetched_assignments[tid])
+                    writer.mark_dirty()
+                prefetched_id = prefetched = None
+            if next_task.task_id not in assignments:
+                assignments, newly_assigned = ensure_assignments(
+                    tasks_md_path=str(tasks_md),
+                    dispatch_unit_ids=[next_task.task_id],
+                    state=state,
+                    assign_backend=effective_assign_backend,
+                    assign_opencode_agent=assign_opencode_agent,
+                    workdir=effective_workdir,
+                )
+                state["assignments"] = assignments
+                if newly_assigned:
+                    writer.mark_dirty()
         
-        # Build subtask list if this is a parent task
-        task_map = {t.task_id: t for t in tasks}
-        subtask_objs = get_subtask_list(next_task, task_map)
-        subtasks = [(s.task_id, s.description) for s in subtask_objs] if subtask_objs else None
+            # Build subtask list if this is a parent task
+            subtasks = prepared.subtask_pairs(next_task) or None
+        
+            if subtasks:
+                print(f"[sequential] Parent task with {len(subtasks)} subtasks: {[s[0] for s in subtasks]}")
+
+            # Look up assignment from state
+            task_assignment = assignments.get(next_task.task_id, {"type": "code", "owner_agent": "codex"})
+            task_type = task_assignment.get("type", "code")
+            owner_agent = task_assignment.get("owner_agent", "codex")
+            effective_backend = get_backend_for_agent(owner_agent, default=backend)
+            print(f"[sequential] Assignment: type={task_type}, agent={owner_agent} -> backend={effective_backend}")
         
-        if subtasks:
-            print(f"[sequential] Parent task with {len(subtasks)} subtasks: {[s[0] for s in subtasks]}")
+            # The agent reads the state file, so it must be current before dispatch
+            writer.flush_if_dirty()
         
-        # Ensure assignment exists for this dispatch unit (Gawain-style)
-        if next_task.task_id not in assignments:
-            assignments = ensure_assignments(
-                tasks_md_path=str(tasks_md),
-                dispatch_unit_ids=[next_task.task_id],
-                state=state,
-                assign_backend=effective_assign_backend,
-                assign_opencode_agent=assign_opencode_agent,
-                workdir=effective_workdir,
+            # Ids this unit marks complete on success (itself and its subtasks)
+            done_ids = prepared.done_ids_by_task[next_task.task_id]
+            
+            if iteration < max_iterations:
+                # Speculate on the unit that follows a successful dispatch and
+                # fetch its assignment while the agent runs. The call works on a
+                # copy of the assignments so the live state is never touched
+                # off-thread. After a failed dispatch the same guess is kept
+                # for the retry rather than fetched again.
+                upcoming_status, upcoming = get_next_dispatch_unit_prepared(
+                    prepared, completed_set | set(done_ids), update_cursor=False
+                )
+                if (
+                    upcoming_status == DISPATCH_READY
+                    and upcoming.task_id not in assignments
+                    and upcoming.task_id != prefetched_id
+                ):
+                    _drop_prefetch(prefetched)
+                    prefetched_id = upcoming.task_id
+                    prefetched = ensure_assignments_async(
+                        tasks_md_path=str(tasks_md),
+                        dispatch_unit_ids=[upcoming.task_id],
+                        state={"assignments": dict(assignments)},
+                        assign_backend=effective_assign_backend,
+                        assign_opencode_agent=assign_opencode_agent,
+                        workdir=effective_workdir,
+                    )
+            
+            # Dispatch task
+            result = dispatch_task(
+                task_id=next_task.task_id,
+                description=next_task.description,
+                details=next_task.details,
+                spec_path=str(spec_dir),
+                state_file=str(state_file),
+                progress_file=str(progress_file),
+                backend=effective_backend,
+                workdir=effective_workdir,  # Go up to project root
+                subtasks=subtasks,
+                tmux_session=session_name,
             )
-            state["assignments"] = assignments
-            save_state(state_file, state)
-
-        # Look up assignment from state
-        task_assignment = assignments.get(next_task.task_id, {"type": "code", "owner_agent": "codex"})
-        task_type = task_assignment.get("type", "code")
-        owner_agent = task_assignment.get("owner_agent", "codex")
-        effective_backend = get_backend_for_agent(owner_agent, default=backend)
-        print(f"[sequential] Assignment: type={task_type}, agent={owner_agent} -> backend={effective_backend}")
         
-        # Dispatch task
-        result = dispatch_task(
-            task_id=next_task.task_id,
-            description=next_task.description,
-            details=next_task.details,
-            spec_path=str(spec_dir),
-            state_file=str(state_file),
-            progress_file=str(progress_file),
-            backend=effective_backend,
-            workdir=effective_workdir,  # Go up to project root
-            subtasks=subtasks,
-            tmux_session=session_name,
-        )
+            # Log progress
+            append_progress(progress_fh, iteration, next_task, result)
         
-        # Log progress
-        append_progress(progress_file, iteration, next_task, result)
+            # Handle result
+            if result.halted:
+                print()
+                print("[sequential] HALT - human input required")
+                state["halted"] = True
+                state["halted_at"] = datetime.now(timezone.utc).isoformat()
+                state["halted_task"] = next_task.task_id
+                _drop_prefetch(prefetched)
+                writer.mark_dirty()
+                writer.finalize()
+                return 2
         
-        # Handle result
-        if result.halted:
-            print()
-            print("[sequential] HALT - human input required")
-            state["halted"] = True
-            state["halted_at"] = datetime.now(timezone.utc).isoformat()
-            state["halted_task"] = next_task.task_id
-            save_state(state_file, state)
-            return 2
+            if result.completed:
+                completed.update(dict.fromkeys(done_ids))
+                remaining_units.difference_update(done_ids)
+                state["completed"] = list(completed)
+                writer.mark_dirty()
+                print(f"[sequential] Task {next_task.task_id} completed")
+            else:
+                print(f"[sequential] Task {next_task.task_id} failed: {result.message}")
+                # Continue to next iteration anyway - agent might have made progress
         
-        if result.completed:
-            prefix = f"{next_task.task_id}."
-            done_ids = [
-                t.task_id for t in tasks
-                if t.task_id == next_task.task_id or t.task_id.startswith(prefix)
-            ]
-            for tid in done_ids:
-                if tid in completed_set:
-                    continue
-                completed_set.add(tid)
-                completed_ids.append(tid)
-            state["completed"] = completed_ids
-            save_state(state_file, state)
-            print(f"[sequential] Task {next_task.task_id} completed")
-        else:
-            print(f"[sequential] Task {next_task.task_id} failed: {result.message}")
-            # Continue to next iteration anyway - agent might have made progress
+            # Check if all done after this task
+            if not remaining_units:
+                print()
+                print("[sequential] All tasks completed!")
+                timestamp = datetime.now(timezone.utc).isoformat()
+                state["completed_at"] = timestamp
+                _drop_prefetch(prefetched)
+                writer.mark_dirty()
+                writer.finalize()
+                return 0
         
-        # Check if all done after this task
-        if all_tasks_complete(tasks, completed_ids):
-            print()
-            print("[sequential] All tasks completed!")
-            timestamp = datetime.now(timezone.utc).isoformat()
-            state["completed_at"] = timestamp
-            save_state(state_file, state)
-            return 0
+            writer.flush_if_dirty()
         
-        # Delay before next iteration
-        if delay > 0:
-            print(f"[sequential] Sleeping {delay}s before next iteration...")
-            time.sleep(delay)
+            # Delay before next iteration
+            pause = _iteration_delay(delay, delay_mode, result.completed, time.monotonic() - iteration_start)
+            if pause > 0:
+                print(f"[sequential] Sleeping {pause:.1f}s before next iteration...")
+                time.sleep(pause)
     
-    print()
-    print(f"[sequential] Reached max iterations ({max_iterations}) without completing all tasks.")
-    print(f"   Check {state_file} for remaining tasks.")
-    return 1
+        _drop_prefetch(prefetched)
+        writer.finalize()
+        print()
+        print(f"[sequential] Reached max iterations ({max_iterations}) without completing all tasks.")
+        print(f"   Check {state_file} for remaining tasks.")
+        return 1
 
 
 def main(argv: Optional[List[str]] = None) -> int:
@@ -321,6 +476,14 @@ def main(argv: Optional[List[str]] = None) -> int:
         default=5.0,
         help="Seconds to wait between iterations (default: 5)",
     )
+    parser.add_argument(
+        "--delay-mode",
+        default="throttle",
+        choices=DELAY_MODES,
+        help="between: always sleep --delay; throttle: after a completed task sleep only "
+        "the rest of --delay since the iteration started, full delay after failures; "
+        "off: never sleep (default: throttle)",
+    )
     parser.add_argument(
         "--backend",
         default="opencode",
@@ -357,6 +520,7 @@ def main(argv: Optional[List[str]] = None) -> int:
         assign_backend=args.assign_backend,
         assign_opencode_agent=args.assign_opencode_agent,
         tmux_session=args.tmux_session,
+        delay_mode=args.delay_mode,
     )
 
 
@@ -8,12 +8,25 @@ Simplified version - no dispatch unit or dependency expansion logic.
 from __future__ import annotations
 
 import re
+import sys
 from dataclasses import dataclass, field
+from operator import attrgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import AbstractSet, Any, Dict, Iterable, List, Optional, Tuple
 
 
-@dataclass
+# Pattern for task lines: "1." or "1.1" or "- [ ]" etc.
+_TASK_RE = re.compile(r'^(\d+(?:\.\d+)*)\.\s+(.+)$')
+_CHECKBOX_RE = re.compile(r'^-\s+\[[ x]\]\s+(?:\*\*)?(\d+(?:\.\d+)*)[.:]?\*?\*?\s*(.+)$', re.IGNORECASE)
+_DEPENDS_RE = re.compile(r'depends?\s+on:?\s*(.+)', re.IGNORECASE)
+_TRAIL_STARS_RE = re.compile(r'\*\*$')
+_OPTIONAL_RE = re.compile(r'\[optional\]', re.IGNORECASE)
+
+# __slots__-backed dataclasses where supported (Python 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Task:
     """Represents a single task from tasks.md."""
     task_id: str
@@ -23,6 +36,12 @@ class Task:
     subtasks: List[str] = field(default_factory=list)
     dependencies: List[str] = field(default_factory=list)
     is_optional: bool = False
+    # Numeric ordering key for task_id, parsed once instead of per sort
+    sort_key: Tuple[Any, ...] = field(default=(), repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if not self.sort_key:
+            self.sort_key = _task_id_sort_key(self.task_id)
 
 
 def parse_tasks_md(tasks_md_path: str) -> List[Task]:
@@ -46,22 +65,25 @@ def parse_tasks_md(tasks_md_path: str) -> List[Task]:
     if not path.exists():
         raise FileNotFoundError(f"tasks.md not found: {tasks_md_path}")
     
-    content = path.read_text(encoding="utf-8")
-    return _parse_tasks_content(content)
+    # Stream lines instead of holding the whole text plus a list of its lines;
+    # text mode translates newlines exactly like read_text() does
+    with open(path, encoding="utf-8") as f:
+        return _parse_task_lines(f)
 
 
 def _parse_tasks_content(content: str) -> List[Task]:
     """Parse task content from markdown string."""
+    return _parse_task_lines(content.split("\n"))
+
+
+def _parse_task_lines(lines: Iterable[str]) -> List[Task]:
+    # Lines may keep their trailing newline (file iteration); only the
+    # stripped text and the leading indent are inspected
     tasks: List[Task] = []
     task_map: Dict[str, Task] = {}
     
-    lines = content.split("\n")
     current_task: Optional[Task] = None
     
-    # Pattern for task lines: "1." or "1.1" or "- [ ]" etc.
-    task_pattern = re.compile(r'^(\d+(?:\.\d+)*)\.\s+(.+)$')
-    checkbox_pattern = re.compile(r'^-\s+\[[ x]\]\s+(?:\*\*)?(\d+(?:\.\d+)*)[.:]?\*?\*?\s*(.+)$', re.IGNORECASE)
-    
     for line in lines:
         stripped = line.strip()
         
@@ -69,34 +91,37 @@ def _parse_tasks_content(content: str) -> List[Task]:
         if not stripped or stripped.startswith("#"):
             continue
         
-        # Try numbered format: "1. Task description"
-        match = task_pattern.match(stripped)
-        if match:
-            task_id = match.group(1)
-            description = match.group(2).strip()
-            current_task = _create_task(task_id, description, task_map)
-            tasks.append(current_task)
-            task_map[task_id] = current_task
-            continue
-        
-        # Try checkbox format: "- [ ] **1.** Description" or "- [x] 1. Description"
-        match = checkbox_pattern.match(stripped)
-        if match:
-            task_id = match.group(1)
-            description = match.group(2).strip()
-            # Remove trailing ** if present
-            description = re.sub(r'\*\*$', '', description).strip()
-            current_task = _create_task(task_id, description, task_map)
-            tasks.append(current_task)
-            task_map[task_id] = current_task
-            continue
+        # The first character decides which task pattern can match at all
+        first = stripped[0]
+        if first == "-":
+            # Try checkbox format: "- [ ] **1.** Description" or "- [x] 1. Description"
+            match = _CHECKBOX_RE.match(stripped)
+            if match:
+                task_id = match.group(1)
+                description = match.group(2).strip()
+                # Remove trailing ** if present
+                description = _TRAIL_STARS_RE.sub('', description).strip()
+                current_task = _create_task(task_id, description, task_map)
+                tasks.append(current_task)
+                task_map[task_id] = current_task
+                continue
+        elif first.isdigit():
+            # Try numbered format: "1. Task description"
+            match = _TASK_RE.match(stripped)
+            if match:
+                task_id = match.group(1)
+                description = match.group(2).strip()
+                current_task = _create_task(task_id, description, task_map)
+                tasks.append(current_task)
+                task_map[task_id] = current_task
+                continue
         
         # Detail line (indented or starting with -)
         if current_task and (line.startswith("  ") or line.startswith("\t") or stripped.startswith("-")):
             detail = stripped.lstrip("- ").strip()
             if detail and not detail.startswith("["):
                 # Check for dependencies
-                dep_match = re.match(r'depends?\s+on:?\s*(.+)', detail, re.IGNORECASE)
+                dep_match = _DEPENDS_RE.match(detail)
                 if dep_match:
                     deps = [d.strip() for d in dep_match.group(1).split(",")]
                     current_task.dependencies.extend(deps)
@@ -109,8 +134,9 @@ def _parse_tasks_content(content: str) -> List[Task]:
 def _create_task(task_id: str, description: str, task_map: Dict[str, Task]) -> Task:
     """Create a Task object and set up parent-child relationships."""
     # Check for optional marker
-    is_optional = "[optional]" in description.lower()
-    description = re.sub(r'\[optional\]', '', description, flags=re.IGNORECASE).strip()
+    description, optional_count = _OPTIONAL_RE.subn('', description)
+    is_optional = optional_count > 0
+    description = description.strip()
     
     # Determine parent_id for nested tasks (e.g., "1.2" -> parent "1")
     parent_id = None
@@ -126,6 +152,7 @@ def _create_task(task_id: str, description: str, task_map: Dict[str, Task]) -> T
         description=description,
         parent_id=parent_id,
         is_optional=is_optional,
+        sort_key=_task_id_sort_key(task_id),
     )
 
 
@@ -149,7 +176,11 @@ def is_dispatch_unit(task: Task) -> bool:
     return False
 
 
-def expand_dependencies(dependencies: List[str], task_map: Dict[str, Task]) -> List[str]:
+def expand_dependencies(
+    dependencies: List[str],
+    task_map: Dict[str, Task],
+    cache: Optional[Dict[str, Tuple[str, ...]]] = None,
+) -> List[str]:
     """
     Expand parent task dependencies to their subtasks.
 
@@ -159,25 +190,45 @@ def expand_dependencies(dependencies: List[str], task_map: Dict[str, Task]) -> L
     Args:
         dependencies: List of task IDs that are dependencies
         task_map: Dictionary mapping task_id to Task object
+        cache: Optional parent id -> leaf ids memo, shared across calls that
+            use the same task_map
 
     Returns:
         List of expanded dependency IDs (leaf tasks only)
     """
-    expanded = []
+    expanded: Dict[str, None] = {}
 
     for dep_id in dependencies:
         dep_task = task_map.get(dep_id)
 
         if dep_task and dep_task.subtasks:
             # Parent task: expand to all subtasks (recursively)
-            for subtask_id in dep_task.subtasks:
-                expanded.extend(expand_dependencies([subtask_id], task_map))
+            leaves = cache.get(dep_id) if cache is not None else None
+            if leaves is None:
+                leaves = _leaf_subtask_ids(dep_task, task_map)
+                if cache is not None:
+                    cache[dep_id] = leaves
+            expanded.update(dict.fromkeys(leaves))
         else:
             # Leaf task or unknown: keep as-is
-            expanded.append(dep_id)
+            expanded[dep_id] = None
+
+    # Dict keys: duplicates removed, order preserved
+    return list(expanded)
+
 
-    # Remove duplicates while preserving order
-    return list(dict.fromkeys(expanded))
+def _leaf_subtask_ids(task: Task, task_map: Dict[str, Task]) -> Tuple[str, ...]:
+    # Depth-first, in subtask order, with an explicit stack
+    leaves: List[str] = []
+    stack = list(reversed(task.subtasks))
+    while stack:
+        task_id = stack.pop()
+        sub = task_map.get(task_id)
+        if sub and sub.subtasks:
+            stack.extend(reversed(sub.subtasks))
+        else:
+            leaves.append(task_id)
+    return tuple(leaves)
 
 
 def get_next_dispatch_unit(
@@ -206,34 +257,8 @@ def get_next_dispatch_unit(
     Returns:
         Next dispatch unit to execute, or None if all complete
     """
-    completed_set = set(completed_ids)
-    task_map = {t.task_id: t for t in tasks}
-
-    # Sort tasks by task_id for consistent ordering
-    sorted_tasks = sorted(tasks, key=lambda t: _task_id_sort_key(t.task_id))
-
-    for task in sorted_tasks:
-        # Only consider dispatch units
-        if not is_dispatch_unit(task):
-            continue
-
-        # Skip completed
-        if task.task_id in completed_set:
-            continue
-
-        # Skip optional
-        if task.is_optional:
-            continue
-
-        # Check dependencies (expand parent deps to subtasks)
-        if task.dependencies:
-            expanded_deps = expand_dependencies(task.dependencies, task_map)
-            if not all(dep in completed_set for dep in expanded_deps):
-                continue
-
-        return task
-
-    return None
+    _status, task = get_next_dispatch_unit_prepared(PreparedTasks.build(tasks), set(completed_ids))
+    return task
 
 
 # Backward compatibility alias
@@ -245,15 +270,119 @@ def get_next_incomplete_task(
     return get_next_dispatch_unit(tasks, completed_ids)
 
 
-def _task_id_sort_key(task_id: str) -> List[Any]:
+def _task_id_sort_key(task_id: str) -> Tuple[Any, ...]:
     """Sort key for task IDs like '1.2.3' using numeric ordering."""
-    key: List[Any] = []
-    for part in task_id.split("."):
-        if part.isdigit():
-            key.append(int(part))
-        else:
-            key.append(part)
-    return key
+    return tuple(int(part) if part.isdigit() else part for part in task_id.split("."))
+
+
+@dataclass
+class PreparedTasks:
+    """
+    Per-run view of a parsed task list.
+
+    The task list never changes during a loop run, so the dispatch-unit
+    filter, the ordering, the dependency expansion and the subtask lists are
+    done once here instead of on every iteration.
+    """
+    task_map: Dict[str, Task]
+    # Non-optional dispatch units sorted by task_id, each with its
+    # dependencies expanded to leaf tasks (paired per task, not keyed by id,
+    # since tasks.md may repeat an id)
+    dispatch_units: List[Tuple[Task, Tuple[str, ...]]]
+    # Parent unit id -> (subtask_id, description) of its leaf subtasks
+    subtasks_by_parent: Dict[str, List[Tuple[str, str]]] = field(default_factory=dict)
+    # task_id -> ids marked complete with it: itself and every descendant
+    # ("1" -> "1", "1.1", "1.1.2", ...), in task order
+    done_ids_by_task: Dict[str, List[str]] = field(default_factory=dict)
+    # Every unit before this index is known complete, so scans start here.
+    # Valid because a run's completed ids only ever accumulate.
+    cursor: int = 0
+
+    def subtask_pairs(self, task: Task) -> List[Tuple[str, str]]:
+        """(subtask_id, description) of task's leaf subtasks; [] for leaves."""
+        if self.task_map.get(task.task_id) is task:
+            return self.subtasks_by_parent.get(task.task_id, [])
+        # A repeated id shadowed in task_map: not precomputed
+        return [(s.task_id, s.description) for s in get_subtask_list(task, self.task_map)]
+
+    @classmethod
+    def build(cls, tasks: List[Task]) -> "PreparedTasks":
+        task_map = {t.task_id: t for t in tasks}
+        units = sorted(
+            (t for t in tasks if is_dispatch_unit(t) and not t.is_optional),
+            key=attrgetter("sort_key"),
+        )
+        # Parents are often depended on by several units; expand each once
+        expand_cache: Dict[str, Tuple[str, ...]] = {}
+        dispatch_units = [
+            (t, tuple(expand_dependencies(t.dependencies, task_map, expand_cache)) if t.dependencies else ())
+            for t in units
+        ]
+        subtasks_by_parent = {
+            t.task_id: [(s.task_id, s.description) for s in get_subtask_list(t, task_map)]
+            for t, _deps in dispatch_units
+            if t.subtasks and task_map.get(t.task_id) is t
+        }
+        done_ids_by_task: Dict[str, List[str]] = {}
+        for t in tasks:
+            # The id itself, then each dotted prefix: "1.2.3" -> "1.2" -> "1"
+            ancestor = t.task_id
+            while True:
+                done_ids_by_task.setdefault(ancestor, []).append(t.task_id)
+                ancestor, sep, _ = ancestor.rpartition(".")
+                if not sep:
+                    break
+        return cls(
+            task_map=task_map,
+            dispatch_units=dispatch_units,
+            subtasks_by_parent=subtasks_by_parent,
+            done_ids_by_task=done_ids_by_task,
+        )
+
+
+# Scheduling outcomes of get_next_dispatch_unit_prepared
+DISPATCH_READY = "ready"
+DISPATCH_DONE = "done"
+DISPATCH_BLOCKED = "blocked"
+
+
+def get_next_dispatch_unit_prepared(
+    prepared: PreparedTasks,
+    completed_set: AbstractSet[str],
+    update_cursor: bool = True,
+) -> Tuple[str, Optional[Task]]:
+    """
+    Same as get_next_dispatch_unit, on a PreparedTasks and a set of completed ids.
+
+    One scan answers both "what next" and "is everything done", so callers
+    need no separate all_tasks_complete pass. The scan resumes after the
+    leading run of completed units seen last time (prepared.cursor), which
+    assumes completed_set only grows between calls; pass update_cursor=False
+    for what-if queries against a set that may not hold.
+
+    Returns:
+        (DISPATCH_READY, task) for the next dispatch unit to execute,
+        (DISPATCH_DONE, None) if every non-optional dispatch unit is complete,
+        (DISPATCH_BLOCKED, None) if units remain but none has its deps met
+    """
+    units = prepared.dispatch_units
+    start = prepared.cursor
+    end = len(units)
+    while start < end and units[start][0].task_id in completed_set:
+        start += 1
+    if update_cursor:
+        prepared.cursor = start
+    
+    status = DISPATCH_DONE
+    for i in range(start, end):
+        task, deps = units[i]
+        if task.task_id in completed_set:
+            continue
+        if deps and not all(dep in completed_set for dep in deps):
+            status = DISPATCH_BLOCKED
+            continue
+        return DISPATCH_READY, task
+    return status, None
 
 
 def all_tasks_complete(tasks: List[Task], completed_ids: List[str]) -> bool: